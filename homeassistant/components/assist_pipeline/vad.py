@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Final, cast
@@ -39,6 +39,10 @@ class VoiceActivityDetector(ABC):
     def is_speech(self, chunk: bytes) -> bool:
         """Return True if audio chunk contains speech."""
 
+    def is_speech_batch(self, chunks: Sequence[bytes]) -> list[bool]:
+        """Return for each audio chunk if it contains speech."""
+        return [self.is_speech(chunk) for chunk in chunks]
+
     @property
     @abstractmethod
     def samples_per_chunk(self) -> int | None:
@@ -64,6 +68,11 @@ class WebRtcVad(VoiceActivityDetector):
         result = self._audio_processor.Process10ms(chunk)
         return cast(bool, result.is_speech)
 
+    def is_speech_batch(self, chunks: Sequence[bytes]) -> list[bool]:
+        """Return for each 10 ms audio chunk if it contains speech."""
+        process_10ms = self._audio_processor.Process10ms
+        return [process_10ms(chunk).is_speech for chunk in chunks]
+
     @property
     def samples_per_chunk(self) -> int | None:
         """Return 10 ms."""
@@ -87,7 +96,7 @@ class AudioBuffer:
         """Clear the buffer."""
         self._length = 0
 
-    def append(self, data: bytes) -> None:
+    def append(self, data: bytes | memoryview) -> None:
         """Append bytes to the buffer, increasing the internal length."""
         data_len = len(data)
         if (self._length + data_len) > len(self._buffer):
@@ -98,7 +107,7 @@ class AudioBuffer:
 
     def bytes(self) -> bytes:
         """Convert written portion of buffer to bytes."""
-        return bytes(self._buffer[: self._length])
+        return bytes(memoryview(self._buffer)[: self._length])
 
     def __len__(self) -> int:
         """Get the number of bytes currently in the buffer."""
@@ -212,8 +221,8 @@ class VoiceCommandSegmenter:
         # With chunking
         seconds_per_chunk = vad.samples_per_chunk / _SAMPLE_RATE
         bytes_per_chunk = vad.samples_per_chunk * _SAMPLE_WIDTH
-        for vad_chunk in chunk_samples(chunk, bytes_per_chunk, leftover_chunk_buffer):
-            is_speech = vad.is_speech(vad_chunk)
+        vad_chunks = chunk_samples(chunk, bytes_per_chunk, leftover_chunk_buffer)
+        for is_speech in vad.is_speech_batch(vad_chunks):
             if not self.process(seconds_per_chunk, is_speech):
                 return False
 
@@ -276,31 +285,37 @@ def chunk_samples(
     samples: bytes,
     bytes_per_chunk: int,
     leftover_chunk_buffer: AudioBuffer,
-) -> Iterable[bytes]:
-    """Yield fixed-sized chunks from samples, keeping leftover bytes from previous call(s)."""
+) -> list[bytes]:
+    """Return fixed-sized chunks from samples, keeping leftover bytes from previous call(s)."""
 
-    if (len(leftover_chunk_buffer) + len(samples)) < bytes_per_chunk:
+    leftover_length = len(leftover_chunk_buffer)
+    samples_length = len(samples)
+    if (leftover_length + samples_length) < bytes_per_chunk:
         # Extend leftover chunk, but not enough samples to complete it
         leftover_chunk_buffer.append(samples)
-        return
+        return []
 
+    chunks: list[bytes] = []
     next_chunk_idx = 0
 
-    if leftover_chunk_buffer:
+    if leftover_length:
         # Add to leftover chunk from previous call(s).
-        bytes_to_copy = bytes_per_chunk - len(leftover_chunk_buffer)
-        leftover_chunk_buffer.append(samples[:bytes_to_copy])
-        next_chunk_idx = bytes_to_copy
+        next_chunk_idx = bytes_per_chunk - leftover_length
+        leftover_chunk_buffer.append(memoryview(samples)[:next_chunk_idx])
 
         # Process full chunk in buffer
-        yield leftover_chunk_buffer.bytes()
+        chunks.append(leftover_chunk_buffer.bytes())
         leftover_chunk_buffer.clear()
 
-    while next_chunk_idx < len(samples) - bytes_per_chunk + 1:
-        # Process full chunk
-        yield samples[next_chunk_idx : next_chunk_idx + bytes_per_chunk]
-        next_chunk_idx += bytes_per_chunk
+    # Full chunks
+    end_idx = samples_length - (samples_length - next_chunk_idx) % bytes_per_chunk
+    chunks += [
+        samples[chunk_idx : chunk_idx + bytes_per_chunk]
+        for chunk_idx in range(next_chunk_idx, end_idx, bytes_per_chunk)
+    ]
 
     # Capture leftover chunks
-    if rest_samples := samples[next_chunk_idx:]:
-        leftover_chunk_buffer.append(rest_samples)
+    if end_idx < samples_length:
+        leftover_chunk_buffer.append(memoryview(samples)[end_idx:])
+
+    return chunks
@@ -7,11 +7,12 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
     ActionTrace,
-    async_store_trace,
+    async_finish_trace,
+    async_start_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_recording
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
@@ -58,10 +59,11 @@ def trace_automation(
 ) -> Generator[AutomationTrace, None, None]:
     """Trace action execution of automation with automation_id."""
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    recording = async_start_trace(hass, trace, trace_config)
 
     try:
-        yield trace
+        with trace_recording(recording):
+            yield trace
     except Exception as ex:
         if automation_id:
             trace.set_error(ex)
@@ -69,3 +71,4 @@ def trace_automation(
     finally:
         if automation_id:
             trace.finished()
+            async_finish_trace(hass, trace, trace_config)
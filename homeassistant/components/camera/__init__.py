@@ -13,7 +13,6 @@ from functools import partial
 import logging
 import os
 from random import SystemRandom
-import time
 from typing import TYPE_CHECKING, Any, Final, cast, final
 
 from aiohttp import hdrs, web
@@ -21,7 +20,7 @@ import attr
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.http import KEY_AUTHENTICATED, HomeAssistantView
+from homeassistant.components.http import KEY_AUTHENTICATED, KEY_HASS, HomeAssistantView
 from homeassistant.components.media_player import (
     ATTR_MEDIA_CONTENT_ID,
     ATTR_MEDIA_CONTENT_TYPE,
@@ -84,6 +83,8 @@ from .const import (  # noqa: F401
 )
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
+from .snapshot_cache import SnapshotCache
+from .still_stream import FRAME_BOUNDARY, async_get_still_stream_broadcaster
 
 if TYPE_CHECKING:
     from functools import cached_property
@@ -174,7 +175,7 @@ async def _async_get_image(
     width: int | None = None,
     height: int | None = None,
 ) -> Image:
-    """Fetch a snapshot image from a camera.
+    """Fetch a snapshot image from a camera or its snapshot cache.
 
     If width and height are passed, an attempt to scale
     the image will be made on a best effort basis.
@@ -182,6 +183,22 @@ async def _async_get_image(
     that we can scale, however the majority of cases
     are handled.
     """
+    return await camera.snapshot_cache.async_get_image(
+        camera.hass,
+        width,
+        height,
+        camera.snapshot_cache_ttl,
+        partial(_async_fetch_image, camera, timeout, width, height),
+    )
+
+
+async def _async_fetch_image(
+    camera: Camera,
+    timeout: int,
+    width: int | None,
+    height: int | None,
+) -> Image:
+    """Fetch a snapshot image from a camera."""
     with suppress(asyncio.CancelledError, TimeoutError):
         async with asyncio.timeout(timeout):
             image_bytes = (
@@ -271,52 +288,18 @@ async def async_get_still_stream(
 ) -> web.StreamResponse:
     """Generate an HTTP MJPEG stream from camera images.
 
-    This method must be run in the event loop.
+    The viewers of the same camera images and interval share the fetched
+    frames. This method must be run in the event loop.
     """
     response = web.StreamResponse()
-    response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
+    response.content_type = CONTENT_TYPE_MULTIPART.format(f"--{FRAME_BOUNDARY}")
     await response.prepare(request)
-
-    async def write_to_mjpeg_stream(img_bytes: bytes) -> None:
-        """Write image to stream."""
-        await response.write(
-            bytes(
-                "--frameboundary\r\n"
-                f"Content-Type: {content_type}\r\n"
-                f"Content-Length: {len(img_bytes)}\r\n\r\n",
-                "utf-8",
-            )
-            + img_bytes
-            + b"\r\n"
-        )
-
-    last_image = None
-
-    while True:
-        last_fetch = time.monotonic()
-        img_bytes = await image_cb()
-        if not img_bytes:
-            break
-
-        if img_bytes != last_image:
-            await write_to_mjpeg_stream(img_bytes)
-
-            # Chrome always shows the n-1 frame:
-            # https://issues.chromium.org/issues/41199053
-            # https://issues.chromium.org/issues/40791855
-            # We send the first frame twice to ensure it shows
-            # Subsequent frames are not a concern at reasonable frame rates
-            # (even 1/10 FPS is about the latency of HLS)
-            if last_image is None:
-                await write_to_mjpeg_stream(img_bytes)
-            last_image = img_bytes
-
-        next_fetch = last_fetch + interval
-        now = time.monotonic()
-        if next_fetch > now:
-            sleep_time = next_fetch - now
-            await asyncio.sleep(sleep_time)
-
+    # The broadcaster is looked up after preparing the response, the last
+    # viewer may have left and stopped it in the meantime
+    broadcaster = async_get_still_stream_broadcaster(
+        request.app[KEY_HASS], image_cb, content_type, interval
+    )
+    await broadcaster.async_write_frames(response)
     return response
 
 
@@ -481,6 +464,7 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "is_streaming",
     "model",
     "motion_detection_enabled",
+    "snapshot_cache_ttl",
     "supported_features",
 }
 
@@ -501,6 +485,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     _attr_is_streaming: bool = False
     _attr_model: str | None = None
     _attr_motion_detection_enabled: bool = False
+    _attr_snapshot_cache_ttl: float = 0
     _attr_should_poll: bool = False  # No need to poll cameras
     _attr_state: None = None  # State is determined by is_on
     _attr_supported_features: CameraEntityFeature = CameraEntityFeature(0)
@@ -515,6 +500,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self.snapshot_cache = SnapshotCache()
 
     @property
     def entity_picture(self) -> str:
@@ -576,6 +562,14 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         """Return the interval between frames of the mjpeg stream."""
         return self._attr_frame_interval
 
+    @cached_property
+    def snapshot_cache_ttl(self) -> float:
+        """Return for how many seconds a snapshot is reused.
+
+        Concurrent requests for a snapshot share one fetch regardless.
+        """
+        return self._attr_snapshot_cache_ttl
+
     @property
     def frontend_stream_type(self) -> StreamType | None:
         """Return the type of stream supported by this camera.
@@ -0,0 +1,136 @@
+"""Cache the snapshots of a camera.
+
+Dashboards refresh the images of cameras every few seconds for each
+client. Concurrent requests of the same size share one fetch, and
+cameras with a snapshot cache TTL reuse their images for that long.
+Resized images are computed once from the cached full size image.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+
+from .img_util import scale_jpeg_camera_image
+
+if TYPE_CHECKING:
+    from . import Image
+
+_LOGGER = logging.getLogger(__name__)
+
+SnapshotKey = tuple[int | None, int | None]
+
+
+class SnapshotCache:
+    """Cache the snapshots of a camera by width and height."""
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.resized = 0
+        self._images: dict[SnapshotKey, tuple[float, Image]] = {}
+        self._pending: dict[SnapshotKey, asyncio.Task[Image]] = {}
+
+    async def async_get_image(
+        self,
+        hass: HomeAssistant,
+        width: int | None,
+        height: int | None,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Image]],
+    ) -> Image:
+        """Return a cached image or fetch it.
+
+        Requests for a size which is being fetched wait for that fetch.
+        The fetch is not cancelled when a waiting request is.
+        """
+        key = (width, height)
+        now = time.monotonic()
+        if ttl > 0:
+            self._remove_expired(now - ttl)
+            if (cached := self._images.get(key)) is not None:
+                self.hits += 1
+                return cached[1]
+            if (
+                width is not None
+                and height is not None
+                and (full_size := self._images.get((None, None))) is not None
+                and _is_jpeg(full_size[1])
+            ):
+                self.resized += 1
+                image = _scaled_image(full_size[1], width, height)
+                # Expires with the image it was computed from
+                self._images[key] = (full_size[0], image)
+                return image
+
+        if (pending := self._pending.get(key)) is None:
+            self.misses += 1
+            pending = self._pending[key] = hass.async_create_task(
+                self._async_fetch(key, ttl, fetch),
+                f"camera snapshot {width}x{height}",
+            )
+            pending.add_done_callback(_log_fetch_error)
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(pending)
+
+    async def _async_fetch(
+        self, key: SnapshotKey, ttl: float, fetch: Callable[[], Awaitable[Image]]
+    ) -> Image:
+        """Fetch an image and keep it for ttl."""
+        fetched = time.monotonic()
+        try:
+            image = await fetch()
+        finally:
+            self._pending.pop(key, None)
+        if ttl > 0:
+            self._images[key] = (fetched, image)
+        return image
+
+    def _remove_expired(self, fetched_before: float) -> None:
+        """Remove the images fetched before a time."""
+        for key in [
+            key
+            for key, (fetched, _) in self._images.items()
+            if fetched <= fetched_before
+        ]:
+            del self._images[key]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics of the cache."""
+        requests = self.hits + self.resized + self.coalesced + self.misses
+        return {
+            "hits": self.hits,
+            "resized": self.resized,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "hit_rate": (
+                round((requests - self.misses) / requests, 3) if requests else None
+            ),
+        }
+
+
+def _log_fetch_error(task: asyncio.Task[Image]) -> None:
+    """Retrieve the error of a fetch, its requests may all be cancelled."""
+    if not task.cancelled() and (err := task.exception()) is not None:
+        _LOGGER.debug("Error fetching camera snapshot: %s", err)
+
+
+def _is_jpeg(image: Image) -> bool:
+    """Return if an image can be scaled."""
+    return "jpeg" in image.content_type or "jpg" in image.content_type
+
+
+def _scaled_image(image: Image, width: int, height: int) -> Image:
+    """Return an image scaled to width and height."""
+    # pylint: disable-next=import-outside-toplevel
+    from . import Image
+
+    return Image(image.content_type, scale_jpeg_camera_image(image, width, height))
@@ -0,0 +1,197 @@
+"""Share the frames of MJPEG streams composed from camera images.
+
+Each viewer of a stream composed from still images used to fetch its own
+images, so every viewer of a camera added to the load of the device. The
+viewers of the same images and interval now share one broadcaster which
+fetches each frame once and writes the same bytes to all of them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import time
+
+from aiohttp import web
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_STILL_STREAMS
+
+FRAME_BOUNDARY = "frameboundary"
+
+ImageCallbackType = Callable[[], Awaitable[bytes | None]]
+
+_StillStreamKey = tuple[ImageCallbackType, str, float]
+
+
+class _Viewer:
+    """The frame waiting to be written to a viewer."""
+
+    __slots__ = ("frame", "event")
+
+    def __init__(self, frame: bytes | None) -> None:
+        """Initialize the viewer."""
+        self.frame = frame
+        self.event = asyncio.Event()
+        if frame is not None:
+            self.event.set()
+
+
+class StillStreamBroadcaster:
+    """Fetch the frames of a stream once for all its viewers.
+
+    A viewer which is still writing a frame when the next one is fetched
+    skips the frame it did not start writing, so slow viewers receive
+    fewer frames instead of buffering them.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        image_cb: ImageCallbackType,
+        content_type: str,
+        interval: float,
+        on_done: Callable[[StillStreamBroadcaster], None],
+    ) -> None:
+        """Initialize the broadcaster."""
+        self.hass = hass
+        self.done = False
+        self.frames_dropped = 0
+        self._image_cb = image_cb
+        self._interval = interval
+        self._on_done = on_done
+        self._header = (
+            f"--{FRAME_BOUNDARY}\r\nContent-Type: {content_type}\r\nContent-Length: "
+        ).encode()
+        self._viewers: set[_Viewer] = set()
+        self._last_frame: bytes | None = None
+        self._error: Exception | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def viewers(self) -> int:
+        """Return the number of viewers."""
+        return len(self._viewers)
+
+    async def async_write_frames(self, response: web.StreamResponse) -> None:
+        """Write the frames to a prepared response until the stream ends.
+
+        A viewer must join right after the broadcaster was returned by
+        async_get_still_stream_broadcaster, before the stream can stop.
+        """
+        # A new viewer starts with the last frame instead of waiting
+        viewer = _Viewer(self._last_frame)
+        self._viewers.add(viewer)
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_fetch_frames(), "camera still stream"
+            )
+        first_frame = True
+        try:
+            while True:
+                await viewer.event.wait()
+                viewer.event.clear()
+                if (frame := viewer.frame) is None:
+                    break
+                viewer.frame = None
+                await response.write(frame)
+
+                # Chrome always shows the n-1 frame:
+                # https://issues.chromium.org/issues/41199053
+                # https://issues.chromium.org/issues/40791855
+                # We send the first frame twice to ensure it shows
+                # Subsequent frames are not a concern at reasonable frame rates
+                # (even 1/10 FPS is about the latency of HLS)
+                if first_frame:
+                    await response.write(frame)
+                    first_frame = False
+
+                if self.done and viewer.frame is None:
+                    break
+        finally:
+            self._viewers.discard(viewer)
+            if not self._viewers:
+                self._async_stop()
+
+        if self._error is not None:
+            raise self._error
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop fetching frames once the last viewer left."""
+        self.done = True
+        self._on_done(self)
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _async_fetch_frames(self) -> None:
+        """Fetch frames and hand them to the viewers until the stream ends."""
+        last_image = None
+        try:
+            while True:
+                last_fetch = time.monotonic()
+                img_bytes = await self._image_cb()
+                if not img_bytes:
+                    break
+
+                if img_bytes != last_image:
+                    last_image = img_bytes
+                    self._last_frame = frame = b"".join(
+                        (
+                            self._header,
+                            str(len(img_bytes)).encode(),
+                            b"\r\n\r\n",
+                            img_bytes,
+                            b"\r\n",
+                        )
+                    )
+                    for viewer in self._viewers:
+                        if viewer.frame is not None:
+                            self.frames_dropped += 1
+                        viewer.frame = frame
+                        viewer.event.set()
+
+                next_fetch = last_fetch + self._interval
+                now = time.monotonic()
+                if next_fetch > now:
+                    await asyncio.sleep(next_fetch - now)
+        except Exception as err:  # pylint: disable=broad-except
+            self._error = err
+        finally:
+            self.done = True
+            self._on_done(self)
+            # Viewers write the frame they are waiting for and stop
+            for viewer in self._viewers:
+                viewer.event.set()
+
+
+@callback
+def async_get_still_stream_broadcaster(
+    hass: HomeAssistant,
+    image_cb: ImageCallbackType,
+    content_type: str,
+    interval: float,
+) -> StillStreamBroadcaster:
+    """Return the broadcaster of a stream, shared by its viewers.
+
+    Viewers share a stream if they use the same image callback, which is
+    the case for bound methods of the same camera.
+    """
+    broadcasters: dict[_StillStreamKey, StillStreamBroadcaster] = hass.data.setdefault(
+        DATA_STILL_STREAMS, {}
+    )
+    key = (image_cb, content_type, interval)
+    if (broadcaster := broadcasters.get(key)) is not None and not broadcaster.done:
+        return broadcaster
+
+    @callback
+    def remove_broadcaster(broadcaster: StillStreamBroadcaster) -> None:
+        """Forget the broadcaster once its stream ended."""
+        if broadcasters.get(key) is broadcaster:
+            del broadcasters[key]
+
+    broadcaster = broadcasters[key] = StillStreamBroadcaster(
+        hass, image_cb, content_type, interval, remove_broadcaster
+    )
+    return broadcaster
@@ -13,7 +13,13 @@ import re
 from typing import IO, Any
 
 from hassil.expression import Expression, ListReference, Sequence
-from hassil.intents import Intents, SlotList, TextSlotList, WildcardSlotList
+from hassil.intents import (
+    Intents,
+    SlotList,
+    TextSlotList,
+    TextSlotValue,
+    WildcardSlotList,
+)
 from hassil.recognize import (
     MISSING_ENTITY,
     RecognizeResult,
@@ -47,6 +53,7 @@ from homeassistant.util.json import JsonObjectType, json_loads_object
 
 from .agent import AbstractConversationAgent, ConversationInput, ConversationResult
 from .const import DEFAULT_EXPOSED_ATTRIBUTES, DOMAIN
+from .sentence_index import SentenceIndex
 
 _LOGGER = logging.getLogger(__name__)
 _DEFAULT_ERROR_TEXT = "Sorry, I couldn't understand that"
@@ -72,6 +79,7 @@ class LanguageIntents:
     intent_responses: dict[str, Any]
     error_responses: dict[str, Any]
     language_variant: str | None
+    sentence_index: SentenceIndex
 
 
 @dataclass(slots=True)
@@ -140,10 +148,16 @@ class DefaultAgent(AbstractConversationAgent):
         # intent -> [sentences]
         self._config_intents: dict[str, Any] = {}
         self._slot_lists: dict[str, SlotList] | None = None
+        self._area_slot_list: TextSlotList | None = None
+
+        # entity_id -> name values of the exposed entities, updated for the
+        # entities which changed instead of being rebuilt from all states
+        self._entity_name_values: dict[str, list[TextSlotValue]] | None = None
+        self._changed_entity_ids: set[str] = set()
 
         # Sentences that will trigger a callback (skipping intent recognition)
         self._trigger_sentences: list[TriggerData] = []
-        self._trigger_intents: Intents | None = None
+        self._trigger_index: SentenceIndex | None = None
 
     @property
     def supported_languages(self) -> list[str]:
@@ -377,11 +391,14 @@ class DefaultAgent(AbstractConversationAgent):
         language: str,
     ) -> RecognizeResult | None:
         """Search intents for a match to user input."""
+        # Only try the sentences which may match
+        intents = lang_intents.sentence_index.intents_for_text(user_input.text)
+
         # Prioritize matches with entity names above area names
         maybe_result: RecognizeResult | None = None
         for result in recognize_all(
             user_input.text,
-            lang_intents.intents,
+            intents,
             slot_lists=slot_lists,
             intent_context=intent_context,
             language=language,
@@ -400,7 +417,7 @@ class DefaultAgent(AbstractConversationAgent):
         best_num_unmatched_entities = 0
         for result in recognize_all(
             user_input.text,
-            lang_intents.intents,
+            intents,
             slot_lists=slot_lists,
             intent_context=intent_context,
             allow_unmatched_entities=True,
@@ -671,6 +688,7 @@ class DefaultAgent(AbstractConversationAgent):
         # But it will likely only be called once anyways, unless new
         # components with sentences are often being loaded.
         intents = Intents.from_dict(intents_dict)
+        sentence_index = SentenceIndex(intents)
 
         # Load responses
         responses_dict = intents_dict.get("responses", {})
@@ -684,10 +702,12 @@ class DefaultAgent(AbstractConversationAgent):
                 intent_responses,
                 error_responses,
                 language_variant,
+                sentence_index,
             )
             self._lang_intents[language] = lang_intents
         else:
             lang_intents.intents = intents
+            lang_intents.sentence_index = sentence_index
             lang_intents.intent_responses = intent_responses
             lang_intents.error_responses = error_responses
 
@@ -698,31 +718,52 @@ class DefaultAgent(AbstractConversationAgent):
         self, event: core.Event[ar.EventAreaRegistryUpdatedData]
     ) -> None:
         """Clear area area cache when the area registry has changed."""
+        self._area_slot_list = None
         self._slot_lists = None
 
     @core.callback
     def _async_handle_entity_registry_changed(
         self, event: core.Event[er.EventEntityRegistryUpdatedData]
     ) -> None:
-        """Clear names list cache when an entity registry entry has changed."""
+        """Update the names of an entity when its registry entry has changed."""
         if event.data["action"] != "update" or not any(
             field in event.data["changes"] for field in _ENTITY_REGISTRY_UPDATE_FIELDS
         ):
             return
-        self._slot_lists = None
+        self._async_entity_names_changed(event.data["entity_id"])
 
     @core.callback
     def _async_handle_state_changed(
         self, event: core.Event[EventStateChangedData]
     ) -> None:
-        """Clear names list cache when a state is added or removed from the state machine."""
-        if event.data["old_state"] and event.data["new_state"]:
+        """Update the names of an entity when its state is added, removed or renamed."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        if (
+            old_state
+            and new_state
+            and (
+                self._entity_name_values is None
+                or new_state.entity_id not in self._entity_name_values
+                or not _names_changed(old_state, new_state)
+            )
+        ):
+            return
+        self._async_entity_names_changed(event.data["entity_id"])
+
+    @core.callback
+    def _async_entity_names_changed(self, entity_id: str) -> None:
+        """Mark the names of an entity to be updated with the next slot lists."""
+        if self._entity_name_values is None:
+            # All names are gathered again
             return
+        self._changed_entity_ids.add(entity_id)
         self._slot_lists = None
 
     @core.callback
     def _async_exposed_entities_updated(self) -> None:
         """Handle updated preferences."""
+        self._entity_name_values = None
         self._slot_lists = None
 
     def _make_slot_lists(self) -> dict[str, SlotList]:
@@ -731,66 +772,43 @@ class DefaultAgent(AbstractConversationAgent):
             return self._slot_lists
 
         entity_registry = er.async_get(self.hass)
-        states = [
-            state
-            for state in self.hass.states.async_all()
-            if async_should_expose(self.hass, DOMAIN, state.entity_id)
-        ]
-
-        # Gather exposed entity names.
-        #
+        if self._entity_name_values is None:
+            self._changed_entity_ids.clear()
+            self._entity_name_values = {
+                state.entity_id: _entity_name_values(state, entity_registry)
+                for state in self.hass.states.async_all()
+                if async_should_expose(self.hass, DOMAIN, state.entity_id)
+            }
+            _LOGGER.debug("Exposed entities: %s", list(self._entity_name_values))
+        elif self._changed_entity_ids:
+            for entity_id in self._changed_entity_ids:
+                state = self.hass.states.get(entity_id)
+                if state is None or not async_should_expose(
+                    self.hass, DOMAIN, entity_id
+                ):
+                    self._entity_name_values.pop(entity_id, None)
+                    continue
+                self._entity_name_values[entity_id] = _entity_name_values(
+                    state, entity_registry
+                )
+            self._changed_entity_ids.clear()
+
+        if self._area_slot_list is None:
+            self._area_slot_list = _make_area_slot_list(self.hass)
+
         # NOTE: We do not pass entity ids in here because multiple entities may
         # have the same name. The intent matcher doesn't gather all matching
         # values for a list, just the first. So we will need to match by name no
         # matter what.
-        entity_names = []
-        for state in states:
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
-
-            entity = entity_registry.async_get(state.entity_id)
-
-            if not entity:
-                # Default name
-                entity_names.append((state.name, state.name, context))
-                continue
-
-            if entity.aliases:
-                for alias in entity.aliases:
-                    if not alias.strip():
-                        continue
-
-                    entity_names.append((alias, alias, context))
-
-            # Default name
-            entity_names.append((state.name, state.name, context))
-
-        # Expose all areas.
-        #
-        # We pass in area id here with the expectation that no two areas will
-        # share the same name or alias.
-        areas = ar.async_get(self.hass)
-        area_names = []
-        for area in areas.async_list_areas():
-            area_names.append((area.name, area.id))
-            if area.aliases:
-                for alias in area.aliases:
-                    if not alias.strip():
-                        continue
-
-                    area_names.append((alias, area.id))
-
-        _LOGGER.debug("Exposed entities: %s", entity_names)
-
         self._slot_lists = {
-            "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": TextSlotList.from_tuples(entity_names, allow_template=False),
+            "area": self._area_slot_list,
+            "name": TextSlotList(
+                values=[
+                    value
+                    for values in self._entity_name_values.values()
+                    for value in values
+                ]
+            ),
         }
 
         return self._slot_lists
@@ -842,7 +860,7 @@ class DefaultAgent(AbstractConversationAgent):
         self._trigger_sentences.append(trigger_data)
 
         # Force rebuild on next use
-        self._trigger_intents = None
+        self._trigger_index = None
 
         unregister = functools.partial(self._unregister_trigger, trigger_data)
         return unregister
@@ -860,17 +878,19 @@ class DefaultAgent(AbstractConversationAgent):
             },
         }
 
-        self._trigger_intents = Intents.from_dict(intents_dict)
+        trigger_intents = Intents.from_dict(intents_dict)
 
         # Assume slot list references are wildcards
         wildcard_names: set[str] = set()
-        for trigger_intent in self._trigger_intents.intents.values():
+        for trigger_intent in trigger_intents.intents.values():
             for intent_data in trigger_intent.data:
                 for sentence in intent_data.sentences:
                     _collect_list_references(sentence, wildcard_names)
 
         for wildcard_name in wildcard_names:
-            self._trigger_intents.slot_lists[wildcard_name] = WildcardSlotList()
+            trigger_intents.slot_lists[wildcard_name] = WildcardSlotList()
+
+        self._trigger_index = SentenceIndex(trigger_intents)
 
         _LOGGER.debug("Rebuilt trigger intents: %s", intents_dict)
 
@@ -879,7 +899,7 @@ class DefaultAgent(AbstractConversationAgent):
         self._trigger_sentences.remove(trigger_data)
 
         # Force rebuild on next use
-        self._trigger_intents = None
+        self._trigger_index = None
 
     async def _match_triggers(self, sentence: str) -> SentenceTriggerResult | None:
         """Try to match sentence against registered trigger sentences.
@@ -891,15 +911,17 @@ class DefaultAgent(AbstractConversationAgent):
             # No triggers registered
             return None
 
-        if self._trigger_intents is None:
+        if self._trigger_index is None:
             # Need to rebuild intents before matching
             self._rebuild_trigger_intents()
 
-        assert self._trigger_intents is not None
+        assert self._trigger_index is not None
 
         matched_triggers: dict[int, RecognizeResult] = {}
         matched_template: str | None = None
-        for result in recognize_all(sentence, self._trigger_intents):
+        for result in recognize_all(
+            sentence, self._trigger_index.intents_for_text(sentence)
+        ):
             if result.intent_sentence is not None:
                 matched_template = result.intent_sentence.text
 
@@ -924,6 +946,61 @@ class DefaultAgent(AbstractConversationAgent):
         return SentenceTriggerResult(sentence, matched_template, matched_triggers)
 
 
+def _names_changed(old_state: core.State, new_state: core.State) -> bool:
+    """Return if the name or the exposed attributes of a state changed."""
+    if old_state.attributes is new_state.attributes:
+        return False
+    return old_state.name != new_state.name or any(
+        old_state.attributes.get(attr) != new_state.attributes.get(attr)
+        for attr in DEFAULT_EXPOSED_ATTRIBUTES
+    )
+
+
+def _entity_name_values(
+    state: core.State, entity_registry: er.EntityRegistry
+) -> list[TextSlotValue]:
+    """Return the name slot values of an exposed entity."""
+    # Checked against "requires_context" and "excludes_context" in hassil
+    context = {"domain": state.domain}
+    if state.attributes:
+        # Include some attributes
+        for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+            if attr not in state.attributes:
+                continue
+            context[attr] = state.attributes[attr]
+
+    names: list[str] = []
+    if (entity := entity_registry.async_get(state.entity_id)) and entity.aliases:
+        names.extend(alias for alias in entity.aliases if alias.strip())
+
+    # Default name
+    names.append(state.name)
+
+    return [
+        TextSlotValue.from_tuple((name, name, context), allow_template=False)
+        for name in names
+    ]
+
+
+def _make_area_slot_list(hass: core.HomeAssistant) -> TextSlotList:
+    """Return the slot list of all areas.
+
+    We pass in area id here with the expectation that no two areas will
+    share the same name or alias.
+    """
+    area_names = []
+    for area in ar.async_get(hass).async_list_areas():
+        area_names.append((area.name, area.id))
+        if area.aliases:
+            for alias in area.aliases:
+                if not alias.strip():
+                    continue
+
+                area_names.append((alias, area.id))
+
+    return TextSlotList.from_tuples(area_names, allow_template=False)
+
+
 def _make_error_result(
     language: str,
     error_code: intent.IntentResponseErrorCode,
@@ -0,0 +1,152 @@
+"""Pre-filter of sentence templates by the literal words they require.
+
+A sentence template only matches a text which contains every word of the
+text chunks that are not optional or part of an alternative. The index
+maps one of these words of each template to the intent data holding it,
+so hassil only tries the templates which may match a text. Templates
+without such words are always tried.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+import dataclasses
+import re
+
+from hassil.expression import (
+    Expression,
+    RuleReference,
+    Sentence,
+    Sequence,
+    SequenceType,
+    TextChunk,
+)
+from hassil.intents import Intent, IntentData, Intents
+from hassil.recognize import BREAK_WORDS_TABLE, PUNCTUATION
+from hassil.util import normalize_text, normalize_whitespace
+
+
+def _required_words(
+    expression: Expression,
+    expansion_rules: dict[str, Sentence],
+    rule_names: frozenset[str],
+) -> frozenset[str]:
+    """Return the words which text must contain to match expression."""
+    if isinstance(expression, TextChunk):
+        return frozenset(normalize_text(expression.text).split())
+
+    if isinstance(expression, Sequence):
+        items = [
+            _required_words(item, expansion_rules, rule_names)
+            for item in expression.items
+        ]
+        if not items:
+            return frozenset()
+        if expression.type == SequenceType.GROUP:
+            return frozenset().union(*items)
+        # Any of the items of an alternative may match
+        return frozenset.intersection(*items)
+
+    if isinstance(expression, RuleReference):
+        rule_name = expression.rule_name
+        if rule_name in rule_names or (rule := expansion_rules.get(rule_name)) is None:
+            return frozenset()
+        return _required_words(rule, expansion_rules, rule_names | {rule_name})
+
+    # Lists match any of their values
+    return frozenset()
+
+
+@dataclasses.dataclass(slots=True)
+class _IndexedData:
+    """Intent data with the words required by each of its sentences."""
+
+    intent: Intent
+    data: IntentData
+    required_words: list[frozenset[str]]
+
+
+class SentenceIndex:
+    """Index the intent data of intents by the words their sentences require."""
+
+    def __init__(self, intents: Intents) -> None:
+        """Index intents, which parses all their sentences."""
+        self.intents = intents
+        self._skip_words = [
+            re.compile(rf"\b{re.escape(normalize_text(skip_word))}\b")
+            for skip_word in sorted(intents.skip_words, key=len, reverse=True)
+        ]
+        self._indexed_data: list[_IndexedData] = []
+        self._always: list[int] = []
+        self._by_word: defaultdict[str, set[int]] = defaultdict(set)
+
+        if intents.settings.ignore_whitespace:
+            # Words are not separated, all sentences are tried
+            return
+
+        for intent in intents.intents.values():
+            for data in intent.data:
+                expansion_rules = {**intents.expansion_rules, **data.expansion_rules}
+                required_words = [
+                    _required_words(sentence, expansion_rules, frozenset())
+                    for sentence in data.sentences
+                ]
+                position = len(self._indexed_data)
+                self._indexed_data.append(_IndexedData(intent, data, required_words))
+                if not all(required_words):
+                    self._always.append(position)
+                    continue
+                for words in required_words:
+                    # The longest word is the least likely in other sentences
+                    self._by_word[max(words, key=len)].add(position)
+
+    def intents_for_text(self, text: str) -> Intents:
+        """Return the intents with the intent data which may match text.
+
+        The order of the intents and intent data is kept, so hassil returns
+        the same results in the same order as with all intents.
+        """
+        if not self._by_word:
+            return self.intents
+
+        text = self._match_text(text)
+        positions = set(self._always)
+        for word, word_positions in self._by_word.items():
+            if word in text:
+                positions.update(word_positions)
+
+        intents: dict[str, Intent] = {}
+        for position in sorted(positions):
+            indexed_data = self._indexed_data[position]
+            if not any(
+                all(word in text for word in words)
+                for words in indexed_data.required_words
+            ):
+                continue
+            intent_name = indexed_data.intent.name
+            if (intent := intents.get(intent_name)) is None:
+                intent = intents[intent_name] = Intent(intent_name)
+            intent.data.append(indexed_data.data)
+
+        return dataclasses.replace(self.intents, intents=intents)
+
+    def _match_text(self, text: str) -> str:
+        """Return the variants of text hassil matches literal text against.
+
+        hassil also matches text chunks after removing punctuation and
+        breaking words apart. The variants are joined by a newline, which
+        is not part of any word.
+        """
+        text = normalize_text(text).strip()
+        if self._skip_words:
+            for skip_word in self._skip_words:
+                text = skip_word.sub("", text)
+            text = normalize_whitespace(text).strip()
+        without_punctuation = PUNCTUATION.sub("", text)
+        return "\n".join(
+            (
+                text,
+                without_punctuation,
+                without_punctuation.translate(BREAK_WORDS_TABLE),
+            )
+        )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from decimal import Decimal, DecimalException
 import logging
 from typing import TYPE_CHECKING
@@ -32,6 +32,7 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util.ring_buffer import NumericRingBuffer
 
 from .const import (
     CONF_ROUND_DIGITS,
@@ -180,8 +181,12 @@ class DerivativeSensor(RestoreSensor, SensorEntity):
         self._sensor_source_id = source_entity
         self._round_digits = round_digits
         self._state: float | int | Decimal = 0
-        # List of tuples with (timestamp_start, timestamp_end, derivative)
-        self._state_list: list[tuple[datetime, datetime, Decimal]] = []
+        # The derivatives in the time window, each one applies from the
+        # timestamp of its start until the start of the next one
+        self._derivatives = NumericRingBuffer()
+        # The end of the last derivative, a gap until the start of
+        # the next one counts as a derivative of zero
+        self._last_end: float | None = None
 
         self._attr_name = name if name is not None else f"{source_entity} derivative"
         self._attr_extra_state_attributes = {ATTR_SOURCE_ID: source_entity}
@@ -228,14 +233,6 @@ class DerivativeSensor(RestoreSensor, SensorEntity):
                     "" if unit is None else unit
                 )
 
-            # filter out all derivatives older than `time_window` from our window list
-            self._state_list = [
-                (time_start, time_end, state)
-                for time_start, time_end, state in self._state_list
-                if (new_state.last_updated - time_end).total_seconds()
-                < self._time_window
-            ]
-
             try:
                 elapsed_time = (
                     new_state.last_updated - old_state.last_updated
@@ -250,37 +247,35 @@ class DerivativeSensor(RestoreSensor, SensorEntity):
 
             except ValueError as err:
                 _LOGGER.warning("While calculating derivative: %s", err)
+                return
             except DecimalException as err:
                 _LOGGER.warning(
                     "Invalid state (%s > %s): %s", old_state.state, new_state.state, err
                 )
+                return
             except AssertionError as err:
                 _LOGGER.error("Could not calculate derivative: %s", err)
+                return
 
-            # add latest derivative to the window list
-            self._state_list.append(
-                (old_state.last_updated, new_state.last_updated, new_derivative)
-            )
-
-            def calculate_weight(
-                start: datetime, end: datetime, now: datetime
-            ) -> float:
-                window_start = now - timedelta(seconds=self._time_window)
-                if start < window_start:
-                    weight = (end - window_start).total_seconds() / self._time_window
-                else:
-                    weight = (end - start).total_seconds() / self._time_window
-                return weight
+            # add latest derivative to the window and drop the ones
+            # which ended before the window
+            start = old_state.last_updated_timestamp
+            end = new_state.last_updated_timestamp
+            window_start = end - self._time_window
+            if self._last_end is not None and self._last_end != start:
+                self._derivatives.append(self._last_end, 0.0)
+            self._derivatives.append(start, float(new_derivative))
+            self._last_end = end
+            self._derivatives.remove_before(window_start)
 
             # If outside of time window just report derivative (is the same as modeling it in the window),
             # otherwise take the weighted average with the previous derivatives
             if elapsed_time > self._time_window:
-                derivative = new_derivative
+                derivative: float | Decimal = new_derivative
             else:
-                derivative = Decimal(0)
-                for start, end, value in self._state_list:
-                    weight = calculate_weight(start, end, new_state.last_updated)
-                    derivative = derivative + (value * Decimal(weight))
+                derivative = self._derivatives.time_weighted_mean(
+                    window_start, end, initial=0.0
+                )
 
             self._state = derivative
             self.async_write_ha_state()
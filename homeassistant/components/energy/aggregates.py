@@ -0,0 +1,293 @@
+"""Hourly statistics of the energy dashboard kept in memory.
+
+Long term statistics of an hour do not change once the hour is compiled,
+unless they are imported or modified later, which the recorder signals.
+The hours which are compiled are kept in memory the first time they are
+queried. Later queries only ask the recorder for the hours which were
+compiled since, so opening a long period in the energy dashboard again
+does not query the whole period. The statistics which were used least
+recently are dropped once more than MAX_CACHED_HOURS hours are kept.
+"""
+
+from __future__ import annotations
+
+from array import array
+import asyncio
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+import math
+from typing import Literal
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.const import SIGNAL_STATISTICS_MODIFIED
+from homeassistant.components.recorder.statistics import (
+    StatisticsRow,
+    get_last_statistics_run_end,
+    statistics_during_period,
+)
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util import dt as dt_util
+
+HOUR = 3600
+
+# 8 bytes per hour, 8 MB in total
+MAX_CACHED_HOURS = 1_000_000
+
+UNITS: dict[str, str] = {"energy": UnitOfEnergy.KILO_WATT_HOUR}
+
+StatisticType = Literal["change", "mean"]
+
+
+@singleton("energy_statistics_cache")
+@callback
+def async_get_statistics_cache(hass: HomeAssistant) -> EnergyStatisticsCache:
+    """Return the hourly statistics cache."""
+    cache = EnergyStatisticsCache(hass)
+    cache.async_setup()
+    return cache
+
+
+def _ceil_hour(timestamp: float) -> float:
+    """Return the start of the first hour starting at or after timestamp."""
+    return math.ceil(timestamp / HOUR) * HOUR
+
+
+class _HourlySeries:
+    """Values of a statistic for a contiguous range of hours.
+
+    Hours without a value are stored as NaN.
+    """
+
+    __slots__ = ("start", "values")
+
+    def __init__(self, start: float, values: array[float]) -> None:
+        """Initialize the series."""
+        self.start = start
+        self.values = values
+
+    @property
+    def end(self) -> float:
+        """Return the end of the last hour."""
+        return self.start + len(self.values) * HOUR
+
+    def items(self, start: float, end: float) -> Iterator[tuple[float, float]]:
+        """Return the start and value of the hours between start and end."""
+        values = self.values
+        for index in range(
+            max(0, int((start - self.start) // HOUR)),
+            min(len(values), int((end - self.start) // HOUR)),
+        ):
+            if not math.isnan(value := values[index]):
+                yield self.start + index * HOUR, value
+
+
+def _hourly_values(
+    rows: Iterable[StatisticsRow],
+    statistic_type: StatisticType,
+    start: float,
+    end: float,
+) -> array[float]:
+    """Return the values of rows for the hours between start and end."""
+    values = array("d", [math.nan]) * int((end - start) // HOUR)
+    for row in rows:
+        hour = row["start"]
+        if start <= hour < end and (value := row.get(statistic_type)) is not None:
+            values[int((hour - start) // HOUR)] = value
+    return values
+
+
+class EnergyStatisticsCache:
+    """Cache the hourly statistics of compiled hours."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.queries = 0
+        self._series: dict[tuple[str, StatisticType], _HourlySeries] = {}
+        self._generation = 0
+        # Concurrent dashboard loads ask for the same statistics,
+        # the ones waiting are answered from the cache
+        self._lock = asyncio.Lock()
+
+    @callback
+    def async_setup(self) -> None:
+        """Forget statistics when they are modified."""
+        async_dispatcher_connect(
+            self.hass, SIGNAL_STATISTICS_MODIFIED, self._async_statistics_modified
+        )
+
+    @callback
+    def _async_statistics_modified(self, statistic_ids: set[str]) -> None:
+        """Forget the cached hours of modified statistics."""
+        self._generation += 1
+        for key in [key for key in self._series if key[0] in statistic_ids]:
+            del self._series[key]
+
+    async def async_hourly_statistics(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        statistic_ids: set[str],
+        types: set[StatisticType],
+    ) -> dict[str, list[StatisticsRow]]:
+        """Return the hourly statistics like statistics_during_period.
+
+        Energy statistics are converted to kWh.
+        """
+        start = _ceil_hour(start_time.timestamp())
+        end = _ceil_hour(end_time.timestamp())
+        keys = [
+            (statistic_id, type_) for statistic_id in statistic_ids for type_ in types
+        ]
+        async with self._lock:
+            while True:
+                if not (ranges := self._missing_ranges(keys, start, end)):
+                    self._async_used(keys)
+                    return self._rows(keys, start, end, {})
+                generation = self._generation
+                compiled_until, fetched = await get_instance(
+                    self.hass
+                ).async_add_executor_job(self._fetch, ranges, statistic_ids, types)
+                if generation == self._generation:
+                    break
+        for key in keys:
+            rows = fetched.get(key[0], [])
+            for fetch_start, fetch_end in ranges:
+                self._merge(key, rows, fetch_start, min(fetch_end, compiled_until))
+        self._async_used(keys)
+        result = self._rows(keys, start, end, fetched)
+        self._evict()
+        return result
+
+    def _missing_ranges(
+        self, keys: list[tuple[str, StatisticType]], start: float, end: float
+    ) -> list[tuple[float, float]]:
+        """Return the ranges of hours to fetch to answer a request.
+
+        Only the hours before and after the cached hours are fetched.
+        """
+        head_end, tail_start = start, end
+        for key in keys:
+            if (series := self._series.get(key)) is None:
+                return [(start, end)]
+            # The fetched hours must be next to the cached ones
+            if start < series.start:
+                head_end = max(head_end, series.start)
+            if series.end < end:
+                tail_start = min(tail_start, series.end)
+        if head_end >= tail_start:
+            return [(start, end)]
+        return [
+            (fetch_start, fetch_end)
+            for fetch_start, fetch_end in ((start, head_end), (tail_start, end))
+            if fetch_start < fetch_end
+        ]
+
+    @callback
+    def _async_used(self, keys: list[tuple[str, StatisticType]]) -> None:
+        """Mark statistics as used most recently."""
+        series = self._series
+        for key in keys:
+            if key in series:
+                series[key] = series.pop(key)
+
+    def _evict(self) -> None:
+        """Drop the least recently used statistics while too many hours are kept."""
+        series = self._series
+        cached_hours = sum(len(hours.values) for hours in series.values())
+        while cached_hours > MAX_CACHED_HOURS:
+            cached_hours -= len(series.pop(next(iter(series))).values)
+
+    def _fetch(
+        self,
+        ranges: list[tuple[float, float]],
+        statistic_ids: set[str],
+        types: set[StatisticType],
+    ) -> tuple[float, dict[str, list[StatisticsRow]]]:
+        """Fetch hourly statistics and the end of the compiled hours."""
+        self.queries += 1
+        # Read before the statistics so hours compiled in between
+        # are not treated as complete
+        last_run_end = get_last_statistics_run_end(self.hass)
+        compiled_until = (
+            last_run_end.timestamp() // HOUR * HOUR if last_run_end else ranges[0][0]
+        )
+        fetched: dict[str, list[StatisticsRow]] = {}
+        for start, end in ranges:
+            for statistic_id, rows in statistics_during_period(
+                self.hass,
+                dt_util.utc_from_timestamp(start),
+                dt_util.utc_from_timestamp(end),
+                statistic_ids,
+                "hour",
+                UNITS,
+                set(types),
+            ).items():
+                fetched.setdefault(statistic_id, []).extend(rows)
+        return compiled_until, fetched
+
+    def _merge(
+        self,
+        key: tuple[str, StatisticType],
+        rows: list[StatisticsRow],
+        fetch_start: float,
+        cache_until: float,
+    ) -> None:
+        """Keep the fetched values of compiled hours next to the cached ones."""
+        _, statistic_type = key
+        if (series := self._series.get(key)) is None:
+            if fetch_start < cache_until:
+                self._series[key] = _HourlySeries(
+                    fetch_start,
+                    _hourly_values(rows, statistic_type, fetch_start, cache_until),
+                )
+            return
+        if fetch_start < series.start:
+            series.values = (
+                _hourly_values(rows, statistic_type, fetch_start, series.start)
+                + series.values
+            )
+            series.start = fetch_start
+        if fetch_start <= series.end < cache_until:
+            series.values += _hourly_values(
+                rows, statistic_type, series.end, cache_until
+            )
+
+    def _rows(
+        self,
+        keys: list[tuple[str, StatisticType]],
+        start: float,
+        end: float,
+        fetched: dict[str, list[StatisticsRow]],
+    ) -> dict[str, list[StatisticsRow]]:
+        """Return the rows from the cache and the fetched hours after it."""
+        result: dict[str, dict[float, StatisticsRow]] = {}
+        for statistic_id, statistic_type in keys:
+            rows = result.setdefault(statistic_id, {})
+            series = self._series.get((statistic_id, statistic_type))
+            cached_until = start
+            if series is not None and series.start <= start:
+                cached_until = min(series.end, end)
+                for hour, value in series.items(start, cached_until):
+                    if (row := rows.get(hour)) is None:
+                        row = rows[hour] = {"start": hour, "end": hour + HOUR}
+                    row[statistic_type] = value
+            if cached_until >= end:
+                continue
+            for fetched_row in fetched.get(statistic_id, []):
+                hour = fetched_row["start"]
+                if (
+                    cached_until <= hour < end
+                    and (fetched_value := fetched_row.get(statistic_type)) is not None
+                ):
+                    if (row := rows.get(hour)) is None:
+                        row = rows[hour] = {"start": hour, "end": hour + HOUR}
+                    row[statistic_type] = fetched_value
+        return {
+            statistic_id: [rows[hour] for hour in sorted(rows)]
+            for statistic_id, rows in result.items()
+            if rows
+        }
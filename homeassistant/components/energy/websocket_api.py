@@ -15,7 +15,6 @@ import voluptuous as vol
 
 from homeassistant.components import recorder, websocket_api
 from homeassistant.components.recorder.statistics import StatisticsRow
-from homeassistant.const import UnitOfEnergy
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
@@ -23,11 +22,13 @@ from homeassistant.helpers.integration_platform import (
 from homeassistant.helpers.singleton import singleton
 from homeassistant.util import dt as dt_util
 
+from .aggregates import async_get_statistics_cache
 from .const import DOMAIN
 from .data import (
     DEVICE_CONSUMPTION_SCHEMA,
     ENERGY_SOURCE_SCHEMA,
     EnergyManager,
+    EnergyPreferences,
     EnergyPreferencesUpdate,
     async_get_manager,
 )
@@ -53,6 +54,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_validate)
     websocket_api.async_register_command(hass, ws_solar_forecast)
     websocket_api.async_register_command(hass, ws_get_fossil_energy_consumption)
+    websocket_api.async_register_command(hass, ws_get_statistics_during_period)
 
 
 @singleton("energy_platforms")
@@ -270,15 +272,8 @@ async def ws_get_fossil_energy_consumption(
     statistic_ids.add(msg["co2_statistic_id"])
 
     # Fetch energy + CO2 statistics
-    statistics = await recorder.get_instance(hass).async_add_executor_job(
-        recorder.statistics.statistics_during_period,
-        hass,
-        start_time,
-        end_time,
-        statistic_ids,
-        "hour",
-        {"energy": UnitOfEnergy.KILO_WATT_HOUR},
-        {"mean", "change"},
+    statistics = await async_get_statistics_cache(hass).async_hourly_statistics(
+        start_time, end_time, statistic_ids, {"mean", "change"}
     )
 
     def _combine_change_statistics(
@@ -377,3 +372,108 @@ async def ws_get_fossil_energy_consumption(
 
     result = {period["start"]: period["delta"] for period in reduced_fossil_energy}
     connection.send_result(msg["id"], result)
+
+
+def _energy_statistic_ids(hass: HomeAssistant, prefs: EnergyPreferences) -> set[str]:
+    """Return the statistic ids shown by the energy dashboard."""
+    cost_sensors: dict[str, str] = hass.data[DOMAIN]["cost_sensors"]
+    statistic_ids: set[str] = set()
+
+    def add(statistic_id: str, cost_statistic_id: str | None = None) -> None:
+        """Add an energy statistic and its cost statistic."""
+        statistic_ids.add(statistic_id)
+        if cost_statistic_id is None:
+            cost_statistic_id = cost_sensors.get(statistic_id)
+        if cost_statistic_id is not None:
+            statistic_ids.add(cost_statistic_id)
+
+    for source in prefs["energy_sources"]:
+        if source["type"] == "grid":
+            for flow_from in source["flow_from"]:
+                add(flow_from["stat_energy_from"], flow_from["stat_cost"])
+            for flow_to in source["flow_to"]:
+                add(flow_to["stat_energy_to"], flow_to["stat_compensation"])
+        elif source["type"] == "battery":
+            add(source["stat_energy_from"])
+            add(source["stat_energy_to"])
+        elif source["type"] == "solar":
+            add(source["stat_energy_from"])
+        else:
+            add(source["stat_energy_from"], source["stat_cost"])
+    for device in prefs["device_consumption"]:
+        add(device["stat_consumption"])
+    return statistic_ids
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "energy/statistics_during_period",
+        vol.Required("start_time"): str,
+        vol.Required("end_time"): str,
+        vol.Required("period"): vol.Any("hour", "day", "week", "month"),
+    }
+)
+@_ws_with_manager
+async def ws_get_statistics_during_period(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    manager: EnergyManager,
+) -> None:
+    """Return the changes of the statistics shown by the energy dashboard.
+
+    Energy is in kWh, the other statistics in the unit they are stored in.
+    """
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time is None:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+    end_time = dt_util.parse_datetime(msg["end_time"])
+    if end_time is None:
+        connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+        return
+    if manager.data is None:
+        connection.send_result(msg["id"], {})
+        return
+
+    statistics = await async_get_statistics_cache(hass).async_hourly_statistics(
+        dt_util.as_utc(start_time),
+        dt_util.as_utc(end_time),
+        _energy_statistic_ids(hass, manager.data),
+        {"change"},
+    )
+
+    def _hour_start_end(start: float) -> tuple[float, float]:
+        """Return the start and end of an hour."""
+        return start, start + 3600
+
+    period_start_end: Callable[[float], tuple[float, float]]
+    if msg["period"] == "hour":
+        period_start_end = _hour_start_end
+    elif msg["period"] == "day":
+        _, period_start_end = recorder.statistics.reduce_day_ts_factory()
+    elif msg["period"] == "week":
+        _, period_start_end = recorder.statistics.reduce_week_ts_factory()
+    else:
+        _, period_start_end = recorder.statistics.reduce_month_ts_factory()
+
+    result: dict[str, list[dict[str, Any]]] = {}
+    for statistic_id, rows in statistics.items():
+        changes: list[dict[str, Any]] = []
+        period_end = 0.0
+        for row in rows:
+            if (change := row.get("change")) is None:
+                continue
+            if row["start"] >= period_end:
+                period_start, period_end = period_start_end(row["start"])
+                changes.append(
+                    {"start": period_start, "end": period_end, "change": change}
+                )
+            else:
+                changes[-1]["change"] += change
+        for change_row in changes:
+            change_row["start"] = int(change_row["start"] * 1000)
+            change_row["end"] = int(change_row["end"] * 1000)
+        result[statistic_id] = changes
+
+    connection.send_result(msg["id"], result)
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from collections import Counter, deque
+from collections import Counter
 from copy import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial
 import logging
+import math
 from numbers import Number
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -47,6 +47,7 @@ from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
 from homeassistant.util.decorator import Registry
 import homeassistant.util.dt as dt_util
+from homeassistant.util.ring_buffer import NumericRingBuffer
 
 from . import DOMAIN, PLATFORMS
 
@@ -435,10 +436,10 @@ class Filter:
         :param entity: used for debugging only
         """
         if isinstance(window_size, int):
-            self.states: deque[FilterState] = deque(maxlen=window_size)
+            self.states = NumericRingBuffer(maxlen=window_size)
             self.window_unit = WINDOW_SIZE_UNIT_NUMBER_EVENTS
         else:
-            self.states = deque(maxlen=0)
+            self.states = NumericRingBuffer(maxlen=0)
             self.window_unit = WINDOW_SIZE_UNIT_TIME
         self.filter_precision = precision
         self._name = name
@@ -477,13 +478,17 @@ class Filter:
         if self._only_numbers and not isinstance(fstate.state, Number):
             raise ValueError(f"State <{fstate.state}> is not a Number")
 
+        raw_state = fstate.state
         filtered = self._filter_state(fstate)
         filtered.set_precision(self.filter_precision)
 
-        if self._store_raw:
-            self.states.append(copy(FilterState(new_state)))
-        else:
-            self.states.append(copy(filtered))
+        stored = raw_state if self._store_raw else filtered.state
+        # Filters which accept non numeric states only count the states
+        # in their window
+        self.states.append(
+            filtered.timestamp.timestamp(),
+            float(stored) if isinstance(stored, Number) else math.nan,
+        )
         new_state.state = filtered.state
         return new_state
 
@@ -577,10 +582,9 @@ class OutlierFilter(Filter, SensorEntity):
         """Implement the outlier filter."""
 
         # We can cast safely here thanks to self._only_numbers = True
-        previous_state_values = [cast(float, s.state) for s in self.states]
         new_state_value = cast(float, new_state.state)
 
-        median = statistics.median(previous_state_values) if self.states else 0
+        median = self.states.median() if self.states else 0
         if (
             len(self.states) == self.states.maxlen
             and abs(new_state_value - median) > self._radius
@@ -624,7 +628,7 @@ class LowPassFilter(Filter, SensorEntity):
         new_weight = 1.0 / self._time_constant
         prev_weight = 1.0 - new_weight
         # We can cast safely here thanks to self._only_numbers = True
-        prev_state_value = cast(float, self.states[-1].state)
+        prev_state_value = self.states[-1][1]
         new_state_value = cast(float, new_state.state)
         new_state.state = prev_weight * prev_state_value + new_weight * new_state_value
 
@@ -654,34 +658,19 @@ class TimeSMAFilter(Filter, SensorEntity):
             FILTER_NAME_TIME_SMA, window_size, precision=precision, entity=entity
         )
         self._time_window = window_size
-        self.last_leak: FilterState | None = None
-        self.queue = deque[FilterState]()
-
-    def _leak(self, left_boundary: datetime) -> None:
-        """Remove timeouted elements."""
-        while self.queue:
-            if self.queue[0].timestamp + self._time_window <= left_boundary:
-                self.last_leak = self.queue.popleft()
-            else:
-                return
+        self.queue = NumericRingBuffer()
 
     def _filter_state(self, new_state: FilterState) -> FilterState:
         """Implement the Simple Moving Average filter."""
 
-        self._leak(new_state.timestamp)
-        self.queue.append(copy(new_state))
-
-        moving_sum: float = 0
-        start = new_state.timestamp - self._time_window
-        prev_state = self.last_leak if self.last_leak is not None else self.queue[0]
-        for state in self.queue:
-            # We can cast safely here thanks to self._only_numbers = True
-            prev_state_value = cast(float, prev_state.state)
-            moving_sum += (state.timestamp - start).total_seconds() * prev_state_value
-            start = state.timestamp
-            prev_state = state
-
-        new_state.state = moving_sum / self._time_window.total_seconds()
+        timestamp = new_state.timestamp.timestamp()
+        start = timestamp - self._time_window.total_seconds()
+        # We can cast safely here thanks to self._only_numbers = True
+        self.queue.append(timestamp, cast(float, new_state.state))
+        # The last state before the window is kept as it applies
+        # until the first state in the window
+        self.queue.remove_before(start)
+        new_state.state = self.queue.time_weighted_mean(start, timestamp)
 
         return new_state
 
@@ -53,6 +53,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 
 from .const import CONF_HIDE_MEMBERS
+from .util import mode_matches
 
 DOMAIN = "group"
 GROUP_ORDER = "group_order"
@@ -453,6 +454,7 @@ class GroupEntity(Entity):
         for entity_id in self._entity_ids:
             if (state := self.hass.states.get(entity_id)) is None:
                 continue
+            self.async_update_member_state(entity_id, state)
             self.async_update_supported_features(entity_id, state)
 
         @callback
@@ -460,6 +462,10 @@ class GroupEntity(Entity):
             event: Event[EventStateChangedData] | None,
         ) -> None:
             """Handle child updates."""
+            if event:
+                self.async_update_member_state(
+                    event.data["entity_id"], event.data["new_state"]
+                )
             self.async_update_group_state()
             if event:
                 self.async_update_supported_features(
@@ -478,6 +484,7 @@ class GroupEntity(Entity):
         for entity_id in self._entity_ids:
             if (state := self.hass.states.get(entity_id)) is None:
                 continue
+            self.async_update_member_state(entity_id, state)
             self.async_update_supported_features(entity_id, state)
 
         @callback
@@ -486,6 +493,9 @@ class GroupEntity(Entity):
         ) -> None:
             """Handle child updates."""
             self.async_set_context(event.context)
+            self.async_update_member_state(
+                event.data["entity_id"], event.data["new_state"]
+            )
             self.async_update_supported_features(
                 event.data["entity_id"], event.data["new_state"]
             )
@@ -518,6 +528,19 @@ class GroupEntity(Entity):
     def async_update_group_state(self) -> None:
         """Abstract method to update the entity."""
 
+    @callback
+    def async_update_member_state(
+        self,
+        entity_id: str,
+        new_state: State | None,
+    ) -> None:
+        """Update the aggregated member states with the new state of a member.
+
+        Groups which aggregate the states of their members incrementally
+        override this, async_update_group_state then does not need to look
+        up the states of all members.
+        """
+
     @callback
     def async_update_supported_features(
         self,
@@ -558,6 +581,8 @@ class Group(Entity):
         self._set_tracked(entity_ids)
         self._on_off: dict[str, bool] = {}
         self._assumed: dict[str, bool] = {}
+        self._on_count = 0
+        self._assumed_count = 0
         self._on_states: set[str] = set()
         self.created_by_service = created_by_service
         self.mode = any
@@ -786,6 +811,8 @@ class Group(Entity):
         """Reset tracked state."""
         self._on_off = {}
         self._assumed = {}
+        self._on_count = 0
+        self._assumed_count = 0
         self._on_states = set()
 
         for entity_id in self.trackable:
@@ -798,7 +825,11 @@ class Group(Entity):
         domain = new_state.domain
         state = new_state.state
         registry: GroupIntegrationRegistry = self.hass.data[REG_KEY]
-        self._assumed[entity_id] = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        assumed = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        # Keep the number of on and assumed members up to date from the
+        # previous state of the member to avoid iterating all members
+        self._assumed_count += assumed - self._assumed.get(entity_id, False)
+        self._assumed[entity_id] = assumed
 
         if domain not in registry.on_states_by_domain:
             # Handle the group of a group case
@@ -806,12 +837,14 @@ class Group(Entity):
                 self._on_states.add(state)
             elif state in registry.off_on_mapping:
                 self._on_states.add(registry.off_on_mapping[state])
-            self._on_off[entity_id] = state in registry.on_off_mapping
+            is_on = state in registry.on_off_mapping
         else:
             entity_on_state = registry.on_states_by_domain[domain]
             if domain in registry.on_states_by_domain:
                 self._on_states.update(entity_on_state)
-            self._on_off[entity_id] = state in entity_on_state
+            is_on = state in entity_on_state
+        self._on_count += is_on - self._on_off.get(entity_id, False)
+        self._on_off[entity_id] = is_on
 
     @callback
     def _async_update_group_state(self, tr_state: State | None = None) -> None:
@@ -834,7 +867,9 @@ class Group(Entity):
             or self._assumed_state
             and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
         ):
-            self._assumed_state = self.mode(self._assumed.values())
+            self._assumed_state = mode_matches(
+                self.mode, self._assumed_count, len(self._assumed)
+            )
 
         elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
             self._assumed_state = True
@@ -854,7 +889,7 @@ class Group(Entity):
         # on state, we use STATE_ON/STATE_OFF
         else:
             on_state = STATE_ON
-        group_is_on = self.mode(self._on_off.values())
+        group_is_on = mode_matches(self.mode, self._on_count, len(self._on_off))
         if group_is_on:
             self._state = on_state
         else:
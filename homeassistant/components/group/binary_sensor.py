@@ -24,12 +24,13 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from . import GroupEntity
+from .util import MemberStates, mode_matches
 
 DEFAULT_NAME = "Binary Sensor Group"
 
@@ -122,31 +123,36 @@ class BinarySensorGroup(GroupEntity, BinarySensorEntity):
         self._attr_extra_state_attributes = {ATTR_ENTITY_ID: entity_ids}
         self._attr_unique_id = unique_id
         self._device_class = device_class
+        self._member_states = MemberStates()
         self.mode = any
         if mode:
             self.mode = all
 
+    @callback
+    def async_update_member_state(
+        self, entity_id: str, new_state: State | None
+    ) -> None:
+        """Count the new state of a member."""
+        self._member_states.update(entity_id, new_state)
+
     @callback
     def async_update_group_state(self) -> None:
-        """Query all members and determine the binary sensor group state."""
-        states = [
-            state.state
-            for entity_id in self._entity_ids
-            if (state := self.hass.states.get(entity_id)) is not None
-        ]
+        """Determine the binary sensor group state from the member counts."""
+        members = self._member_states
+        total = members.total
 
         # Set group as unavailable if all members are unavailable or missing
-        self._attr_available = any(state != STATE_UNAVAILABLE for state in states)
+        self._attr_available = members.count(STATE_UNAVAILABLE) < total
 
-        valid_state = self.mode(
-            state not in (STATE_UNKNOWN, STATE_UNAVAILABLE) for state in states
+        valid_state = mode_matches(
+            self.mode, total - members.count(STATE_UNKNOWN, STATE_UNAVAILABLE), total
         )
         if not valid_state:
             # Set as unknown if any / all member is not unknown or unavailable
             self._attr_is_on = None
         else:
             # Set as ON if any / all member is ON
-            self._attr_is_on = self.mode(state == STATE_ON for state in states)
+            self._attr_is_on = mode_matches(self.mode, members.count(STATE_ON), total)
 
     @property
     def device_class(self) -> BinarySensorDeviceClass | None:
@@ -29,12 +29,13 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     STATE_UNLOCKING,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from . import GroupEntity
+from .util import MemberStates
 
 DEFAULT_NAME = "Lock Group"
 
@@ -122,6 +123,7 @@ class LockGroup(GroupEntity, LockEntity):
         self._attr_name = name
         self._attr_extra_state_attributes = {ATTR_ENTITY_ID: entity_ids}
         self._attr_unique_id = unique_id
+        self._member_states = MemberStates()
 
     async def async_lock(self, **kwargs: Any) -> None:
         """Forward the lock command to all locks in the group."""
@@ -158,18 +160,20 @@ class LockGroup(GroupEntity, LockEntity):
             context=self._context,
         )
 
+    @callback
+    def async_update_member_state(
+        self, entity_id: str, new_state: State | None
+    ) -> None:
+        """Count the new state of a member."""
+        self._member_states.update(entity_id, new_state)
+
     @callback
     def async_update_group_state(self) -> None:
-        """Query all members and determine the lock group state."""
-        states = [
-            state.state
-            for entity_id in self._entity_ids
-            if (state := self.hass.states.get(entity_id)) is not None
-        ]
+        """Determine the lock group state from the member counts."""
+        members = self._member_states
+        total = members.total
 
-        valid_state = any(
-            state not in (STATE_UNKNOWN, STATE_UNAVAILABLE) for state in states
-        )
+        valid_state = members.count(STATE_UNKNOWN, STATE_UNAVAILABLE) < total
 
         if not valid_state:
             # Set as unknown if any member is unknown or unavailable
@@ -179,9 +183,9 @@ class LockGroup(GroupEntity, LockEntity):
             self._attr_is_locked = None
         else:
             # Set attributes based on member states and let the lock entity sort out the correct state
-            self._attr_is_jammed = STATE_JAMMED in states
-            self._attr_is_locking = STATE_LOCKING in states
-            self._attr_is_unlocking = STATE_UNLOCKING in states
-            self._attr_is_locked = all(state == STATE_LOCKED for state in states)
+            self._attr_is_jammed = members.count(STATE_JAMMED) > 0
+            self._attr_is_locking = members.count(STATE_LOCKING) > 0
+            self._attr_is_unlocking = members.count(STATE_UNLOCKING) > 0
+            self._attr_is_locked = members.count(STATE_LOCKED) == total
 
-        self._attr_available = any(state != STATE_UNAVAILABLE for state in states)
+        self._attr_available = members.count(STATE_UNAVAILABLE) < total
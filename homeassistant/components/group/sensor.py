@@ -50,10 +50,11 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from . import DOMAIN as GROUP_DOMAIN, GroupEntity
 from .const import CONF_IGNORE_NON_NUMERIC
+from .util import MemberStates, RunningSum, mode_matches
 
 DEFAULT_NAME = "Sensor Group"
 
@@ -329,6 +330,14 @@ class SensorGroup(GroupEntity, SensorEntity):
         ] = CALC_TYPES[self._sensor_type]
         self._state_incorrect: set[str] = set()
         self._extra_state_attribute: dict[str, Any] = {}
+        # The numeric values of the members in the order of the members,
+        # None for members without a numeric value
+        self._sensor_values: dict[str, tuple[str, float, State] | None] = dict.fromkeys(
+            entity_ids
+        )
+        self._member_states = MemberStates()
+        self._numeric_count = 0
+        self._sum = RunningSum()
 
     async def async_added_to_hass(self) -> None:
         """When added to hass."""
@@ -340,87 +349,108 @@ class SensorGroup(GroupEntity, SensorEntity):
         self._valid_units = self._get_valid_units()
         await super().async_added_to_hass()
 
+    @callback
+    def async_update_member_state(
+        self, entity_id: str, new_state: State | None
+    ) -> None:
+        """Update the numeric values with the new state of a member."""
+        self._member_states.update(entity_id, new_state)
+        if (old_value := self._sensor_values.get(entity_id)) is not None:
+            self._numeric_count -= 1
+            self._sum.remove(old_value[1])
+        if (
+            new_state is None
+            or (numeric_state := self._numeric_state(entity_id, new_state)) is None
+        ):
+            self._sensor_values[entity_id] = None
+            return
+        self._sensor_values[entity_id] = (entity_id, numeric_state, new_state)
+        self._numeric_count += 1
+        self._sum.add(numeric_state)
+
+    def _numeric_state(self, entity_id: str, state: State) -> float | None:
+        """Return the numeric value of a member state in the group unit."""
+        try:
+            numeric_state = float(state.state)
+            if (
+                self._valid_units
+                and (uom := state.attributes["unit_of_measurement"])
+                in self._valid_units
+                and self._can_convert is True
+            ):
+                numeric_state = UNIT_CONVERTERS[self.device_class].convert(
+                    numeric_state, uom, self.native_unit_of_measurement
+                )
+            if (
+                self._valid_units
+                and (uom := state.attributes["unit_of_measurement"])
+                not in self._valid_units
+            ):
+                raise HomeAssistantError("Not a valid unit")
+        except ValueError:
+            # Log invalid states unless ignoring non numeric values
+            if not self._ignore_non_numeric and entity_id not in self._state_incorrect:
+                self._state_incorrect.add(entity_id)
+                _LOGGER.warning(
+                    "Unable to use state. Only numerical states are supported,"
+                    " entity %s with value %s excluded from calculation in %s",
+                    entity_id,
+                    state.state,
+                    self.entity_id,
+                )
+            return None
+        except (KeyError, HomeAssistantError):
+            # This exception handling can be simplified
+            # once sensor entity doesn't allow incorrect unit of measurement
+            # with a device class, implementation see PR #107639
+            if entity_id not in self._state_incorrect:
+                self._state_incorrect.add(entity_id)
+                _LOGGER.warning(
+                    "Unable to use state. Only entities with correct unit of measurement"
+                    " is supported,"
+                    " entity %s, value %s with device class %s"
+                    " and unit of measurement %s excluded from calculation in %s",
+                    entity_id,
+                    state.state,
+                    self.device_class,
+                    state.attributes.get("unit_of_measurement"),
+                    self.entity_id,
+                )
+            return None
+        self._state_incorrect.discard(entity_id)
+        return numeric_state
+
     @callback
     def async_update_group_state(self) -> None:
-        """Query all members and determine the sensor group state."""
-        states: list[StateType] = []
-        valid_states: list[bool] = []
-        sensor_values: list[tuple[str, float, State]] = []
-        for entity_id in self._entity_ids:
-            if (state := self.hass.states.get(entity_id)) is not None:
-                states.append(state.state)
-                try:
-                    numeric_state = float(state.state)
-                    if (
-                        self._valid_units
-                        and (uom := state.attributes["unit_of_measurement"])
-                        in self._valid_units
-                        and self._can_convert is True
-                    ):
-                        numeric_state = UNIT_CONVERTERS[self.device_class].convert(
-                            numeric_state, uom, self.native_unit_of_measurement
-                        )
-                    if (
-                        self._valid_units
-                        and (uom := state.attributes["unit_of_measurement"])
-                        not in self._valid_units
-                    ):
-                        raise HomeAssistantError("Not a valid unit")
-
-                    sensor_values.append((entity_id, numeric_state, state))
-                    if entity_id in self._state_incorrect:
-                        self._state_incorrect.remove(entity_id)
-                    valid_states.append(True)
-                except ValueError:
-                    valid_states.append(False)
-                    # Log invalid states unless ignoring non numeric values
-                    if (
-                        not self._ignore_non_numeric
-                        and entity_id not in self._state_incorrect
-                    ):
-                        self._state_incorrect.add(entity_id)
-                        _LOGGER.warning(
-                            "Unable to use state. Only numerical states are supported,"
-                            " entity %s with value %s excluded from calculation in %s",
-                            entity_id,
-                            state.state,
-                            self.entity_id,
-                        )
-                    continue
-                except (KeyError, HomeAssistantError):
-                    # This exception handling can be simplified
-                    # once sensor entity doesn't allow incorrect unit of measurement
-                    # with a device class, implementation see PR #107639
-                    valid_states.append(False)
-                    if entity_id not in self._state_incorrect:
-                        self._state_incorrect.add(entity_id)
-                        _LOGGER.warning(
-                            "Unable to use state. Only entities with correct unit of measurement"
-                            " is supported,"
-                            " entity %s, value %s with device class %s"
-                            " and unit of measurement %s excluded from calculation in %s",
-                            entity_id,
-                            state.state,
-                            self.device_class,
-                            state.attributes.get("unit_of_measurement"),
-                            self.entity_id,
-                        )
+        """Determine the sensor group state from the member values."""
+        members = self._member_states
+        total = members.total
+        numeric_count = self._numeric_count
 
         # Set group as unavailable if all members do not have numeric values
-        self._attr_available = any(numeric_state for numeric_state in valid_states)
+        self._attr_available = numeric_count > 0
 
-        valid_state = self.mode(
-            state not in (STATE_UNKNOWN, STATE_UNAVAILABLE) for state in states
+        valid_state = mode_matches(
+            self.mode, total - members.count(STATE_UNKNOWN, STATE_UNAVAILABLE), total
         )
-        valid_state_numeric = self.mode(numeric_state for numeric_state in valid_states)
+        valid_state_numeric = mode_matches(self.mode, numeric_count, total)
 
         if not valid_state or not valid_state_numeric:
             self._attr_native_value = None
             return
 
-        # Calculate values
+        # Sums and means are kept up to date when a member changes,
+        # the other types are calculated from the numeric values
+        if self._sensor_type == "sum":
+            self._extra_state_attribute = {}
+            self._attr_native_value = self._sum.value
+            return
+        if self._sensor_type == "mean" and numeric_count:
+            self._extra_state_attribute = {}
+            self._attr_native_value = self._sum.value / numeric_count
+            return
         self._extra_state_attribute, self._attr_native_value = self._state_calc(
-            sensor_values
+            [value for value in self._sensor_values.values() if value is not None]
         )
 
     @property
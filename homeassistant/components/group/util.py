@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
 from itertools import groupby
+import math
 from typing import Any
 
 from homeassistant.core import State
@@ -83,3 +85,97 @@ def reduce_attribute(
         return attrs[0]
 
     return reduce(*attrs)
+
+
+def mode_matches(mode: Callable[[Iterable[Any]], bool], count: int, total: int) -> bool:
+    """Return if any or all of total members match when count of them match."""
+    if mode is all:
+        return count == total
+    return count > 0
+
+
+class MemberStates:
+    """Count the states of the members of a group.
+
+    The counts are updated from the new state of the changed member, the
+    group state is determined from the counts without looking up the
+    states of all members.
+    """
+
+    __slots__ = ("_counts", "_states")
+
+    def __init__(self) -> None:
+        """Initialize the counts."""
+        self._counts: Counter[str] = Counter()
+        self._states: dict[str, str] = {}
+
+    @property
+    def total(self) -> int:
+        """Return the number of members which have a state."""
+        return len(self._states)
+
+    def count(self, *states: str) -> int:
+        """Return the number of members in any of states."""
+        counts = self._counts
+        return sum(counts[state] for state in states)
+
+    def update(self, entity_id: str, new_state: State | None) -> None:
+        """Update the counts with the new state of a member."""
+        if (old_state := self._states.pop(entity_id, None)) is not None:
+            self._counts[old_state] -= 1
+        if new_state is not None:
+            self._states[entity_id] = new_state.state
+            self._counts[new_state.state] += 1
+
+
+class RunningSum:
+    """Keep the sum of values which are added and removed.
+
+    The partial sums are kept exact, the sum does not drift no matter
+    how many values were added and removed.
+    """
+
+    __slots__ = ("_non_finite", "_partials")
+
+    def __init__(self) -> None:
+        """Initialize the sum."""
+        self._non_finite: Counter[str] = Counter()
+        self._partials: list[float] = []
+
+    @property
+    def value(self) -> float:
+        """Return the correctly rounded sum."""
+        non_finite = self._non_finite
+        if non_finite["nan"] or (non_finite["inf"] and non_finite["-inf"]):
+            return math.nan
+        if non_finite["inf"]:
+            return math.inf
+        if non_finite["-inf"]:
+            return -math.inf
+        return math.fsum(self._partials)
+
+    def add(self, value: float) -> None:
+        """Add a value to the sum."""
+        if not math.isfinite(value):
+            self._non_finite["nan" if math.isnan(value) else str(value)] += 1
+            return
+        # Shewchuk's algorithm, as used by math.fsum
+        partials = self._partials
+        index = 0
+        for partial in partials:
+            if abs(value) < abs(partial):
+                value, partial = partial, value
+            high = value + partial
+            low = partial - (high - value)
+            if low:
+                partials[index] = low
+                index += 1
+            value = high
+        partials[index:] = [value]
+
+    def remove(self, value: float) -> None:
+        """Remove a value which was added before from the sum."""
+        if not math.isfinite(value):
+            self._non_finite["nan" if math.isnan(value) else str(value)] -= 1
+            return
+        self.add(-value)
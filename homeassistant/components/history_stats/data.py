@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 import datetime
+import math
 
-from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import Event, HomeAssistant, State
+from homeassistant.components.recorder import history
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers.event import EventStateChangedData
 from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
@@ -33,6 +35,123 @@ class HistoryState:
     last_changed: float
 
 
+class HistoryIndex:
+    """States of an entity with prefix sums of the matched time.
+
+    The cumulative matched seconds and the cumulative number of
+    changes into a matching state are kept for every state, which
+    answers the stats of any period covered by the states with two
+    binary searches. New states are appended at the end and states
+    which are no longer needed are evicted from the front as a
+    rolling period advances.
+    """
+
+    def __init__(self, entity_states: set[str]) -> None:
+        """Init the index."""
+        self._entity_states = entity_states
+        self._timestamps: list[float] = []
+        self._states: list[str] = []
+        self._matches: list[bool] = []
+        # Matched seconds from the first state up to each state
+        self._matched_seconds: list[float] = []
+        # Changes into a matching state up to and including each state
+        self._match_counts: list[int] = []
+        self._offset = 0
+
+    def __len__(self) -> int:
+        """Return the number of states in the index."""
+        return len(self._timestamps) - self._offset
+
+    def reset(self, states: list[HistoryState]) -> None:
+        """Replace the states of the index."""
+        self._timestamps.clear()
+        self._states.clear()
+        self._matches.clear()
+        self._matched_seconds.clear()
+        self._match_counts.clear()
+        self._offset = 0
+        for state in states:
+            self.append(state.state, state.last_changed)
+
+    def append(self, state: str, last_changed: float) -> bool:
+        """Append a state, return if it was added.
+
+        States which are older than the newest state, or which only
+        changed attributes, are ignored.
+        """
+        if timestamps := self._timestamps:
+            previous_timestamp = timestamps[-1]
+            if last_changed < previous_timestamp or (
+                last_changed == previous_timestamp and state == self._states[-1]
+            ):
+                return False
+            previous_matches = self._matches[-1]
+            matched_seconds = self._matched_seconds[-1]
+            if previous_matches:
+                matched_seconds += last_changed - previous_timestamp
+            match_count = self._match_counts[-1]
+        else:
+            previous_matches = False
+            matched_seconds = 0.0
+            match_count = 0
+        matches = state in self._entity_states
+        if matches and not previous_matches:
+            match_count += 1
+        timestamps.append(last_changed)
+        self._states.append(state)
+        self._matches.append(matches)
+        self._matched_seconds.append(matched_seconds)
+        self._match_counts.append(match_count)
+        return True
+
+    def evict(self, start_timestamp: float) -> None:
+        """Evict the states which ended before start_timestamp."""
+        index = bisect_right(self._timestamps, start_timestamp, self._offset) - 1
+        if index <= self._offset:
+            return
+        self._offset = index
+        # Only compact once half of the lists are evicted to keep
+        # the amortized cost of the eviction constant
+        if index * 2 >= len(self._timestamps):
+            del self._timestamps[:index]
+            del self._states[:index]
+            del self._matches[:index]
+            del self._matched_seconds[:index]
+            del self._match_counts[:index]
+            self._offset = 0
+
+    @property
+    def last_changed(self) -> float | None:
+        """Return the timestamp of the newest state."""
+        return self._timestamps[-1] if len(self) else None
+
+    def compute(
+        self, now_timestamp: float, start_timestamp: float, end_timestamp: float
+    ) -> tuple[float, int]:
+        """Compute the seconds matched and changes since start_timestamp.
+
+        The state at the start of the period counts as a change when
+        it matches.
+        """
+        timestamps = self._timestamps
+        offset = self._offset
+        if not (last := len(timestamps) - 1) >= offset:
+            return 0.0, 0
+        first = max(bisect_right(timestamps, start_timestamp, offset) - 1, offset)
+        matches = self._matches
+        matched_seconds = self._matched_seconds
+        elapsed = matched_seconds[last] - matched_seconds[first]
+        if matches[first]:
+            # Without a state before the start of the period
+            # the first state counts from the start of the period
+            elapsed += timestamps[first] - start_timestamp
+        if matches[last]:
+            elapsed += min(end_timestamp, now_timestamp) - timestamps[last]
+        match_counts = self._match_counts
+        match_count = match_counts[last] - match_counts[first] + matches[first]
+        return elapsed, match_count
+
+
 class HistoryStats:
     """Manage history stats."""
 
@@ -50,9 +169,15 @@ class HistoryStats:
         self.entity_id = entity_id
         self._period = (MIN_TIME_UTC, MIN_TIME_UTC)
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
-        self._history_current_period: list[HistoryState] = []
-        self._previous_run_before_start = False
         self._entity_states = set(entity_states)
+        self._history = HistoryIndex(self._entity_states)
+        # The history is complete from the start of the period it
+        # was fetched for up to its end, or up to now if the period
+        # did not end when it was fetched since state changes are
+        # added to it as they happen
+        self._history_start: float | None = None
+        self._history_end = 0.0
+        self._previous_run_before_start = False
         self._duration = duration
         self._start = start
         self._end = end
@@ -84,49 +209,72 @@ class HistoryStats:
 
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
-            self._history_current_period = []
+            self._history.reset([])
+            self._history_start = None
             self._previous_run_before_start = True
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
         #
-        # We avoid querying the database if the below did NOT happen:
+        # We avoid querying the database if the history already
+        # covers the current period, which is the case unless:
         #
         # - The previous run happened before the start time
-        # - The start time changed
-        # - The period shrank in size
-        # - The previous period ended before now
+        # - The start time moved back
+        # - The period shrank before the newest state
+        # - The end time moved past the end of a period which
+        #   had ended when the history was fetched
         #
         if (
             not self._previous_run_before_start
-            and current_period_start_timestamp == previous_period_start_timestamp
+            and self._history_start is not None
+            and self._history_start <= current_period_start_timestamp
+            and current_period_end_timestamp <= self._history_end
             and (
-                current_period_end_timestamp == previous_period_end_timestamp
-                or (
-                    current_period_end_timestamp >= previous_period_end_timestamp
-                    and previous_period_end_timestamp <= now_timestamp
-                )
+                (last_changed := self._history.last_changed) is None
+                or math.floor(last_changed) <= current_period_end_timestamp
             )
         ):
             new_data = False
-            if event and (new_state := event.data["new_state"]) is not None:
+            if (
+                event
+                and (new_state := event.data["new_state"]) is not None
+                and self._history_end == math.inf
+            ):
                 if (
-                    current_period_start_timestamp
-                    <= floored_timestamp(new_state.last_changed)
-                    <= current_period_end_timestamp
+                    floored_timestamp(new_state.last_changed)
+                    > current_period_end_timestamp
                 ):
-                    self._history_current_period.append(
-                        HistoryState(
-                            new_state.state, new_state.last_changed.timestamp()
-                        )
+                    # The history is no longer complete after the period
+                    self._history_end = current_period_end_timestamp
+                elif self._history.append(
+                    new_state.state, new_state.last_changed.timestamp()
+                ):
+                    new_data = current_period_start_timestamp <= floored_timestamp(
+                        new_state.last_changed
                     )
-                    new_data = True
-            if not new_data and current_period_end_timestamp < now_timestamp:
+            if (
+                not new_data
+                and current_period_start_timestamp == previous_period_start_timestamp
+                and current_period_end_timestamp == previous_period_end_timestamp
+                and current_period_end_timestamp < now_timestamp
+            ):
                 # If period has not changed and current time after the period end...
                 # Don't compute anything as the value cannot have changed
                 return self._state
+            if current_period_start_timestamp > self._history_start:
+                # A rolling period advanced, the states before the
+                # start are no longer needed
+                self._history.evict(current_period_start_timestamp)
+                self._history_start = current_period_start_timestamp
         else:
+            self._history_start = current_period_start_timestamp
+            self._history_end = (
+                math.inf
+                if current_period_end_timestamp >= now_timestamp
+                else current_period_end_timestamp
+            )
             await self._async_history_from_db(
-                current_period_start_timestamp, current_period_end_timestamp
+                current_period_start_timestamp, current_period_end_timestamp, utc_now
             )
             self._previous_run_before_start = False
 
@@ -142,67 +290,41 @@ class HistoryStats:
         self,
         current_period_start_timestamp: float,
         current_period_end_timestamp: float,
+        utc_now: datetime.datetime,
     ) -> None:
         """Update history data for the current period from the database."""
-        instance = get_instance(self.hass)
-        states = await instance.async_add_executor_job(
-            self._state_changes_during_period,
-            current_period_start_timestamp,
-            current_period_end_timestamp,
-        )
-        self._history_current_period = [
-            HistoryState(state.state, state.last_changed.timestamp())
-            for state in states
-        ]
-
-    def _state_changes_during_period(
-        self, start_ts: float, end_ts: float
-    ) -> list[State]:
-        """Return state changes during a period."""
-        start = dt_util.utc_from_timestamp(start_ts)
-        end = dt_util.utc_from_timestamp(end_ts)
-        return history.state_changes_during_period(
+        live = self._history_end == math.inf
+        states = await history.async_state_changes_during_period(
             self.hass,
-            start,
-            end,
+            dt_util.utc_from_timestamp(current_period_start_timestamp),
+            # The history of a period which did not end yet is kept up
+            # to date with the state changes, it needs all states up to now.
+            # Periods ending at now() are queried without an end time, which
+            # lets the queries of these sensors share a batch
+            None
+            if live and current_period_end_timestamp < utc_now.timestamp()
+            else dt_util.utc_from_timestamp(current_period_end_timestamp),
             self.entity_id,
             include_start_time_state=True,
             no_attributes=True,
-        ).get(self.entity_id, [])
+        )
+        self._history.reset(
+            [
+                HistoryState(state.state, state.last_changed.timestamp())
+                for state in states
+            ]
+        )
+        if live and (current_state := self.hass.states.get(self.entity_id)):
+            # The current state may not be committed to the database yet
+            self._history.append(
+                current_state.state, current_state.last_changed.timestamp()
+            )
 
     def _async_compute_seconds_and_changes(
         self, now_timestamp: float, start_timestamp: float, end_timestamp: float
     ) -> tuple[float, int]:
-        """Compute the seconds matched and changes from the history list and first state."""
+        """Compute the seconds matched and changes from the history."""
         # state_changes_during_period is called with include_start_time_state=True
         # which is the default and always provides the state at the start
         # of the period
-        previous_state_matches = (
-            self._history_current_period
-            and self._history_current_period[0].state in self._entity_states
-        )
-        last_state_change_timestamp = start_timestamp
-        elapsed = 0.0
-        match_count = 1 if previous_state_matches else 0
-
-        # Make calculations
-        for history_state in self._history_current_period:
-            current_state_matches = history_state.state in self._entity_states
-            state_change_timestamp = history_state.last_changed
-
-            if previous_state_matches:
-                elapsed += state_change_timestamp - last_state_change_timestamp
-            elif current_state_matches:
-                match_count += 1
-
-            previous_state_matches = current_state_matches
-            last_state_change_timestamp = state_change_timestamp
-
-        # Count time elapsed between last history state and end of measure
-        if previous_state_matches:
-            measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_state_change_timestamp
-
-        # Save value in seconds
-        seconds_matched = elapsed
-        return seconds_matched, match_count
+        return self._history.compute(now_timestamp, start_timestamp, end_timestamp)
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right, insort
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import timedelta
+from itertools import count
 import logging
+import math
 from typing import Any, TypeVar
 
 import voluptuous as vol
@@ -18,6 +22,8 @@ from homeassistant.const import (
     CONF_FOR,
     CONF_PLATFORM,
     CONF_VALUE_TEMPLATE,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
@@ -84,6 +90,8 @@ _TRIGGER_SCHEMA = vol.All(
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_NUMERIC_STATE_TRIGGERS = "numeric_state_triggers"
+
 
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
@@ -106,7 +114,9 @@ async def async_attach_trigger(
     platform_type: str = "numeric_state",
 ) -> CALLBACK_TYPE:
     """Listen for state changes based on configuration."""
-    entity_ids: list[str] = config[CONF_ENTITY_ID]
+    entity_ids: list[str] = [
+        entity_id.lower() for entity_id in cv.ensure_list(config[CONF_ENTITY_ID])
+    ]
     below = config.get(CONF_BELOW)
     above = config.get(CONF_ABOVE)
     time_delta = config.get(CONF_FOR)
@@ -159,14 +169,12 @@ async def async_attach_trigger(
             )
 
     @callback
-    def state_automation_listener(event: Event[EventStateChangedData]) -> None:
-        """Listen for state changes and calls action."""
+    def async_fire(event: Event[EventStateChangedData]) -> None:
+        """Run the action once an entity changed into the range."""
         entity_id = event.data["entity_id"]
         from_s = event.data["old_state"]
         to_s = event.data["new_state"]
-
-        if to_s is None:
-            return
+        assert to_s is not None
 
         @callback
         def call_action() -> None:
@@ -203,6 +211,80 @@ async def async_attach_trigger(
                 # primary async_track_state_change_event() listener.
                 return False
 
+        if not time_delta:
+            call_action()
+            return
+
+        try:
+            period[entity_id] = cv.positive_time_period(
+                template.render_complex(time_delta, variables(entity_id))
+            )
+        except (exceptions.TemplateError, vol.Invalid) as ex:
+            _LOGGER.error(
+                "Error rendering '%s' for template: %s",
+                trigger_info["name"],
+                ex,
+            )
+            return
+
+        unsub_track_same[entity_id] = async_track_same_state(
+            hass,
+            period[entity_id],
+            call_action,
+            entity_ids=entity_id,
+            async_check_same_func=check_numeric_state_no_raise,
+        )
+
+    @callback
+    def async_remove_track_same() -> None:
+        """Remove the listeners of pending for periods."""
+        for async_remove in unsub_track_same.values():
+            async_remove()
+        unsub_track_same.clear()
+
+    if (
+        value_template is None
+        and not isinstance(below, str)
+        and not isinstance(above, str)
+    ):
+        # Triggers with constant thresholds share the listener of their
+        # entities and only the triggers whose thresholds were crossed
+        # are evaluated on a state change
+        index = _async_get_index(hass)
+        remove_indexed = [
+            index.async_add(
+                entity_id,
+                attribute,
+                _IndexedTrigger(
+                    above,
+                    below,
+                    async_fire,
+                    trigger_info["name"],
+                    entity_id in armed_entities,
+                ),
+            )
+            for entity_id in entity_ids
+        ]
+
+        @callback
+        def async_remove_indexed() -> None:
+            """Remove the triggers from the index."""
+            for remove in remove_indexed:
+                remove()
+            async_remove_track_same()
+
+        return async_remove_indexed
+
+    @callback
+    def state_automation_listener(event: Event[EventStateChangedData]) -> None:
+        """Listen for state changes and calls action."""
+        entity_id = event.data["entity_id"]
+        from_s = event.data["old_state"]
+        to_s = event.data["new_state"]
+
+        if to_s is None:
+            return
+
         try:
             matching = check_numeric_state(entity_id, from_s, to_s)
         except exceptions.ConditionError as ex:
@@ -213,29 +295,7 @@ async def async_attach_trigger(
             armed_entities.add(entity_id)
         elif entity_id in armed_entities:
             armed_entities.discard(entity_id)
-
-            if time_delta:
-                try:
-                    period[entity_id] = cv.positive_time_period(
-                        template.render_complex(time_delta, variables(entity_id))
-                    )
-                except (exceptions.TemplateError, vol.Invalid) as ex:
-                    _LOGGER.error(
-                        "Error rendering '%s' for template: %s",
-                        trigger_info["name"],
-                        ex,
-                    )
-                    return
-
-                unsub_track_same[entity_id] = async_track_same_state(
-                    hass,
-                    period[entity_id],
-                    call_action,
-                    entity_ids=entity_id,
-                    async_check_same_func=check_numeric_state_no_raise,
-                )
-            else:
-                call_action()
+            async_fire(event)
 
     unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
 
@@ -243,8 +303,219 @@ async def async_attach_trigger(
     def async_remove() -> None:
         """Remove state listeners async."""
         unsub()
-        for async_remove in unsub_track_same.values():
-            async_remove()
-        unsub_track_same.clear()
+        async_remove_track_same()
 
     return async_remove
+
+
+@dataclass(slots=True, eq=False)
+class _IndexedTrigger:
+    """A numeric state trigger of an entity with constant thresholds."""
+
+    above: float | None
+    below: float | None
+    action: Callable[[Event[EventStateChangedData]], None]
+    name: str
+    # Whether the trigger is ready to fire, only used until the first
+    # state change after the trigger was attached since after that the
+    # trigger is armed when the previous value was not in its range
+    armed: bool
+    seq: int = field(default=0, init=False)
+
+    def matches(self, value: float) -> bool:
+        """Return if the value is in the range of the trigger."""
+        # Written like condition.async_numeric_state to treat NaN the same
+        return not (self.below is not None and value >= self.below) and not (
+            self.above is not None and value <= self.above
+        )
+
+
+class _ThresholdIndex:
+    """The numeric state triggers of an entity or entity attribute."""
+
+    def __init__(self, attribute: str | None) -> None:
+        """Initialize the index."""
+        self.attribute = attribute
+        # The value of the last state, None when it is not numeric in
+        # which case no trigger is in range and all triggers are armed
+        self.value: float | None = None
+        # The triggers attached since the last state change
+        self.pending: list[_IndexedTrigger] = []
+        self.above: list[tuple[float, int, _IndexedTrigger]] = []
+        self.below: list[tuple[float, int, _IndexedTrigger]] = []
+
+    def __bool__(self) -> bool:
+        """Return if there are triggers in the index."""
+        return bool(self.pending or self.above or self.below)
+
+    def _insert(self, trigger: _IndexedTrigger) -> None:
+        """Insert a trigger into the sorted thresholds."""
+        if trigger.above is not None:
+            insort(self.above, (trigger.above, trigger.seq, trigger))
+        if trigger.below is not None:
+            insort(self.below, (trigger.below, trigger.seq, trigger))
+
+    def remove(self, trigger: _IndexedTrigger) -> None:
+        """Remove a trigger."""
+        if trigger in self.pending:
+            self.pending.remove(trigger)
+            return
+        for thresholds, threshold in (
+            (self.above, trigger.above),
+            (self.below, trigger.below),
+        ):
+            if threshold is not None:
+                del thresholds[bisect_left(thresholds, (threshold, trigger.seq))]
+
+    def triggers(self) -> dict[int, _IndexedTrigger]:
+        """Return all triggers which are not pending."""
+        triggers = {seq: trigger for _, seq, trigger in self.above}
+        triggers.update((seq, trigger) for _, seq, trigger in self.below)
+        return triggers
+
+    def _crossed(self, previous: float, value: float) -> dict[int, _IndexedTrigger]:
+        """Return the triggers with a threshold between two values."""
+        low, high = min(previous, value), max(previous, value)
+        above = self.above
+        below = self.below
+        # above matches above the threshold and below matches below it
+        crossed = {
+            seq: trigger
+            for _, seq, trigger in above[
+                bisect_left(above, (low,)) : bisect_left(above, (high,))
+            ]
+        }
+        crossed.update(
+            (seq, trigger)
+            for _, seq, trigger in below[
+                bisect_right(below, (low, math.inf)) : bisect_right(
+                    below, (high, math.inf)
+                )
+            ]
+        )
+        return crossed
+
+    def async_process(self, value: float | None) -> list[_IndexedTrigger]:
+        """Process a new value and return the triggers which fire."""
+        fired: list[_IndexedTrigger] = []
+        if value is not None:
+            previous = self.value
+            if previous is None or math.isnan(previous) or math.isnan(value):
+                candidates = self.triggers()
+            elif previous != value:
+                candidates = self._crossed(previous, value)
+            else:
+                candidates = {}
+            fired.extend(
+                trigger
+                for trigger in candidates.values()
+                if trigger.matches(value)
+                and (previous is None or not trigger.matches(previous))
+            )
+        for trigger in self.pending:
+            matching = value is not None and trigger.matches(value)
+            if matching and trigger.armed:
+                fired.append(trigger)
+            self._insert(trigger)
+        self.pending.clear()
+        self.value = value
+        return fired
+
+
+class _EntityTriggers:
+    """The numeric state triggers with constant thresholds of an entity."""
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Initialize the entity triggers."""
+        self.indexes: dict[str | None, _ThresholdIndex] = {}
+        self.unsub = async_track_state_change_event(
+            hass, entity_id, self._async_state_listener
+        )
+
+    @callback
+    def _async_state_listener(self, event: Event[EventStateChangedData]) -> None:
+        """Evaluate the triggers of the entity in one pass."""
+        if (to_s := event.data["new_state"]) is None:
+            return
+        fired: list[_IndexedTrigger] = []
+        for attribute, index in self.indexes.items():
+            try:
+                value = _numeric_value(to_s, attribute)
+            except exceptions.ConditionError as ex:
+                for trigger in (*index.pending, *index.triggers().values()):
+                    _LOGGER.warning("Error in '%s' trigger: %s", trigger.name, ex)
+                continue
+            fired.extend(index.async_process(value))
+        # Fire in the order the triggers were attached
+        fired.sort(key=lambda trigger: trigger.seq)
+        for trigger in fired:
+            trigger.action(event)
+
+
+class _NumericStateTriggerIndex:
+    """Index of the numeric state triggers with constant thresholds."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self.entities: dict[str, _EntityTriggers] = {}
+        self._seq = count()
+
+    @callback
+    def async_add(
+        self, entity_id: str, attribute: str | None, trigger: _IndexedTrigger
+    ) -> CALLBACK_TYPE:
+        """Add a trigger of an entity and return a callback to remove it."""
+        entity_id = entity_id.lower()
+        if (entity_triggers := self.entities.get(entity_id)) is None:
+            entity_triggers = self.entities[entity_id] = _EntityTriggers(
+                self.hass, entity_id
+            )
+        if (index := entity_triggers.indexes.get(attribute)) is None:
+            index = entity_triggers.indexes[attribute] = _ThresholdIndex(attribute)
+        trigger.seq = next(self._seq)
+        index.pending.append(trigger)
+
+        @callback
+        def async_remove() -> None:
+            """Remove the trigger."""
+            index.remove(trigger)
+            if index:
+                return
+            del entity_triggers.indexes[attribute]
+            if not entity_triggers.indexes:
+                entity_triggers.unsub()
+                del self.entities[entity_id]
+
+        return async_remove
+
+
+@callback
+def _async_get_index(hass: HomeAssistant) -> _NumericStateTriggerIndex:
+    """Return the index of the numeric state triggers."""
+    if (index := hass.data.get(DATA_NUMERIC_STATE_TRIGGERS)) is None:
+        index = hass.data[DATA_NUMERIC_STATE_TRIGGERS] = _NumericStateTriggerIndex(hass)
+    return index
+
+
+def _numeric_value(state: State, attribute: str | None) -> float | None:
+    """Return the numeric value of a state like condition.async_numeric_state.
+
+    None is returned for values which are never in range and
+    ConditionError is raised for values which are not numeric.
+    """
+    if attribute is None:
+        value: Any = state.state
+    elif attribute not in state.attributes:
+        return None
+    else:
+        value = state.attributes[attribute]
+    if value in (None, STATE_UNAVAILABLE, STATE_UNKNOWN):
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError) as ex:
+        raise exceptions.ConditionErrorMessage(
+            "numeric_state",
+            f"entity {state.entity_id} state '{value}' cannot be processed as a number",
+        ) from ex
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import timedelta
+from itertools import count
 import logging
+from operator import attrgetter
 
 import voluptuous as vol
 
@@ -40,6 +44,8 @@ CONF_TO = "to"
 CONF_NOT_FROM = "not_from"
 CONF_NOT_TO = "not_to"
 
+DATA_STATE_TRIGGERS = "state_triggers"
+
 BASE_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_PLATFORM): "state",
@@ -100,7 +106,9 @@ async def async_attach_trigger(
     platform_type: str = "state",
 ) -> CALLBACK_TYPE:
     """Listen for state changes based on configuration."""
-    entity_ids = config[CONF_ENTITY_ID]
+    entity_ids: list[str] = [
+        entity_id.lower() for entity_id in cv.ensure_list(config[CONF_ENTITY_ID])
+    ]
 
     if (from_state := config.get(CONF_FROM)) is not None:
         match_from_state = process_state_match(from_state)
@@ -234,14 +242,131 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    # Triggers on specific states are only run when the entity changes
+    # to one of them, the others run on every change of the entity
+    to_states: frozenset[str] | None = None
+    if (
+        attribute is None
+        and isinstance(to_state, (str, list))
+        and to_state != MATCH_ALL
+    ):
+        to_states = frozenset(cv.ensure_list(to_state))
+    index = _async_get_index(hass)
+    remove_indexed = [
+        index.async_add(
+            entity_id, _IndexedTrigger(to_states, state_automation_listener)
+        )
+        for entity_id in entity_ids
+    ]
 
     @callback
     def async_remove() -> None:
         """Remove state listeners async."""
-        unsub()
+        for remove in remove_indexed:
+            remove()
         for async_remove in unsub_track_same.values():
             async_remove()
         unsub_track_same.clear()
 
     return async_remove
+
+
+@dataclass(slots=True, eq=False)
+class _IndexedTrigger:
+    """A state trigger of an entity."""
+
+    to_states: frozenset[str] | None
+    listener: Callable[[Event[EventStateChangedData]], None]
+    seq: int = field(default=0, init=False)
+
+
+class _EntityTriggers:
+    """The state triggers of an entity."""
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Initialize the entity triggers."""
+        self.by_to_state: defaultdict[str, list[_IndexedTrigger]] = defaultdict(list)
+        self.any_state: list[_IndexedTrigger] = []
+        self.unsub = async_track_state_change_event(
+            hass, entity_id, self._async_state_listener
+        )
+
+    def __bool__(self) -> bool:
+        """Return if the entity has triggers."""
+        return bool(self.by_to_state or self.any_state)
+
+    def add(self, trigger: _IndexedTrigger) -> None:
+        """Add a trigger."""
+        if trigger.to_states is None:
+            self.any_state.append(trigger)
+            return
+        for to_state in trigger.to_states:
+            self.by_to_state[to_state].append(trigger)
+
+    def remove(self, trigger: _IndexedTrigger) -> None:
+        """Remove a trigger."""
+        if trigger.to_states is None:
+            self.any_state.remove(trigger)
+            return
+        for to_state in trigger.to_states:
+            self.by_to_state[to_state].remove(trigger)
+            if not self.by_to_state[to_state]:
+                del self.by_to_state[to_state]
+
+    @callback
+    def _async_state_listener(self, event: Event[EventStateChangedData]) -> None:
+        """Run the triggers which may match the new state."""
+        triggers = self.any_state
+        if (new_state := event.data["new_state"]) is not None and (
+            to_state_triggers := self.by_to_state.get(new_state.state)
+        ):
+            # Run in the order the triggers were attached
+            triggers = sorted([*to_state_triggers, *triggers], key=attrgetter("seq"))
+        for trigger in triggers.copy():
+            try:
+                trigger.listener(event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while dispatching event for %s to %s",
+                    event.data["entity_id"],
+                    trigger.listener,
+                )
+
+
+class _StateTriggerIndex:
+    """Index of the state triggers by entity and state."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self.entities: dict[str, _EntityTriggers] = {}
+        self._seq = count()
+
+    @callback
+    def async_add(self, entity_id: str, trigger: _IndexedTrigger) -> CALLBACK_TYPE:
+        """Add a trigger of an entity and return a callback to remove it."""
+        entity_id = entity_id.lower()
+        if (entity_triggers := self.entities.get(entity_id)) is None:
+            entity_triggers = self.entities[entity_id] = _EntityTriggers(
+                self.hass, entity_id
+            )
+        trigger.seq = next(self._seq)
+        entity_triggers.add(trigger)
+
+        @callback
+        def async_remove() -> None:
+            """Remove the trigger."""
+            entity_triggers.remove(trigger)
+            if not entity_triggers:
+                entity_triggers.unsub()
+                del self.entities[entity_id]
+
+        return async_remove
+
+
+@callback
+def _async_get_index(hass: HomeAssistant) -> _StateTriggerIndex:
+    """Return the index of the state triggers."""
+    if (index := hass.data.get(DATA_STATE_TRIGGERS)) is None:
+        index = hass.data[DATA_STATE_TRIGGERS] = _StateTriggerIndex(hass)
+    return index
@@ -12,8 +12,10 @@ from homeassistant.const import (
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,  # noqa: F401
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,  # noqa: F401
     EVENT_STATE_CHANGED,
+    Platform,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import discovery
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -51,6 +53,8 @@ DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
 
+CONF_ADAPTIVE_PURGE = "adaptive_purge"
+CONF_ARCHIVE_STATES = "archive_states"
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
@@ -58,7 +62,9 @@ CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
+CONF_PARTITIONED_SHORT_TERM_STATISTICS = "partitioned_short_term_statistics"
 CONF_EVENT_TYPES = "event_types"
+CONF_METRICS_SENSORS = "metrics_sensors"
 CONF_COMMIT_INTERVAL = "commit_interval"
 
 
@@ -95,6 +101,12 @@ CONFIG_SCHEMA = vol.Schema(
                 {
                     vol.Optional(CONF_AUTO_PURGE, default=True): cv.boolean,
                     vol.Optional(CONF_AUTO_REPACK, default=True): cv.boolean,
+                    vol.Optional(CONF_ADAPTIVE_PURGE, default=False): cv.boolean,
+                    vol.Optional(CONF_ARCHIVE_STATES, default=False): cv.boolean,
+                    vol.Optional(CONF_METRICS_SENSORS, default=False): cv.boolean,
+                    vol.Optional(
+                        CONF_PARTITIONED_SHORT_TERM_STATISTICS, default=False
+                    ): cv.boolean,
                     vol.Optional(CONF_PURGE_KEEP_DAYS, default=10): vol.All(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
@@ -138,6 +150,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     entity_filter = convert_include_exclude_filter(conf).get_filter()
     auto_purge = conf[CONF_AUTO_PURGE]
     auto_repack = conf[CONF_AUTO_REPACK]
+    adaptive_purge = conf[CONF_ADAPTIVE_PURGE]
+    partitioned_short_term_statistics = conf[CONF_PARTITIONED_SHORT_TERM_STATISTICS]
+    archive_states = conf[CONF_ARCHIVE_STATES]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
@@ -161,6 +176,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        adaptive_purge=adaptive_purge,
+        partitioned_short_term_statistics=partitioned_short_term_statistics,
+        archive_states=archive_states,
     )
     instance.async_initialize()
     instance.async_register()
@@ -171,6 +189,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     await _async_setup_integration_platform(hass, instance)
 
+    if conf[CONF_METRICS_SENSORS]:
+        hass.async_create_task(
+            discovery.async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+        )
+
     return await instance.async_db_ready
 
 
@@ -0,0 +1,309 @@
+"""Columnar archive of purged states.
+
+States are written to the archive right before they are purged from
+the database. The archive keeps one file per entity and UTC day in
+the config directory::
+
+    recorder_archive/<entity_id>/<YYYYMMDD>.hsa
+
+Each purge run writes the states it archived to new segment files
+instead of rewriting the day files::
+
+    recorder_archive/<entity_id>/<YYYYMMDD>.<segment>.hsa
+
+Once the purge has passed the end of a day, its segments are compacted
+into the day file, so every archived state is written at most twice.
+
+Attributes are not archived. Each file is a zlib compressed payload
+of a small header followed by one column at a time, which keeps
+similar values together and compresses well:
+
+    magic, version
+    state dictionary (distinct state strings)
+    last_updated in milliseconds, delta-encoded zigzag varints
+    state as dictionary index varints
+    last_updated - last_changed in milliseconds as varints
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime
+import logging
+import os
+import struct
+import zlib
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+ARCHIVE_DIR = "recorder_archive"
+ARCHIVE_FILE_SUFFIX = ".hsa"
+ARCHIVE_DAY_FORMAT = "%Y%m%d"
+
+_MAGIC = b"HSA"
+_VERSION = 1
+_HEADER = struct.Struct("<3sBq")
+
+# last_updated_ts, last_changed_ts, state
+ArchivedState = tuple[float, float, str]
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    """Append an unsigned varint to buffer."""
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varints(data: bytes, offset: int, count: int) -> tuple[list[int], int]:
+    """Read count unsigned varints from data starting at offset."""
+    values: list[int] = []
+    append = values.append
+    for _ in range(count):
+        value = shift = 0
+        while True:
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        append(value)
+    return values, offset
+
+
+def encode_states(states: list[ArchivedState]) -> bytes:
+    """Encode states sorted by last_updated into the archive format."""
+    dictionary: dict[str, int] = {}
+    buffer = bytearray()
+    first_ms = round(states[0][0] * 1000) if states else 0
+    buffer += _HEADER.pack(_MAGIC, _VERSION, first_ms)
+    state_indexes = [
+        dictionary.setdefault(state, len(dictionary)) for *_, state in states
+    ]
+    _write_varint(buffer, len(dictionary))
+    for state in dictionary:
+        encoded = state.encode("utf-8")
+        _write_varint(buffer, len(encoded))
+        buffer += encoded
+    _write_varint(buffer, len(states))
+    previous_ms = first_ms
+    for last_updated_ts, _, _ in states:
+        updated_ms = round(last_updated_ts * 1000)
+        delta = updated_ms - previous_ms
+        # zigzag so out of order rows still encode
+        _write_varint(buffer, (delta << 1) ^ (delta >> 63))
+        previous_ms = updated_ms
+    for index in state_indexes:
+        _write_varint(buffer, index)
+    for last_updated_ts, last_changed_ts, _ in states:
+        _write_varint(
+            buffer,
+            max(round(last_updated_ts * 1000) - round(last_changed_ts * 1000), 0),
+        )
+    return zlib.compress(bytes(buffer))
+
+
+def decode_states(payload: bytes) -> list[ArchivedState]:
+    """Decode states from the archive format."""
+    data = zlib.decompress(payload)
+    magic, version, first_ms = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"Unsupported archive format {magic!r} {version}")
+    offset = _HEADER.size
+    (dictionary_size,), offset = _read_varints(data, offset, 1)
+    dictionary: list[str] = []
+    for _ in range(dictionary_size):
+        (length,), offset = _read_varints(data, offset, 1)
+        dictionary.append(data[offset : offset + length].decode("utf-8"))
+        offset += length
+    (count,), offset = _read_varints(data, offset, 1)
+    deltas, offset = _read_varints(data, offset, count)
+    state_indexes, offset = _read_varints(data, offset, count)
+    changed_offsets, offset = _read_varints(data, offset, count)
+    states: list[ArchivedState] = []
+    updated_ms = first_ms
+    for delta, state_index, changed_offset in zip(
+        deltas, state_indexes, changed_offsets, strict=True
+    ):
+        updated_ms += (delta >> 1) ^ -(delta & 1)
+        states.append(
+            (
+                updated_ms / 1000,
+                (updated_ms - changed_offset) / 1000,
+                dictionary[state_index],
+            )
+        )
+    return states
+
+
+def _day_start_ts(day: str) -> float:
+    """Return the timestamp of the start of an archive day."""
+    return (
+        datetime.strptime(day, ARCHIVE_DAY_FORMAT)
+        .replace(tzinfo=dt_util.UTC)
+        .timestamp()
+    )
+
+
+class StatesArchive:
+    """Write purged states to the archive and read them back.
+
+    Writing happens in the recorder thread while reading happens
+    in the database executor.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the archive."""
+        self.path = path
+        self._pending: defaultdict[tuple[str, str], list[ArchivedState]] = defaultdict(
+            list
+        )
+
+    def _file_path(self, entity_id: str, day: str) -> str:
+        """Return the path of the archive file of an entity for a day."""
+        return os.path.join(self.path, entity_id, f"{day}{ARCHIVE_FILE_SUFFIX}")
+
+    def _read_file(self, path: str) -> list[ArchivedState]:
+        """Read an archive file, returning no states if it is unreadable."""
+        try:
+            with open(path, "rb") as file:
+                return decode_states(file.read())
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError, zlib.error, IndexError, struct.error) as err:
+            _LOGGER.error("Could not read states archive %s: %s", path, err)
+            return []
+
+    def add(
+        self,
+        rows: Iterable[tuple[str, str | None, float | None, float | None]],
+    ) -> None:
+        """Queue rows of entity_id, state, last_updated_ts and last_changed_ts."""
+        utc_from_timestamp = dt_util.utc_from_timestamp
+        for entity_id, state, last_updated_ts, last_changed_ts in rows:
+            if state is None or last_updated_ts is None:
+                continue
+            day = utc_from_timestamp(last_updated_ts).strftime(ARCHIVE_DAY_FORMAT)
+            # Match the millisecond precision of the archive files
+            # so rows which were archived before compare equal
+            updated_ms = round(last_updated_ts * 1000)
+            changed_ms = round((last_changed_ts or last_updated_ts) * 1000)
+            self._pending[(entity_id, day)].append(
+                (updated_ms / 1000, min(changed_ms, updated_ms) / 1000, state)
+            )
+
+    @staticmethod
+    def _write_file(path: str, states: list[ArchivedState]) -> None:
+        """Write states to an archive file, replacing it atomically."""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(encode_states(states))
+        os.replace(temp_path, path)
+
+    def flush(self) -> None:
+        """Write the queued states to new segment files."""
+        pending = self._pending
+        self._pending = defaultdict(list)
+        day_files: dict[str, dict[str, list[str]]] = {}
+        for (entity_id, day), states in pending.items():
+            if (files := day_files.get(entity_id)) is None:
+                files = day_files[entity_id] = self._day_files(entity_id)
+                os.makedirs(os.path.join(self.path, entity_id), exist_ok=True)
+            # Segments are only removed by compact, after the day file is written
+            segment = 1 + max(
+                (
+                    int(name.split(".")[1])
+                    for name in files.get(day, ())
+                    if name != f"{day}{ARCHIVE_FILE_SUFFIX}"
+                ),
+                default=-1,
+            )
+            path = self._file_path(entity_id, f"{day}.{segment}")
+            self._write_file(path, sorted(set(states)))
+        if pending:
+            _LOGGER.debug("Archived states to %s files", len(pending))
+
+    def compact(self, before_ts: float) -> None:
+        """Merge the segments of the days which end before before_ts."""
+        try:
+            entity_ids = os.listdir(self.path)
+        except FileNotFoundError:
+            return
+        compacted = 0
+        for entity_id in entity_ids:
+            for day, names in self._day_files(entity_id).items():
+                if len(names) == 1 and names[0] == f"{day}{ARCHIVE_FILE_SUFFIX}":
+                    continue
+                if _day_start_ts(day) + 86400 > before_ts:
+                    break
+                self._write_file(
+                    self._file_path(entity_id, day),
+                    self._read_day(entity_id, names),
+                )
+                for name in names:
+                    if name != f"{day}{ARCHIVE_FILE_SUFFIX}":
+                        os.remove(os.path.join(self.path, entity_id, name))
+                compacted += 1
+        if compacted:
+            _LOGGER.debug("Compacted %s archive days", compacted)
+
+    def _day_files(self, entity_id: str) -> dict[str, list[str]]:
+        """Return the archive files of an entity by day, oldest first."""
+        try:
+            names = os.listdir(os.path.join(self.path, entity_id))
+        except FileNotFoundError:
+            return {}
+        day_files: dict[str, list[str]] = {}
+        for name in sorted(names):
+            if name.endswith(ARCHIVE_FILE_SUFFIX):
+                day_files.setdefault(name.partition(".")[0], []).append(name)
+        return day_files
+
+    def _read_day(self, entity_id: str, names: list[str]) -> list[ArchivedState]:
+        """Read the day file and segments of a day of an entity."""
+        if len(names) == 1:
+            return self._read_file(os.path.join(self.path, entity_id, names[0]))
+        # Rows may be archived twice if a purge was rolled back
+        states: set[ArchivedState] = set()
+        for name in names:
+            states.update(self._read_file(os.path.join(self.path, entity_id, name)))
+        return sorted(states)
+
+    def states_during_period(
+        self, entity_id: str, start_ts: float, end_ts: float | None
+    ) -> list[ArchivedState]:
+        """Return the archived states of an entity with start_ts <= last_updated < end_ts."""
+        states: list[ArchivedState] = []
+        for day, names in self._day_files(entity_id).items():
+            day_start_ts = _day_start_ts(day)
+            if end_ts is not None and day_start_ts >= end_ts:
+                break
+            if day_start_ts + 86400 <= start_ts:
+                continue
+            states.extend(
+                state
+                for state in self._read_day(entity_id, names)
+                if state[0] >= start_ts and (end_ts is None or state[0] < end_ts)
+            )
+        return states
+
+    def state_before(self, entity_id: str, ts: float) -> ArchivedState | None:
+        """Return the last archived state of an entity before ts."""
+        day_files = self._day_files(entity_id)
+        days = list(day_files)
+        for day in reversed(days[: bisect_left(days, _ts_to_day(ts) + "~")]):
+            states = self._read_day(entity_id, day_files[day])
+            if index := bisect_left(states, (ts,)):
+                return states[index - 1]
+        return None
+
+
+def _ts_to_day(ts: float) -> str:
+    """Return the archive day containing ts."""
+    return dt_util.utc_from_timestamp(ts).strftime(ARCHIVE_DAY_FORMAT)
@@ -19,6 +19,10 @@ MYSQLDB_URL_PREFIX = "mysql://"
 MYSQLDB_PYMYSQL_URL_PREFIX = "mysql+pymysql://"
 DOMAIN = "recorder"
 
+# Dispatched with the statistic ids whose existing statistics were
+# imported, adjusted, converted, renamed or cleared
+SIGNAL_STATISTICS_MODIFIED = "recorder_statistics_modified"
+
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
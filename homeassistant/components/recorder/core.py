@@ -37,11 +37,13 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
 )
 from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import migration, statistics
+from .archive import ARCHIVE_DIR, StatesArchive
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     DB_WORKER_PREFIX,
@@ -78,8 +80,10 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .metrics import WriteMetrics
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
@@ -111,6 +115,7 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    ShortTermStatisticsPartitionTask,
     StatesContextIDMigrationTask,
     StatisticsTask,
     StopTask,
@@ -161,6 +166,9 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 # Pool size must accommodate Recorder thread + All db executors
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
 
+PURGE_CURSOR_STORAGE_KEY = f"{DOMAIN}.purge_cursor"
+PURGE_CURSOR_STORAGE_VERSION = 1
+
 
 class Recorder(threading.Thread):
     """A threaded recorder class."""
@@ -179,6 +187,9 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
+        adaptive_purge: bool = False,
+        partitioned_short_term_statistics: bool = False,
+        archive_states: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -188,6 +199,19 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        # Only set when purging in adaptive mode
+        self.purge_progress: PurgeProgress | None = (
+            PurgeProgress() if adaptive_purge else None
+        )
+        self._purge_cursor_store: Store[dict[str, Any]] = Store(
+            hass, PURGE_CURSOR_STORAGE_VERSION, PURGE_CURSOR_STORAGE_KEY
+        )
+        # Partition short term statistics by time, only supported by PostgreSQL
+        self.partitioned_short_term_statistics = partitioned_short_term_statistics
+        # Archive states before they are purged, read back by history queries
+        self.states_archive: StatesArchive | None = (
+            StatesArchive(hass.config.path(ARCHIVE_DIR)) if archive_states else None
+        )
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
@@ -225,6 +249,7 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.write_metrics = WriteMetrics()
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -257,6 +282,17 @@ class Recorder(threading.Thread):
         """Return the number of items in the recorder backlog."""
         return self._queue.qsize()
 
+    def get_write_metrics(self) -> dict[str, Any]:
+        """Return the write path metrics and the cache hit rates of the table managers."""
+        return self.write_metrics.as_dict() | {
+            "caches": {
+                "event_data": self.event_data_manager.cache_stats(),
+                "event_types": self.event_type_manager.cache_stats(),
+                "state_attributes": self.state_attributes_manager.cache_stats(),
+                "states_meta": self.states_meta_manager.cache_stats(),
+            }
+        }
+
     @property
     def dialect_name(self) -> SupportedDialect | None:
         """Return the dialect the recorder uses."""
@@ -532,10 +568,47 @@ class Recorder(threading.Thread):
         """
         self._async_setup_periodic_tasks()
         self.async_recorder_ready.set()
+        if self.purge_progress:
+            self.hass.async_create_task(
+                self._async_resume_purge(), "recorder resume purge"
+            )
+
+    async def _async_resume_purge(self) -> None:
+        """Resume an adaptive purge that was interrupted by a restart."""
+        if not (cursor := await self._purge_cursor_store.async_load()):
+            return
+        if self.hass.is_stopping or not (
+            purge_before := dt_util.parse_datetime(cursor["purge_before"])
+        ):
+            return
+        _LOGGER.info(
+            "Resuming interrupted purge of data before %s",
+            purge_before.isoformat(sep=" ", timespec="seconds"),
+        )
+        self.queue_task(
+            PurgeTask(
+                purge_before,
+                repack=cursor["repack"],
+                apply_filter=cursor["apply_filter"],
+            )
+        )
+
+    @callback
+    def _async_save_purge_cursor(self, cursor: dict[str, Any]) -> None:
+        """Persist the cursor of the running purge."""
+        self._purge_cursor_store.async_delay_save(lambda: cursor)
+
+    def save_purge_cursor_threadsafe(self, cursor: dict[str, Any] | None) -> None:
+        """Persist the cursor of the running purge from the recorder thread.
+
+        A finished purge is persisted as an empty cursor.
+        """
+        self.hass.add_job(self._async_save_purge_cursor, cursor or {})
 
     @callback
     def async_nightly_tasks(self, now: datetime) -> None:
         """Trigger the purge."""
+        self._schedule_partition_short_term_statistics()
         if self.auto_purge:
             # Purge will schedule the periodic cleanups
             # after it completes to ensure it does not happen
@@ -774,6 +847,7 @@ class Recorder(threading.Thread):
         if not database_was_ready:
             self._activate_and_set_db_ready()
 
+        self._schedule_partition_short_term_statistics()
         # Catch up with missed statistics
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
@@ -896,6 +970,10 @@ class Recorder(threading.Thread):
 
         assert self.event_session is not None
         session = self.event_session
+        # Warm the caches with the data of the newest rows since
+        # it is most likely to be seen again right after startup
+        self.event_data_manager.load_newest(session)
+        self.state_attributes_manager.load_newest(session)
         self.event_data_manager.load(non_state_change_events, session)
         self.event_type_manager.load(non_state_change_events, session)
         self.states_meta_manager.load(state_change_events, session)
@@ -927,7 +1005,13 @@ class Recorder(threading.Thread):
                 assert isinstance(task, RecorderTask)
             if task.commit_before:
                 self._commit_event_session_or_retry()
-            return task.run(self)
+            start = time.monotonic()
+            try:
+                return task.run(self)
+            finally:
+                self.write_metrics.task_finished(
+                    type(task).__name__, time.monotonic() - start
+                )
         except exc.DatabaseError as err:
             if self._handle_database_error(err):
                 return
@@ -1043,6 +1127,7 @@ class Recorder(threading.Thread):
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
+        self.write_metrics.event_processed(event.time_fired_timestamp)
         # Commit if the commit interval is zero
         if not self.commit_interval:
             self._commit_event_session_or_retry()
@@ -1203,7 +1288,17 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        # Flush and commit separately to tell the time spent
+        # writing the rows apart from the time the database
+        # needs to make the transaction durable
+        new_rows = list(session.new)
+        start = time.monotonic()
+        session.flush()
+        flushed = time.monotonic()
         session.commit()
+        self.write_metrics.committed(
+            new_rows, flushed - start, time.monotonic() - flushed
+        )
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
@@ -1235,6 +1330,7 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self.write_metrics.discard_pending()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1287,6 +1383,10 @@ class Recorder(threading.Thread):
         """Post migrate entity_ids if needed."""
         return migration.post_migrate_entity_ids(self)
 
+    def _partition_short_term_statistics(self) -> bool:
+        """Partition short term statistics if needed."""
+        return migration.partition_short_term_statistics(self)
+
     def _cleanup_legacy_states_event_ids(self) -> bool:
         """Cleanup legacy event_ids if needed."""
         return migration.cleanup_legacy_states_event_ids(self)
@@ -1445,6 +1545,19 @@ class Recorder(threading.Thread):
 
         self._open_event_session()
 
+    def _schedule_partition_short_term_statistics(self) -> None:
+        """Add a task to partition short term statistics if enabled."""
+        if not self.partitioned_short_term_statistics:
+            return
+        if self.dialect_name != SupportedDialect.POSTGRESQL:
+            _LOGGER.warning(
+                "Partitioned short term statistics are only supported "
+                "with PostgreSQL, ignoring the option"
+            )
+            self.partitioned_short_term_statistics = False
+            return
+        self.queue_task(ShortTermStatisticsPartitionTask())
+
     def _schedule_compile_missing_statistics(self) -> None:
         """Add tasks for missing statistics runs."""
         self.queue_task(CompileMissingStatisticsTask())
@@ -12,6 +12,8 @@ from homeassistant.core import HomeAssistant, State
 
 from ... import recorder
 from ..filters import Filters
+from .archive import merge_archived_states
+from .batch import async_state_changes_during_period
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
@@ -25,6 +27,7 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "async_state_changes_during_period",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
@@ -53,16 +56,25 @@ def get_full_significant_states_with_session(
         _target = _legacy_get_full_significant_states_with_session
     else:
         _target = _modern_get_full_significant_states_with_session
-    return _target(
+    return merge_archived_states(
         hass,
-        session,
+        _target(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        ),
         start_time,
         end_time,
         entity_ids,
-        filters,
         include_start_time_state,
-        significant_changes_only,
-        no_attributes,
+        no_attributes=no_attributes,
+        significant_changes_only=significant_changes_only,
     )
 
 
@@ -102,17 +114,28 @@ def get_significant_states(
         _target = _legacy_get_significant_states
     else:
         _target = _modern_get_significant_states
-    return _target(
+    return merge_archived_states(
         hass,
+        _target(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        ),
         start_time,
         end_time,
         entity_ids,
-        filters,
         include_start_time_state,
-        significant_changes_only,
         minimal_response,
-        no_attributes,
         compressed_state_format,
+        no_attributes,
+        significant_changes_only=significant_changes_only,
     )
 
 
@@ -138,18 +161,29 @@ def get_significant_states_with_session(
         _target = _legacy_get_significant_states_with_session
     else:
         _target = _modern_get_significant_states_with_session
-    return _target(
+    return merge_archived_states(
         hass,
-        session,
+        _target(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        ),
         start_time,
         end_time,
         entity_ids,
-        filters,
         include_start_time_state,
-        significant_changes_only,
         minimal_response,
-        no_attributes,
         compressed_state_format,
+        no_attributes,
+        significant_changes_only=significant_changes_only,
     )
 
 
@@ -172,13 +206,24 @@ def state_changes_during_period(
         _target = _legacy_state_changes_during_period
     else:
         _target = _modern_state_changes_during_period
-    return _target(
+    return merge_archived_states(
         hass,
+        _target(
+            hass,
+            start_time,
+            end_time,
+            entity_id,
+            no_attributes,
+            descending,
+            limit,
+            include_start_time_state,
+        ),
         start_time,
         end_time,
-        entity_id,
-        no_attributes,
-        descending,
-        limit,
+        [entity_id.lower()] if entity_id else None,
         include_start_time_state,
+        no_attributes=no_attributes,
+        descending=descending,
+        limit=limit,
+        state_changes_only=True,
     )
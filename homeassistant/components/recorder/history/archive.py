@@ -0,0 +1,182 @@
+"""Merge archived states into history results."""
+
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from datetime import datetime
+from typing import Any
+
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
+from homeassistant.core import HomeAssistant, State, split_entity_id
+import homeassistant.util.dt as dt_util
+
+from ... import recorder
+from ..archive import ArchivedState, StatesArchive
+from .const import (
+    LAST_CHANGED_KEY,
+    NEED_ATTRIBUTE_DOMAINS,
+    SIGNIFICANT_DOMAINS,
+    STATE_KEY,
+)
+
+
+def _item_timestamp(item: State | dict[str, Any]) -> float:
+    """Return the last_updated timestamp of a history item."""
+    if isinstance(item, State):
+        return item.last_updated_timestamp
+    if COMPRESSED_STATE_LAST_UPDATED in item:
+        return item[COMPRESSED_STATE_LAST_UPDATED]  # type: ignore[no-any-return]
+    return dt_util.parse_datetime(item[LAST_CHANGED_KEY]).timestamp()  # type: ignore[union-attr]
+
+
+def _archived_to_items(
+    entity_id: str,
+    archived: list[ArchivedState],
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+) -> list[State | dict[str, Any]]:
+    """Convert archived states to the format of the history results."""
+    items: list[State | dict[str, Any]] = []
+    full = not minimal_response or split_entity_id(entity_id)[0] in (
+        NEED_ATTRIBUTE_DOMAINS
+    )
+    prev_state: str | None = None
+    for last_updated_ts, last_changed_ts, state in archived:
+        if not full and items:
+            # With minimal response only the first state is complete
+            # and repeated states are filtered out
+            if state == prev_state:
+                continue
+            prev_state = state
+            if compressed_state_format:
+                items.append(
+                    {
+                        COMPRESSED_STATE_STATE: state,
+                        COMPRESSED_STATE_LAST_UPDATED: last_updated_ts,
+                    }
+                )
+            else:
+                items.append(
+                    {
+                        STATE_KEY: state,
+                        LAST_CHANGED_KEY: dt_util.utc_from_timestamp(
+                            last_updated_ts
+                        ).isoformat(),
+                    }
+                )
+            continue
+        prev_state = state
+        if compressed_state_format:
+            comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: state}
+            if not no_attributes:
+                # Attributes are not archived
+                comp_state[COMPRESSED_STATE_ATTRIBUTES] = {}
+            comp_state[COMPRESSED_STATE_LAST_UPDATED] = last_updated_ts
+            if last_changed_ts != last_updated_ts:
+                comp_state[COMPRESSED_STATE_LAST_CHANGED] = last_changed_ts
+            items.append(comp_state)
+        else:
+            items.append(
+                State(
+                    entity_id,
+                    state,
+                    last_changed=dt_util.utc_from_timestamp(last_changed_ts),
+                    last_updated=dt_util.utc_from_timestamp(last_updated_ts),
+                    validate_entity_id=False,
+                )
+            )
+    return items
+
+
+def merge_archived_states(
+    hass: HomeAssistant,
+    result: MutableMapping[str, list[Any]],
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool = True,
+    minimal_response: bool = False,
+    compressed_state_format: bool = False,
+    no_attributes: bool = False,
+    descending: bool = False,
+    limit: int | None = None,
+    significant_changes_only: bool = False,
+    state_changes_only: bool = False,
+) -> MutableMapping[str, list[Any]]:
+    """Add states purged to the archive to history results.
+
+    The archive only contains states older than the ones in the
+    database, so archived states are only looked up from start_time
+    up to the oldest state the database returned for each entity.
+    Only explicitly requested entities are looked up.
+
+    Like the database queries, state_changes_only leaves out states
+    where only the attributes changed, and significant_changes_only
+    does the same for entities outside of the significant domains.
+    """
+    archive: StatesArchive | None = recorder.get_instance(hass).states_archive
+    if archive is None or not entity_ids:
+        return result
+    start_time_ts = start_time.timestamp()
+    end_time_ts = end_time.timestamp() if end_time else None
+    merged: dict[str, list[Any]] = {}
+    for entity_id in entity_ids:
+        db_items = result.get(entity_id, [])
+        # The database limits the results to the oldest states
+        # even when they are returned in descending order
+        if descending:
+            db_items = db_items[::-1]
+        if db_items:
+            boundary_ts: float | None = _item_timestamp(db_items[0])
+        else:
+            boundary_ts = end_time_ts
+        archived: list[ArchivedState] = []
+        if boundary_ts is None or boundary_ts > start_time_ts:
+            archived = archive.states_during_period(
+                entity_id, start_time_ts, boundary_ts
+            )
+            if state_changes_only or (
+                significant_changes_only
+                and split_entity_id(entity_id)[0] not in SIGNIFICANT_DOMAINS
+            ):
+                archived = [
+                    archived_state
+                    for archived_state in archived
+                    if archived_state[0] == archived_state[1]
+                ]
+            if include_start_time_state and (
+                not archived or archived[0][0] > start_time_ts
+            ):
+                if before := archive.state_before(entity_id, start_time_ts):
+                    # Same as the database, the state at the start
+                    # time is reported as changed at the start time
+                    archived.insert(0, (start_time_ts, start_time_ts, before[2]))
+        ent_results = (
+            _archived_to_items(
+                entity_id,
+                archived,
+                minimal_response,
+                compressed_state_format,
+                no_attributes,
+            )
+            + db_items
+        )
+        if limit is not None:
+            ent_results = ent_results[:limit]
+        if descending:
+            ent_results.reverse()
+        if ent_results:
+            merged[entity_id] = ent_results
+    # Keep results of entities which were not requested explicitly
+    merged.update(
+        (entity_id, ent_results)
+        for entity_id, ent_results in result.items()
+        if entity_id not in merged
+    )
+    return merged
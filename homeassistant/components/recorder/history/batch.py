@@ -0,0 +1,209 @@
+"""Coalesce concurrent state changes requests into multi-entity queries.
+
+At startup many history backed sensors each ask for the recent state
+changes of their source entity. Requests which arrive while the event
+loop is busy setting up the sensors, or while a previous batch is still
+being queried, are grouped by their query options and answered with one
+query per group instead of one query per sensor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+
+from homeassistant.core import HomeAssistant, State
+
+from ... import recorder
+from .archive import merge_archived_states
+from .modern import state_changes_during_period_for_entities
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATE_CHANGES_BATCHER = "recorder_history_state_changes_batcher"
+
+# end_time, no_attributes, limit, include_start_time_state and the start
+# time when the state at the start time is included since it is looked up
+# for all entities of a query at once
+_BatchKey = tuple[datetime | None, bool, int | None, bool, datetime | None]
+
+
+@dataclass(slots=True)
+class _StateChangesRequest:
+    """A pending request for the state changes of an entity."""
+
+    entity_id: str
+    start_time: datetime
+    future: asyncio.Future[list[State]] = field(repr=False)
+
+
+class StateChangesBatcher:
+    """Batch state changes requests of many entities."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the batcher."""
+        self.hass = hass
+        self.requests = 0
+        self.queries = 0
+        self._pending: defaultdict[_BatchKey, list[_StateChangesRequest]] = defaultdict(
+            list
+        )
+        self._task: asyncio.Task[None] | None = None
+
+    async def async_state_changes_during_period(
+        self,
+        start_time: datetime,
+        end_time: datetime | None,
+        entity_id: str,
+        no_attributes: bool,
+        descending: bool,
+        limit: int | None,
+        include_start_time_state: bool,
+    ) -> list[State]:
+        """Return the state changes of an entity once its batch is queried."""
+        key: _BatchKey = (
+            end_time,
+            no_attributes,
+            limit,
+            include_start_time_state,
+            start_time if include_start_time_state else None,
+        )
+        future: asyncio.Future[list[State]] = self.hass.loop.create_future()
+        self._pending[key].append(
+            _StateChangesRequest(entity_id.lower(), start_time, future)
+        )
+        self.requests += 1
+        if self._task is None:
+            # The task only starts on the next iteration of the event
+            # loop, which lets the other requests made by the same
+            # burst of sensor setups join the batch
+            self._task = self.hass.async_create_task(
+                self._async_process_pending(), "recorder history batch"
+            )
+        states = await future
+        return states[::-1] if descending else states
+
+    async def _async_process_pending(self) -> None:
+        """Query the pending requests until there are none left."""
+        instance = recorder.get_instance(self.hass)
+        try:
+            while self._pending:
+                pending = self._pending
+                self._pending = defaultdict(list)
+                for key, requests in pending.items():
+                    for batch in _split_duplicate_entities(requests):
+                        try:
+                            results = await instance.async_add_executor_job(
+                                self._state_changes_for_batch, key, batch
+                            )
+                        except Exception as err:  # pylint: disable=broad-except
+                            for request in batch:
+                                if not request.future.done():
+                                    request.future.set_exception(err)
+                            continue
+                        for request, states in zip(batch, results, strict=True):
+                            if not request.future.done():
+                                request.future.set_result(states)
+        finally:
+            self._task = None
+
+    def _state_changes_for_batch(
+        self, key: _BatchKey, batch: list[_StateChangesRequest]
+    ) -> list[list[State]]:
+        """Query the state changes of a batch of requests of distinct entities."""
+        # pylint: disable-next=import-outside-toplevel
+        from . import state_changes_during_period
+
+        end_time, no_attributes, limit, include_start_time_state, _ = key
+        self.queries += 1
+        if len(batch) == 1 or not (
+            recorder.get_instance(self.hass).states_meta_manager.active
+        ):
+            return [
+                state_changes_during_period(
+                    self.hass,
+                    request.start_time,
+                    end_time,
+                    request.entity_id,
+                    no_attributes,
+                    False,
+                    limit,
+                    include_start_time_state,
+                ).get(request.entity_id, [])
+                for request in batch
+            ]
+        _LOGGER.debug("Querying the state changes of %s entities", len(batch))
+        results = state_changes_during_period_for_entities(
+            self.hass,
+            {request.entity_id: request.start_time for request in batch},
+            end_time,
+            no_attributes,
+            limit,
+            include_start_time_state,
+        )
+        return [
+            merge_archived_states(
+                self.hass,
+                {request.entity_id: results.get(request.entity_id, [])},
+                request.start_time,
+                end_time,
+                [request.entity_id],
+                include_start_time_state,
+                no_attributes=no_attributes,
+                limit=limit,
+                state_changes_only=True,
+            ).get(request.entity_id, [])
+            for request in batch
+        ]
+
+
+def _split_duplicate_entities(
+    requests: list[_StateChangesRequest],
+) -> list[list[_StateChangesRequest]]:
+    """Split requests into batches which only contain each entity once."""
+    batches: list[list[_StateChangesRequest]] = []
+    entity_ids_by_batch: list[set[str]] = []
+    for request in requests:
+        for batch, entity_ids in zip(batches, entity_ids_by_batch, strict=True):
+            if request.entity_id not in entity_ids:
+                batch.append(request)
+                entity_ids.add(request.entity_id)
+                break
+        else:
+            batches.append([request])
+            entity_ids_by_batch.append({request.entity_id})
+    return batches
+
+
+async def async_state_changes_during_period(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_id: str | None = None,
+    no_attributes: bool = False,
+    descending: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> list[State]:
+    """Return the state changes of an entity during a period.
+
+    This is the batched equivalent of state_changes_during_period for
+    callers which need the history of a single entity and may run
+    concurrently with many others, for example when sensors are set up.
+    """
+    if not entity_id:
+        raise ValueError("entity_id must be provided")
+    if (batcher := hass.data.get(DATA_STATE_CHANGES_BATCHER)) is None:
+        batcher = hass.data[DATA_STATE_CHANGES_BATCHER] = StateChangesBatcher(hass)
+    return await batcher.async_state_changes_during_period(
+        start_time,
+        end_time,
+        entity_id,
+        no_attributes,
+        descending,
+        limit,
+        include_start_time_state,
+    )
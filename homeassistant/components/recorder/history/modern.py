@@ -9,6 +9,7 @@ from operator import itemgetter
 from typing import Any, cast
 
 from sqlalchemy import (
+    ColumnElement,
     CompoundSelect,
     Select,
     Subquery,
@@ -16,6 +17,7 @@ from sqlalchemy import (
     func,
     lambda_stmt,
     literal,
+    or_,
     select,
     union_all,
 )
@@ -425,6 +427,140 @@ def state_changes_during_period(
         )
 
 
+def _state_changes_during_period_for_entities_stmt(
+    start_time_ts_by_metadata_id: dict[int, float],
+    end_time_ts: float | None,
+    no_attributes: bool,
+    limit: int | None,
+    include_start_time_state: bool,
+    run_start_ts: float | None,
+) -> Select:
+    """Return the statement to find the state changes of many entities.
+
+    Each entity may start at a different time, which is only
+    supported without the state at the start time.
+    """
+    metadata_ids = list(start_time_ts_by_metadata_id)
+    period_filter: ColumnElement[bool]
+    if len(start_time_ts := set(start_time_ts_by_metadata_id.values())) == 1:
+        period_filter = States.metadata_id.in_(metadata_ids) & (
+            States.last_updated_ts > next(iter(start_time_ts))
+        )
+    else:
+        period_filter = or_(
+            *(
+                (States.metadata_id == metadata_id)
+                & (States.last_updated_ts > entity_start_time_ts)
+                for metadata_id, entity_start_time_ts in (
+                    start_time_ts_by_metadata_id.items()
+                )
+            )
+        )
+    stmt = _stmt_and_join_attributes(no_attributes, False).filter(
+        (
+            (States.last_changed_ts == States.last_updated_ts)
+            | States.last_changed_ts.is_(None)
+        )
+        & period_filter
+    )
+    if end_time_ts:
+        stmt = stmt.filter(States.last_updated_ts < end_time_ts)
+    if not no_attributes:
+        stmt = stmt.outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+    if limit:
+        # Limit the number of states of each entity
+        # instead of the number of states in total
+        numbered_subquery = stmt.add_columns(
+            func.row_number()
+            .over(partition_by=States.metadata_id, order_by=States.last_updated_ts)
+            .label("row_number")
+        ).subquery()
+        stmt = _select_from_subquery(numbered_subquery, no_attributes, False).filter(
+            numbered_subquery.c.row_number <= limit
+        )
+    if include_start_time_state and run_start_ts:
+        subquery = union_all(
+            _select_from_subquery(
+                _get_start_time_state_for_entities_stmt(
+                    run_start_ts,
+                    next(iter(start_time_ts)),
+                    metadata_ids,
+                    no_attributes,
+                    False,
+                ).subquery(),
+                no_attributes,
+                False,
+            ),
+            _select_from_subquery(stmt.subquery(), no_attributes, False),
+        ).subquery()
+    else:
+        subquery = stmt.subquery()
+    return _select_from_subquery(subquery, no_attributes, False).order_by(
+        subquery.c.metadata_id, subquery.c.last_updated_ts
+    )
+
+
+def state_changes_during_period_for_entities(
+    hass: HomeAssistant,
+    start_times: dict[str, datetime],
+    end_time: datetime | None = None,
+    no_attributes: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> MutableMapping[str, list[State]]:
+    """Return the state changes of many entities with a single query.
+
+    start_times maps each entity_id to the start of its period. The
+    results are the same as calling state_changes_during_period for
+    each entity, which limits the number of states per entity.
+    include_start_time_state requires all entities to start at the
+    same time.
+    """
+    if include_start_time_state and len(set(start_times.values())) > 1:
+        raise ValueError("start_times must be equal to include the start time state")
+    entity_ids = list(start_times)
+    with session_scope(hass=hass, read_only=True) as session:
+        instance = recorder.get_instance(hass)
+        entity_id_to_metadata_id = instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        )
+        start_time_ts_by_metadata_id = {
+            metadata_id: start_times[entity_id].timestamp()
+            for entity_id, metadata_id in entity_id_to_metadata_id.items()
+            if metadata_id is not None
+        }
+        if not start_time_ts_by_metadata_id:
+            return {}
+        start_time = min(start_times.values())
+        run_start_ts: float | None = None
+        if include_start_time_state and not (
+            run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+        ):
+            include_start_time_state = False
+        stmt = _state_changes_during_period_for_entities_stmt(
+            start_time_ts_by_metadata_id,
+            datetime_to_timestamp_or_none(end_time),
+            no_attributes,
+            limit,
+            include_start_time_state,
+            run_start_ts,
+        )
+        return cast(
+            MutableMapping[str, list[State]],
+            _sorted_states_to_dict(
+                session.connection().execute(stmt).all(),
+                dt_util.utc_to_timestamp(start_time)
+                if include_start_time_state
+                else None,
+                entity_ids,
+                entity_id_to_metadata_id,
+                no_attributes=no_attributes,
+            ),
+        )
+
+
 def _get_last_state_changes_single_stmt(metadata_id: int) -> Select:
     return (
         _stmt_and_join_attributes(False, False)
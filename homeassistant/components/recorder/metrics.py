@@ -0,0 +1,152 @@
+"""Instrumentation of the recorder write path.
+
+All counters are updated from the recorder thread and are cheap enough
+to always be enabled. They are read from the event loop, which only
+needs a consistent enough view to size hardware and to tell whether
+the time is spent in the database or in Python.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+import time
+from typing import Any
+
+# Upper bounds of the event to commit latency histogram buckets
+# in milliseconds, the last bucket holds everything slower
+LATENCY_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+_LATENCY_BUCKETS_S = tuple(bucket / 1000 for bucket in LATENCY_BUCKETS_MS)
+
+
+@dataclass(slots=True)
+class TaskTiming:
+    """Execution times of a recorder task class."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, duration: float) -> None:
+        """Add an execution time."""
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timing as a dict with times in milliseconds."""
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count * 1000, 3) if self.count else None,
+            "max": round(self.max * 1000, 3),
+        }
+
+
+class WriteMetrics:
+    """Collect metrics about the commits of the recorder."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.commits = 0
+        self.rows_written: Counter[str] = Counter()
+        self.last_commit_rows: dict[str, int] = {}
+        self.last_flush_duration: float | None = None
+        self.last_commit_duration: float | None = None
+        self.total_flush_duration = 0.0
+        self.total_commit_duration = 0.0
+        self.max_commit_duration = 0.0
+        self.latency_histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.task_timings: dict[str, TaskTiming] = {}
+        self._pending_fired_timestamps: list[float] = []
+
+    def event_processed(self, time_fired_ts: float) -> None:
+        """Track an event which will be written at the next commit."""
+        self._pending_fired_timestamps.append(time_fired_ts)
+
+    def committed(
+        self,
+        new_rows: Iterable[Any],
+        flush_duration: float,
+        commit_duration: float,
+    ) -> None:
+        """Record a successful commit of new_rows."""
+        rows = Counter(row.__tablename__ for row in new_rows)
+        self.commits += 1
+        self.rows_written.update(rows)
+        self.last_commit_rows = dict(rows)
+        self.last_flush_duration = flush_duration
+        self.last_commit_duration = commit_duration
+        self.total_flush_duration += flush_duration
+        self.total_commit_duration += commit_duration
+        self.max_commit_duration = max(
+            self.max_commit_duration, flush_duration + commit_duration
+        )
+        now = time.time()
+        histogram = self.latency_histogram
+        for time_fired_ts in self._pending_fired_timestamps:
+            histogram[bisect_left(_LATENCY_BUCKETS_S, now - time_fired_ts)] += 1
+        self._pending_fired_timestamps.clear()
+
+    def discard_pending(self) -> None:
+        """Forget the tracked events after the session was rolled back."""
+        self._pending_fired_timestamps.clear()
+
+    def task_finished(self, task_name: str, duration: float) -> None:
+        """Record the execution time of a task."""
+        if (timing := self.task_timings.get(task_name)) is None:
+            timing = self.task_timings[task_name] = TaskTiming()
+        timing.add(duration)
+
+    def latency_percentile(self, percentile: float) -> int | None:
+        """Return the upper bound in milliseconds of the latency percentile.
+
+        Returns None if no events were committed yet or the
+        percentile falls in the unbounded bucket.
+        """
+        if not (total := sum(self.latency_histogram)):
+            return None
+        threshold = total * percentile
+        seen = 0
+        for upper_bound, count in zip(
+            LATENCY_BUCKETS_MS, self.latency_histogram, strict=False
+        ):
+            seen += count
+            if seen >= threshold:
+                return upper_bound
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dict with durations in milliseconds."""
+        commits = self.commits
+        return {
+            "commits": commits,
+            "rows_written": self.rows_written.copy(),
+            "last_commit_rows": self.last_commit_rows,
+            "last_flush_duration": duration_ms(self.last_flush_duration),
+            "last_commit_duration": duration_ms(self.last_commit_duration),
+            "mean_flush_duration": (
+                duration_ms(self.total_flush_duration / commits) if commits else None
+            ),
+            "mean_commit_duration": (
+                duration_ms(self.total_commit_duration / commits) if commits else None
+            ),
+            "max_commit_duration": duration_ms(self.max_commit_duration),
+            "event_to_commit_latency": {
+                "buckets": [*LATENCY_BUCKETS_MS, None],
+                "counts": self.latency_histogram.copy(),
+                "p50": self.latency_percentile(0.5),
+                "p95": self.latency_percentile(0.95),
+            },
+            "tasks": {
+                name: timing.as_dict()
+                for name, timing in self.task_timings.copy().items()
+            },
+        }
+
+
+def duration_ms(duration: float | None) -> float | None:
+    """Convert a duration in seconds to milliseconds."""
+    return None if duration is None else round(duration * 1000, 3)
@@ -27,6 +27,7 @@ from sqlalchemy.schema import AddConstraint, DropConstraint
 from sqlalchemy.sql.expression import true
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
 
@@ -70,6 +71,13 @@ from .db_schema import (
 )
 from .models import process_timestamp
 from .models.time import datetime_to_timestamp_or_none
+from .partition import (
+    PARTITION_INTERVAL,
+    PARTITIONS_AHEAD,
+    convert_to_partitioned,
+    create_partitions,
+    is_partitioned,
+)
 from .queries import (
     batch_cleanup_entity_ids,
     delete_duplicate_short_term_statistics_row,
@@ -1719,6 +1727,28 @@ def cleanup_legacy_states_event_ids(instance: Recorder) -> bool:
     return True
 
 
+@retryable_database_job("partition_short_term_statistics")
+def partition_short_term_statistics(instance: Recorder) -> bool:
+    """Partition the short term statistics table by time.
+
+    Converts an existing unpartitioned table on the first run and
+    makes sure partitions exist ahead of time on every run.
+    """
+    if instance.dialect_name != SupportedDialect.POSTGRESQL:
+        return True
+    with session_scope(session=instance.get_session()) as session:
+        if not is_partitioned(session):
+            _LOGGER.warning(
+                "Converting the statistics_short_term table to a partitioned "
+                "table; this may take a while for large databases"
+            )
+            convert_to_partitioned(session)
+        else:
+            now = dt_util.utcnow()
+            create_partitions(session, now, now + PARTITION_INTERVAL * PARTITIONS_AHEAD)
+    return True
+
+
 def _initialize_database(session: Session) -> bool:
     """Initialize a new database.
 
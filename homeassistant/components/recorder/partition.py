@@ -0,0 +1,188 @@
+"""Time range partitioning of the short term statistics table.
+
+Short term statistics are written for every statistic every 5 minutes
+and are purged by age, which makes them a good fit for PostgreSQL
+declarative range partitioning on start_ts: purging becomes dropping
+whole daily partitions instead of issuing large DELETE statements.
+
+The states table cannot be partitioned since PostgreSQL requires
+the partition key to be part of every unique constraint, which
+conflicts with the old_state_id self reference. The long term
+statistics table is never purged so it would not benefit.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.orm.session import Session
+
+from homeassistant.util import dt as dt_util
+
+from .db_schema import TABLE_STATISTICS_SHORT_TERM
+
+_LOGGER = logging.getLogger(__name__)
+
+PARTITION_INTERVAL = timedelta(days=1)
+# Number of partitions created ahead of time so
+# rows never end up in the default partition
+PARTITIONS_AHEAD = 3
+
+UNPARTITIONED_TABLE = f"{TABLE_STATISTICS_SHORT_TERM}_unpartitioned"
+DEFAULT_PARTITION = f"{TABLE_STATISTICS_SHORT_TERM}_default"
+PARTITION_PREFIX = f"{TABLE_STATISTICS_SHORT_TERM}_p"
+PARTITION_NAME_FORMAT = "%Y%m%d"
+
+_INDEXES = {
+    "ix_statistics_short_term_statistic_id_start_ts": (
+        "CREATE UNIQUE INDEX {name} ON {table} (metadata_id, start_ts)"
+    ),
+    "ix_statistics_short_term_start_ts": "CREATE INDEX {name} ON {table} (start_ts)",
+}
+
+
+def partition_start(when: datetime) -> datetime:
+    """Return the start of the partition containing when."""
+    return dt_util.as_utc(when).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def partition_name(start: datetime) -> str:
+    """Return the name of the partition starting at start."""
+    return f"{PARTITION_PREFIX}{start.strftime(PARTITION_NAME_FORMAT)}"
+
+
+def partition_range(name: str) -> tuple[datetime, datetime] | None:
+    """Return the range covered by a partition or None if it is not a range partition."""
+    if not name.startswith(PARTITION_PREFIX):
+        return None
+    try:
+        start = datetime.strptime(
+            name.removeprefix(PARTITION_PREFIX), PARTITION_NAME_FORMAT
+        ).replace(tzinfo=dt_util.UTC)
+    except ValueError:
+        return None
+    return start, start + PARTITION_INTERVAL
+
+
+def partition_starts(first: datetime, last: datetime) -> list[datetime]:
+    """Return the starts of the partitions needed to cover first to last."""
+    start = partition_start(first)
+    starts: list[datetime] = []
+    while start <= last:
+        starts.append(start)
+        start += PARTITION_INTERVAL
+    return starts
+
+
+def is_partitioned(session: Session) -> bool:
+    """Return if the short term statistics table is partitioned."""
+    return (
+        session.execute(
+            text("SELECT relkind FROM pg_class WHERE relname = :table"),
+            {"table": TABLE_STATISTICS_SHORT_TERM},
+        ).scalar()
+        == "p"
+    )
+
+
+def get_partitions(session: Session) -> list[str]:
+    """Return the names of the partitions of the short term statistics table."""
+    return sorted(
+        name
+        for (name,) in session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": TABLE_STATISTICS_SHORT_TERM},
+        ).all()
+    )
+
+
+def _create_partition(session: Session, start: datetime) -> None:
+    """Create the partition starting at start."""
+    session.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(start)} "
+            f"PARTITION OF {TABLE_STATISTICS_SHORT_TERM} "
+            f"FOR VALUES FROM ({start.timestamp()}) "
+            f"TO ({(start + PARTITION_INTERVAL).timestamp()})"
+        )
+    )
+
+
+def create_partitions(session: Session, first: datetime, last: datetime) -> None:
+    """Create any missing partitions needed to cover first to last."""
+    existing = set(get_partitions(session))
+    for start in partition_starts(first, last):
+        if (name := partition_name(start)) not in existing:
+            _LOGGER.debug("Creating partition %s", name)
+            _create_partition(session, start)
+
+
+def drop_partitions_before(session: Session, purge_before: datetime) -> int:
+    """Drop all partitions which only contain rows older than purge_before.
+
+    Returns the number of dropped partitions.
+    """
+    dropped = 0
+    for name in get_partitions(session):
+        if (bounds := partition_range(name)) and bounds[1] <= purge_before:
+            _LOGGER.debug("Dropping partition %s", name)
+            session.execute(text(f"DROP TABLE {name}"))
+            dropped += 1
+    return dropped
+
+
+def convert_to_partitioned(session: Session) -> None:
+    """Convert the short term statistics table to a partitioned table.
+
+    The existing table is renamed, a partitioned table with the same
+    columns is created in its place and the rows are copied over.
+    """
+    table = TABLE_STATISTICS_SHORT_TERM
+    sequence = f"{table}_partitioned_id_seq"
+    oldest_ts, newest_ts = session.execute(
+        text(f"SELECT min(start_ts), max(start_ts) FROM {table}")  # noqa: S608
+    ).one()
+    statements = [
+        f"ALTER TABLE {table} RENAME TO {UNPARTITIONED_TABLE}",
+        f"ALTER TABLE {UNPARTITIONED_TABLE} RENAME CONSTRAINT {table}_pkey "
+        f"TO {UNPARTITIONED_TABLE}_pkey",
+        *(f"ALTER INDEX {name} RENAME TO {name}_unpartitioned" for name in _INDEXES),
+        f"CREATE TABLE {table} (LIKE {UNPARTITIONED_TABLE}) "
+        "PARTITION BY RANGE (start_ts)",
+        # Depending on the age of the database the id column of
+        # the old table is backed by a serial or an identity, which
+        # is dropped with it, so the new table gets its own sequence
+        f"CREATE SEQUENCE {sequence} OWNED BY {table}.id",
+        f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{sequence}')",
+        # The partition key must be part of the primary key
+        f"ALTER TABLE {table} ADD PRIMARY KEY (id, start_ts)",
+        f"ALTER TABLE {table} ADD FOREIGN KEY (metadata_id) "
+        "REFERENCES statistics_meta (id) ON DELETE CASCADE",
+        *(
+            statement.format(name=name, table=table)
+            for name, statement in _INDEXES.items()
+        ),
+        f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {table} DEFAULT",
+    ]
+    for statement in statements:
+        session.execute(text(statement))
+    now = dt_util.utcnow()
+    first = dt_util.utc_from_timestamp(oldest_ts) if oldest_ts is not None else now
+    last = max(
+        dt_util.utc_from_timestamp(newest_ts) if newest_ts is not None else now, now
+    )
+    create_partitions(session, first, last + PARTITION_INTERVAL * PARTITIONS_AHEAD)
+    for statement in (
+        f"INSERT INTO {table} SELECT * FROM {UNPARTITIONED_TABLE}",  # noqa: S608
+        f"SELECT setval('{sequence}', (SELECT coalesce(max(id), 0) + 1 "  # noqa: S608
+        f"FROM {table}), false)",
+        f"DROP TABLE {UNPARTITIONED_TABLE}",
+    ):
+        session.execute(text(statement))
@@ -7,12 +7,14 @@ from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
+from .const import SupportedDialect
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
+from .partition import drop_partitions_before
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
@@ -35,7 +37,9 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_state_ts,
     find_short_term_statistics_to_purge,
+    find_states_to_archive,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -51,6 +55,178 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# Adaptive purge sizes each purge cycle so it holds the
+# recorder thread for about this long before the task
+# is re-queued behind the pending writes
+ADAPTIVE_PURGE_TARGET_CYCLE_SECONDS = 1.0
+ADAPTIVE_PURGE_MIN_BATCHES = 1
+ADAPTIVE_PURGE_MAX_BATCHES = 200
+# Stop the current cycle early once this many
+# events or tasks are waiting in the recorder queue
+ADAPTIVE_PURGE_YIELD_BACKLOG = 100
+
+
+class PurgeProgress:
+    """Track an adaptive purge and size its batches by delete latency.
+
+    All mutations happen in the recorder thread; the values
+    are only read from the event loop for reporting.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the purge progress."""
+        self.states_batch_size = DEFAULT_STATES_BATCHES_PER_PURGE
+        self.events_batch_size = DEFAULT_EVENTS_BATCHES_PER_PURGE
+        self.purge_before: datetime | None = None
+        self.running = False
+        self.rows_purged = 0
+        self.batches = 0
+        self.cycles = 0
+        self.purge_seconds = 0.0
+        self.oldest_ts_at_start: float | None = None
+        self.oldest_ts: float | None = None
+
+    def start(self, purge_before: datetime, oldest_ts: float | None) -> None:
+        """Start tracking a new purge."""
+        self.purge_before = purge_before
+        self.running = True
+        self.rows_purged = 0
+        self.cycles = 0
+        self.purge_seconds = 0.0
+        self.oldest_ts_at_start = oldest_ts
+        self.oldest_ts = oldest_ts
+
+    def add_batch(self, rows: int) -> None:
+        """Record a batch of purged rows."""
+        self.batches += 1
+        self.rows_purged += rows
+
+    def should_yield(self, instance: Recorder) -> bool:
+        """Return if the current cycle should give way to pending writes."""
+        return instance.backlog >= ADAPTIVE_PURGE_YIELD_BACKLOG
+
+    def finish_cycle(
+        self, elapsed: float, oldest_ts: float | None, finished: bool
+    ) -> None:
+        """Record a finished purge cycle and resize the batches for the next one."""
+        self.cycles += 1
+        self.purge_seconds += elapsed
+        self.oldest_ts = oldest_ts
+        self.running = not finished
+        batches = self.batches
+        self.batches = 0
+        if not batches or elapsed <= 0:
+            return
+        # Extrapolate what a full cycle would have cost at the
+        # measured per batch latency in case the cycle yielded early
+        planned = self.states_batch_size + self.events_batch_size
+        factor = ADAPTIVE_PURGE_TARGET_CYCLE_SECONDS / (elapsed * planned / batches)
+        factor = min(max(factor, 0.5), 2.0)
+        self.states_batch_size = _clamp_batches(self.states_batch_size * factor)
+        self.events_batch_size = _clamp_batches(self.events_batch_size * factor)
+
+    @property
+    def rows_per_second(self) -> float | None:
+        """Return the purge throughput."""
+        if not self.purge_seconds:
+            return None
+        return self.rows_purged / self.purge_seconds
+
+    @property
+    def fraction_done(self) -> float | None:
+        """Estimate how much of the time range to purge has been purged."""
+        if (
+            self.purge_before is None
+            or (start_ts := self.oldest_ts_at_start) is None
+            or (end_ts := self.purge_before.timestamp()) <= start_ts
+        ):
+            return None
+        if self.oldest_ts is None:
+            return 1.0
+        return min(max((self.oldest_ts - start_ts) / (end_ts - start_ts), 0.0), 1.0)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dict."""
+        rows_remaining: int | None = None
+        seconds_remaining: float | None = None
+        if not self.running:
+            rows_remaining = 0
+            seconds_remaining = 0.0
+        elif fraction_done := self.fraction_done:
+            remaining = (1 - fraction_done) / fraction_done
+            rows_remaining = round(self.rows_purged * remaining)
+            seconds_remaining = self.purge_seconds * remaining
+        return {
+            "running": self.running,
+            "purge_before": self.purge_before,
+            "rows_purged": self.rows_purged,
+            "rows_per_second": self.rows_per_second,
+            "estimated_rows_remaining": rows_remaining,
+            "estimated_seconds_remaining": seconds_remaining,
+            "states_batch_size": self.states_batch_size,
+            "events_batch_size": self.events_batch_size,
+        }
+
+
+def _clamp_batches(batches: float) -> int:
+    """Clamp the number of batches per purge cycle."""
+    return min(
+        max(round(batches), ADAPTIVE_PURGE_MIN_BATCHES), ADAPTIVE_PURGE_MAX_BATCHES
+    )
+
+
+def purge_old_data_adaptive(
+    instance: Recorder,
+    progress: PurgeProgress,
+    purge_before: datetime,
+    repack: bool,
+    apply_filter: bool = False,
+) -> bool:
+    """Run one adaptively sized purge cycle.
+
+    The purge cursor is persisted when a new purge starts and
+    cleared when it finishes so an interrupted purge can be
+    resumed after a restart.
+    """
+    if not progress.running or progress.purge_before != purge_before:
+        progress.start(purge_before, _get_oldest_state_ts(instance))
+        instance.save_purge_cursor_threadsafe(
+            {
+                "purge_before": purge_before.isoformat(),
+                "repack": repack,
+                "apply_filter": apply_filter,
+            }
+        )
+    start = time.monotonic()
+    finished = purge_old_data(
+        instance,
+        purge_before,
+        repack,
+        apply_filter,
+        events_batch_size=progress.events_batch_size,
+        states_batch_size=progress.states_batch_size,
+        progress=progress,
+    )
+    elapsed = time.monotonic() - start
+    progress.finish_cycle(
+        elapsed, None if finished else _get_oldest_state_ts(instance), finished
+    )
+    _LOGGER.debug(
+        "Adaptive purge cycle took %.3fs; next cycle uses %s state and %s event batches",
+        elapsed,
+        progress.states_batch_size,
+        progress.events_batch_size,
+    )
+    if finished:
+        instance.save_purge_cursor_threadsafe(None)
+    return finished
+
+
+def _get_oldest_state_ts(instance: Recorder) -> float | None:
+    """Return the last_updated_ts of the oldest state."""
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        return session.execute(find_oldest_state_ts()).scalar()
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -60,10 +236,14 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    If progress is passed, purged rows are counted and the batch
+    loops stop early when writes are waiting in the recorder queue.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
@@ -85,10 +265,21 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, progress
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, progress
+            )
+
+        if (
+            instance.partitioned_short_term_statistics
+            and instance.dialect_name == SupportedDialect.POSTGRESQL
+        ):
+            # Drop whole partitions first, only the rows in the partition
+            # which contains purge_before are left to be deleted below
+            _LOGGER.debug(
+                "Dropped %s short term statistics partitions",
+                drop_partitions_before(session, purge_before),
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -176,6 +367,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -190,6 +382,7 @@ def _purge_states_and_attributes_ids(
     # max_bind_vars
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    states_archive = instance.states_archive
     for _ in range(states_batch_size):
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
             session, purge_before, max_bind_vars
@@ -197,9 +390,23 @@ def _purge_states_and_attributes_ids(
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
+        if states_archive:
+            states_archive.add(
+                session.execute(find_states_to_archive(state_ids)).tuples()
+            )
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
-
+        if progress:
+            progress.add_batch(len(state_ids))
+            if progress.should_yield(instance):
+                break
+
+    if states_archive:
+        # The archive is written before the deletes are committed
+        states_archive.flush()
+        if not has_remaining_state_ids_to_purge:
+            # The states of the days before purge_before are all archived
+            states_archive.compact(purge_before.timestamp())
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
@@ -213,6 +420,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -234,6 +442,10 @@ def _purge_events_and_data_ids(
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if progress:
+            progress.add_batch(len(event_ids))
+            if progress.should_yield(instance):
+                break
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
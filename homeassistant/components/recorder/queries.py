@@ -52,6 +52,42 @@ def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def get_newest_shared_attributes(limit: int) -> StatementLambdaElement:
+    """Load the shared attributes of the most recently recorded states."""
+    return lambda_stmt(
+        lambda: select(
+            StateAttributes.attributes_id, StateAttributes.shared_attrs
+        ).where(
+            StateAttributes.attributes_id.in_(
+                select(
+                    select(States.attributes_id)
+                    .order_by(States.state_id.desc())
+                    .limit(limit)
+                    .subquery()
+                    .c.attributes_id
+                )
+            )
+        )
+    )
+
+
+def get_newest_shared_event_datas(limit: int) -> StatementLambdaElement:
+    """Load the shared event data of the most recently recorded events."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id, EventData.shared_data).where(
+            EventData.data_id.in_(
+                select(
+                    select(Events.data_id)
+                    .order_by(Events.event_id.desc())
+                    .limit(limit)
+                    .subquery()
+                    .c.data_id
+                )
+            )
+        )
+    )
+
+
 def find_event_type_ids(event_types: Iterable[str]) -> StatementLambdaElement:
     """Find an event_type id by event_type."""
     return lambda_stmt(
@@ -635,6 +671,25 @@ def find_states_to_purge(
     )
 
 
+def find_states_to_archive(state_ids: Iterable[int]) -> StatementLambdaElement:
+    """Find the entity_id, state and timestamps of states to archive."""
+    return lambda_stmt(
+        lambda: select(
+            StatesMeta.entity_id,
+            States.state,
+            States.last_updated_ts,
+            States.last_changed_ts,
+        )
+        .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        .filter(States.state_id.in_(state_ids))
+    )
+
+
+def find_oldest_state_ts() -> StatementLambdaElement:
+    """Find the last_updated_ts of the oldest state."""
+    return lambda_stmt(lambda: select(func.min(States.last_updated_ts)))
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -0,0 +1,121 @@
+"""Sensors for the write path metrics of the recorder."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
+
+from .core import Recorder
+from .metrics import duration_ms
+from .util import get_instance
+
+SCAN_INTERVAL = timedelta(seconds=60)
+
+
+def _hit_rate(instance: Recorder) -> float | None:
+    """Return the hit rate of the state attributes cache in percent."""
+    hit_rate: float | None = instance.state_attributes_manager.cache_stats()["hit_rate"]
+    return None if hit_rate is None else round(hit_rate * 100, 1)
+
+
+@dataclass(frozen=True, kw_only=True)
+class RecorderSensorEntityDescription(SensorEntityDescription):
+    """Describes a recorder metrics sensor."""
+
+    value_fn: Callable[[Recorder], StateType]
+
+
+SENSORS: tuple[RecorderSensorEntityDescription, ...] = (
+    RecorderSensorEntityDescription(
+        key="backlog",
+        name="Recorder backlog",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda instance: instance.backlog,
+    ),
+    RecorderSensorEntityDescription(
+        key="rows_written",
+        name="Recorder rows written",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda instance: instance.write_metrics.rows_written.total(),
+    ),
+    RecorderSensorEntityDescription(
+        key="flush_duration",
+        name="Recorder flush duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda instance: duration_ms(
+            instance.write_metrics.last_flush_duration
+        ),
+    ),
+    RecorderSensorEntityDescription(
+        key="commit_duration",
+        name="Recorder commit duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda instance: duration_ms(
+            instance.write_metrics.last_commit_duration
+        ),
+    ),
+    RecorderSensorEntityDescription(
+        key="event_to_commit_latency_p95",
+        name="Recorder event to commit latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda instance: instance.write_metrics.latency_percentile(0.95),
+    ),
+    RecorderSensorEntityDescription(
+        key="state_attributes_cache_hit_rate",
+        name="Recorder state attributes cache hit rate",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_hit_rate,
+    ),
+)
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the recorder metrics sensors."""
+    if discovery_info is None:
+        return
+    instance = get_instance(hass)
+    async_add_entities(
+        RecorderMetricsSensor(instance, description) for description in SENSORS
+    )
+
+
+class RecorderMetricsSensor(SensorEntity):
+    """A sensor reporting a write path metric of the recorder."""
+
+    entity_description: RecorderSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self, instance: Recorder, description: RecorderSensorEntityDescription
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._attr_unique_id = f"recorder_{description.key}"
+        self._instance = instance
+
+    async def async_update(self) -> None:
+        """Update the sensor from the recorder metrics."""
+        self._attr_native_value = self.entity_description.value_fn(self._instance)
@@ -23,6 +23,7 @@ import voluptuous as vol
 from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
 from homeassistant.core import HomeAssistant, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import dispatcher_send
 from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.util import dt as dt_util
@@ -52,6 +53,7 @@ from .const import (
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
+    SIGNAL_STATISTICS_MODIFIED,
     SupportedDialect,
 )
 from .db_schema import (
@@ -720,10 +722,31 @@ def get_metadata(
         )
 
 
+def _statistics_modified(instance: Recorder, statistic_ids: Iterable[str]) -> None:
+    """Tell listeners the existing statistics of statistic_ids were modified."""
+    dispatcher_send(instance.hass, SIGNAL_STATISTICS_MODIFIED, set(statistic_ids))
+
+
+def get_last_statistics_run_end(hass: HomeAssistant) -> datetime | None:
+    """Return the end of the newest compiled statistics period, if any.
+
+    The statistics of the periods before it are complete, they only
+    change when they are imported or modified later.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        if last_run := session.query(func.max(StatisticsRuns.start)).scalar():
+            return cast(
+                datetime,
+                process_timestamp(last_run) + StatisticsShortTerm.duration,
+            )
+    return None
+
+
 def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    _statistics_modified(instance, statistic_ids)
 
 
 def update_statistics_metadata(
@@ -749,6 +772,12 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+    _statistics_modified(
+        instance,
+        (statistic_id, new_statistic_id)
+        if isinstance(new_statistic_id, str)
+        else (statistic_id,),
+    )
 
 
 async def async_list_statistic_ids(
@@ -2360,9 +2389,11 @@ def import_statistics(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
+        imported = _import_statistics_with_session(
             instance, session, metadata, statistics, table
         )
+    _statistics_modified(instance, (metadata["statistic_id"],))
+    return imported
 
 
 @retryable_database_job("adjust_statistics")
@@ -2403,6 +2434,7 @@ def adjust_statistics(
             start_time.replace(minute=0),
             sum_adjustment,
         )
+    _statistics_modified(instance, (statistic_id,))
 
     return True
 
@@ -2471,6 +2503,7 @@ def change_statistics_unit(
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
         )
+    _statistics_modified(instance, (statistic_id,))
 
 
 @callback
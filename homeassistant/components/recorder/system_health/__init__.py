@@ -55,6 +55,23 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_write_info(instance: Recorder) -> dict[str, Any]:
+    """Get a summary of the write path metrics."""
+    write_metrics = instance.write_metrics
+    write_info: dict[str, Any] = {}
+    if write_metrics.commits:
+        write_info[
+            "mean_commit_duration"
+        ] = f"{write_metrics.total_commit_duration / write_metrics.commits * 1000:.2f} ms"
+        write_info[
+            "mean_flush_duration"
+        ] = f"{write_metrics.total_flush_duration / write_metrics.commits * 1000:.2f} ms"
+    if (p95 := write_metrics.latency_percentile(0.95)) is not None:
+        write_info["event_to_commit_latency_p95"] = f"< {p95} ms"
+    return write_info
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -72,4 +89,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | _async_get_write_info(instance)
@@ -1,6 +1,6 @@
 """Managers for each table."""
 
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from lru import LRU
 
@@ -25,6 +25,8 @@ class BaseTableManager(Generic[_DataT]):
         self.active = False
         self.recorder = recorder
         self._pending: dict[str, _DataT] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def get_from_cache(self, data: str) -> int | None:
         """Resolve data to the id without accessing the underlying database.
@@ -32,7 +34,21 @@ class BaseTableManager(Generic[_DataT]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        return self._id_map.get(data)
+        if (data_id := self._id_map.get(data)) is None:
+            self.cache_misses += 1
+        else:
+            self.cache_hits += 1
+        return data_id
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Return the size and hit rate of the id map cache."""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "size": len(self._id_map),
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": round(self.cache_hits / lookups, 3) if lookups else None,
+        }
 
     def get_pending(self, shared_data: str) -> _DataT | None:
         """Get pending data that have not be assigned ids yet.
@@ -73,3 +89,7 @@ class BaseLRUTableManager(BaseTableManager[_DataT]):
         lru = self._id_map
         if new_size > lru.get_size():
             lru.set_size(new_size)
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Return the size, capacity and hit rate of the LRU cache."""
+        return super().cache_stats() | {"max_size": self._id_map.get_size()}
@@ -12,7 +12,7 @@ from homeassistant.core import Event
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import EventData
-from ..queries import get_shared_event_datas
+from ..queries import get_newest_shared_event_datas, get_shared_event_datas
 from ..util import chunked, execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -56,6 +56,26 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         }:
             self._load_from_hashes(hashes, session)
 
+    def load_newest(self, session: Session) -> None:
+        """Preload the data_ids used by the most recently recorded events.
+
+        The lookups happen in bulk at startup so the cache does not start
+        cold and the first events after a restart do not each need a
+        database lookup.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        id_map = self._id_map
+        with session.no_autoflush:
+            for data_id, shared_data in execute_stmt_lambda_element(
+                session,
+                get_newest_shared_event_datas(id_map.get_size()),
+                orm_rows=False,
+            ):
+                id_map[shared_data] = cast(int, data_id)
+        _LOGGER.debug("Preloaded %s data_ids", len(id_map))
+
     def get(self, shared_data: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_datas to the data_id.
 
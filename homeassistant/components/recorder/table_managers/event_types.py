@@ -74,6 +74,9 @@ class EventTypeManager(BaseLRUTableManager[EventTypes]):
 
             results[event_type] = event_type_id
 
+        self.cache_misses += len(missing)
+        self.cache_hits += len(results) - len(missing)
+
         if not missing:
             return results
 
@@ -12,7 +12,7 @@ from homeassistant.core import Event
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import get_newest_shared_attributes, get_shared_attributes
 from ..util import chunked, execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -65,6 +65,24 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         }:
             self._load_from_hashes(hashes, session)
 
+    def load_newest(self, session: Session) -> None:
+        """Preload the attributes_ids used by the most recently recorded states.
+
+        The lookups happen in bulk at startup so the cache does not start
+        cold and the first states after a restart do not each need a
+        database lookup.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        id_map = self._id_map
+        with session.no_autoflush:
+            for attributes_id, shared_attrs in execute_stmt_lambda_element(
+                session, get_newest_shared_attributes(id_map.get_size()), orm_rows=False
+            ):
+                id_map[shared_attrs] = cast(int, attributes_id)
+        _LOGGER.debug("Preloaded %s attributes_ids", len(id_map))
+
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
 
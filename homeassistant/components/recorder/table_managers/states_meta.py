@@ -92,6 +92,10 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
 
             results[entity_id] = metadata_id
 
+        if from_recorder:
+            self.cache_misses += len(missing)
+            self.cache_hits += len(results) - len(missing)
+
         if not missing:
             return results
 
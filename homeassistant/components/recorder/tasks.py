@@ -110,9 +110,15 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        if progress := instance.purge_progress:
+            finished = purge.purge_old_data_adaptive(
+                instance, progress, self.purge_before, self.repack, self.apply_filter
+            )
+        else:
+            finished = purge.purge_old_data(
+                instance, self.purge_before, self.repack, self.apply_filter
+            )
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -441,6 +447,19 @@ class EntityIDPostMigrationTask(RecorderTask):
             instance.queue_task(EntityIDPostMigrationTask())
 
 
+@dataclass(slots=True)
+class ShortTermStatisticsPartitionTask(RecorderTask):
+    """An object to insert into the recorder queue to partition short term statistics."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run short term statistics partitioning task."""
+        if (
+            not instance._partition_short_term_statistics()  # pylint: disable=[protected-access]
+        ):
+            # Schedule a new partitioning task if this one didn't finish
+            instance.queue_task(ShortTermStatisticsPartitionTask())
+
+
 @dataclass(slots=True)
 class EventIdMigrationTask(RecorderTask):
     """An object to insert into the recorder queue to cleanup legacy event_ids in the states table.
@@ -496,6 +496,10 @@ def ws_info(
         # for the thread state lock which will block the event loop.
         is_running = instance.is_running
         max_backlog = instance.max_backlog
+        purge_progress = (
+            progress.as_dict() if (progress := instance.purge_progress) else None
+        )
+        write_metrics = instance.get_write_metrics()
     else:
         backlog = None
         migration_in_progress = False
@@ -503,13 +507,17 @@ def ws_info(
         recording = False
         is_running = False
         max_backlog = None
+        purge_progress = None
+        write_metrics = None
 
     recorder_info = {
         "backlog": backlog,
         "max_backlog": max_backlog,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
+        "purge_progress": purge_progress,
         "recording": recording,
         "thread_running": is_running,
+        "write_metrics": write_metrics,
     }
     connection.send_result(msg["id"], recorder_info)
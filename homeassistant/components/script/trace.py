@@ -7,11 +7,12 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
     ActionTrace,
-    async_store_trace,
+    async_finish_trace,
+    async_start_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_recording
 
 from .const import DOMAIN
 
@@ -33,10 +34,11 @@ def trace_script(
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    recording = async_start_trace(hass, trace, trace_config)
 
     try:
-        yield trace
+        with trace_recording(recording):
+            yield trace
     except Exception as ex:
         if item_id:
             trace.set_error(ex)
@@ -44,3 +46,4 @@ def trace_script(
     finally:
         if item_id:
             trace.finished()
+            async_finish_trace(hass, trace, trace_config)
@@ -14,7 +14,7 @@ from typing import Any, cast
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import history
 from homeassistant.components.sensor import (
     DEVICE_CLASS_STATE_CLASSES,
     PLATFORM_SCHEMA,
@@ -548,8 +548,19 @@ class StatisticsSensor(SensorEntity):
                 self.hass, _scheduled_update, timestamp
             )
 
-    def _fetch_states_from_database(self) -> list[State]:
-        """Fetch the states from the database."""
+    async def _initialize_from_database(self) -> None:
+        """Initialize the list of states from the database.
+
+        The query will get the list of states in DESCENDING order so that we
+        can limit the result to self._sample_size. Afterwards reverse the
+        list so that we get it in the right order again.
+
+        If MaxAge is provided then query will restrict to entries younger then
+        current datetime - MaxAge.
+
+        The query is batched with the queries of the other sensors which are
+        initialized at the same time.
+        """
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
         lower_entity_id = self._source_entity_id.lower()
         if self._samples_max_age is not None:
@@ -564,27 +575,13 @@ class StatisticsSensor(SensorEntity):
         else:
             start_date = datetime.fromtimestamp(0, tz=dt_util.UTC)
             _LOGGER.debug("%s: retrieving all records", self.entity_id)
-        return history.state_changes_during_period(
+        if states := await history.async_state_changes_during_period(
             self.hass,
             start_date,
             entity_id=lower_entity_id,
             descending=True,
             limit=self._samples_max_buffer_size,
             include_start_time_state=False,
-        ).get(lower_entity_id, [])
-
-    async def _initialize_from_database(self) -> None:
-        """Initialize the list of states from the database.
-
-        The query will get the list of states in DESCENDING order so that we
-        can limit the result to self._sample_size. Afterwards reverse the
-        list so that we get it in the right order again.
-
-        If MaxAge is provided then query will restrict to entries younger then
-        current datetime - MaxAge.
-        """
-        if states := await get_instance(self.hass).async_add_executor_job(
-            self._fetch_states_from_database
         ):
             for state in reversed(states):
                 self._add_state_to_queue(state)
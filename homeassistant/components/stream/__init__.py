@@ -67,6 +67,7 @@ from .core import (
     Orientation,
     StreamOutput,
     StreamSettings,
+    async_get_keyframe_decode_pool,
 )
 from .diagnostics import Diagnostics
 from .hls import HlsStreamOutput, async_setup_hls
@@ -560,7 +561,10 @@ class Stream:
 
     def get_diagnostics(self) -> dict[str, Any]:
         """Return diagnostics information for the stream."""
-        return self._diagnostics.as_dict()
+        return {
+            **self._diagnostics.as_dict(),
+            "keyframe_decode_pool": async_get_keyframe_decode_pool(self.hass).as_dict(),
+        }
 
 
 def _should_retry() -> bool:
@@ -9,7 +9,8 @@ from dataclasses import dataclass, field
 import datetime
 from enum import IntEnum
 import logging
-from typing import TYPE_CHECKING, Any
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from aiohttp import web
 import numpy as np
@@ -21,13 +22,15 @@ from homeassistant.util.decorator import Registry
 
 from .const import (
     ATTR_STREAMS,
+    DATA_KEYFRAME_DECODE_POOL,
     DOMAIN,
+    MAX_KEYFRAME_DECODE_JOBS,
     SEGMENT_DURATION_ADJUSTER,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
 
 if TYPE_CHECKING:
-    from av import CodecContext, Packet
+    from av import CodecContext, Packet, VideoFrame
 
     from homeassistant.components.camera import DynamicStreamSettings
 
@@ -35,6 +38,8 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 PROVIDERS: Registry[str, type[StreamOutput]] = Registry()
 
 
@@ -77,8 +82,8 @@ class Part:
 
     duration: float
     has_keyframe: bool
-    # video data (moof+mdat)
-    data: bytes
+    # video data (moof+mdat), a view of the segment data once it is assembled
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -102,6 +107,9 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    _data_size: int = field(default=0, init=False)
+    # The data of all parts, assembled once the segment is complete
+    _data: bytes | None = field(default=None, init=False)
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -121,7 +129,7 @@ class Segment:
     @property
     def data_size(self) -> int:
         """Return the size of all part data without init in bytes."""
-        return sum(len(part.data) for part in self.parts)
+        return self._data_size
 
     @callback
     def async_add_part(
@@ -134,13 +142,30 @@ class Segment:
         Duration is non zero only for the last part.
         """
         self.parts.append(part)
+        self._data_size += len(part.data)
         self.duration = duration
         for output in self._stream_outputs:
             output.part_put()
 
     def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
-        return b"".join([part.data for part in self.parts])
+        """Return reconstructed data for all parts as bytes, without init.
+
+        The data of a complete segment is assembled once and shared by all
+        readers. The parts are then replaced by views of it, so the data is
+        not kept twice.
+        """
+        if (data := self._data) is not None:
+            return data
+        data = b"".join([part.data for part in self.parts])
+        if self.complete:
+            self._data = data
+            view = memoryview(data)
+            offset = 0
+            for part in self.parts:
+                size = len(part.data)
+                part.data = view[offset : offset + size]
+                offset += size
+        return data
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
@@ -416,15 +441,74 @@ TRANSFORM_IMAGE_FUNCTION = (
 )
 
 
+class KeyFrameDecodePool:
+    """Bound the keyframes decoded at the same time by all streams.
+
+    Decoding and encoding a keyframe keeps an executor thread busy, so a
+    dashboard requesting the images of many cameras at once could use all
+    of them. Jobs beyond the limit wait for their turn.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_jobs: int) -> None:
+        """Initialize the pool."""
+        self._hass = hass
+        self._max_jobs = max_jobs
+        self._semaphore = asyncio.Semaphore(max_jobs)
+        self.jobs = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.max_wait = 0.0
+
+    async def async_run(self, target: Callable[..., _T], *args: Any) -> _T:
+        """Run a decode job in the executor once the pool has room."""
+        start = time.monotonic()
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+        self.max_wait = max(self.max_wait, time.monotonic() - start)
+        self.jobs += 1
+        try:
+            return await self._hass.async_add_executor_job(target, *args)
+        finally:
+            self._semaphore.release()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the queueing statistics of the pool."""
+        return {
+            "max_jobs": self._max_jobs,
+            "jobs": self.jobs,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "max_wait": round(self.max_wait, 3),
+        }
+
+
+@callback
+def async_get_keyframe_decode_pool(hass: HomeAssistant) -> KeyFrameDecodePool:
+    """Return the keyframe decode pool shared by all streams."""
+    pool: KeyFrameDecodePool | None = hass.data.get(DATA_KEYFRAME_DECODE_POOL)
+    if pool is None:
+        pool = hass.data[DATA_KEYFRAME_DECODE_POOL] = KeyFrameDecodePool(
+            hass, MAX_KEYFRAME_DECODE_JOBS
+        )
+    return pool
+
+
 class KeyFrameConverter:
     """Enables generating and getting an image from the last keyframe seen in the stream.
 
     An overview of the thread and state interaction:
         the worker thread sets a packet
         get_image is called from the main asyncio loop
-        get_image schedules _generate_image in an executor thread
-        _generate_image will try to create an image from the packet
+        get_image schedules _generate_image in the keyframe decode pool
+        _generate_image will try to decode a frame from the packet
         _generate_image will clear the packet, so there will only be one attempt per packet
+        _generate_image encodes the frame once for each size requested
+        the frame is released once no get_image call is waiting for it, and the
+        keyframe packet is decoded again if another size is requested later
     If successful, self._image will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
     """
@@ -446,6 +530,13 @@ class KeyFrameConverter:
         self._event: asyncio.Event = asyncio.Event()
         self._hass = hass
         self._image: bytes | None = None
+        # The last decoded keyframe packet and its images by size and
+        # orientation, the decoded frame is only kept while requests wait
+        self._keyframe: Packet = None
+        self._frame: VideoFrame | None = None
+        self._images: dict[tuple[int | None, int | None, int], bytes] = {}
+        self._requests = 0
+        self._decode_pool = async_get_keyframe_decode_pool(hass)
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
         self._codec_context: CodecContext | None = None
@@ -484,6 +575,14 @@ class KeyFrameConverter:
         """Transform image to a given orientation."""
         return TRANSFORM_IMAGE_FUNCTION[orientation](image)
 
+    def _image_key(
+        self, width: int | None, height: int | None
+    ) -> tuple[int | None, int | None, int]:
+        """Return the key of the image of a size in the current orientation."""
+        if not (width and height):
+            width = height = None
+        return (width, height, self._dynamic_stream_settings.orientation)
+
     def _generate_image(self, width: int | None, height: int | None) -> None:
         """Generate the keyframe image.
 
@@ -492,10 +591,39 @@ class KeyFrameConverter:
         at a time per instance.
         """
 
-        if not (self._turbojpeg and self._packet and self._codec_context):
+        if not self._turbojpeg or not self._codec_context:
             return
-        packet = self._packet
-        self._packet = None
+        if self._packet:
+            packet = self._packet
+            self._packet = None
+            if (frame := self._decode_frame(packet)) is not None:
+                self._keyframe = packet
+                self._frame = frame
+                self._images = {}
+        key = self._image_key(width, height)
+        if (image := self._images.get(key)) is None:
+            if (frame := self._frame) is None:
+                if (
+                    not self._keyframe
+                    or (frame := self._decode_frame(self._keyframe)) is None
+                ):
+                    return
+                self._frame = frame
+            if width and height:
+                if self._dynamic_stream_settings.orientation >= 5:
+                    frame = frame.reformat(width=height, height=width)
+                else:
+                    frame = frame.reformat(width=width, height=height)
+            bgr_array = self.transform_image(
+                frame.to_ndarray(format="bgr24"),
+                self._dynamic_stream_settings.orientation,
+            )
+            image = self._images[key] = bytes(self._turbojpeg.encode(bgr_array))
+        self._image = image
+
+    def _decode_frame(self, packet: Packet) -> VideoFrame | None:
+        """Decode a keyframe packet."""
+        assert self._codec_context
         for _ in range(2):  # Retry once if codec context needs to be flushed
             try:
                 # decode packet (flush afterwards)
@@ -511,19 +639,8 @@ class KeyFrameConverter:
                 self._codec_context.open()
         else:
             _LOGGER.debug("Unable to decode keyframe")
-            return
-        if frames:
-            frame = frames[0]
-            if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
-                    frame = frame.reformat(width=height, height=width)
-                else:
-                    frame = frame.reformat(width=width, height=height)
-            bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
-            )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+            return None
+        return frames[0] if frames else None
 
     async def async_get_image(
         self,
@@ -537,6 +654,21 @@ class KeyFrameConverter:
         if wait_for_next_keyframe:
             self._event.clear()
             await self._event.wait()
-        async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
+        self._requests += 1
+        try:
+            async with self._lock:
+                if self._packet is None and (
+                    image := self._images.get(self._image_key(width, height))
+                ):
+                    # Requests for the same keyframe and size share its image
+                    self._image = image
+                else:
+                    await self._decode_pool.async_run(
+                        self._generate_image, width, height
+                    )
+        finally:
+            self._requests -= 1
+            if not self._requests:
+                # Keep only the encoded images of an idle stream
+                self._frame = None
         return self._image
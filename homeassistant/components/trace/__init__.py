@@ -19,11 +19,15 @@ from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_RATE,
     CONF_STORED_TRACES,
+    CONF_TRACE_MODE,
     DATA_TRACE,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_RATE,
     DEFAULT_STORED_TRACES,
+    TraceMode,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -35,12 +39,24 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_MODE, default=TraceMode.FULL): vol.Coerce(TraceMode),
+    vol.Optional(CONF_SAMPLE_RATE, default=DEFAULT_SAMPLE_RATE): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
-TraceData = dict[str, LimitedSizeDict[str, BaseTrace]]
+
+class KeyTraces(LimitedSizeDict[str, BaseTrace]):
+    """The traces of a script or automation."""
+
+    # Number of runs counted in sampled mode
+    runs = 0
+
+
+TraceData = dict[str, KeyTraces]
 
 
 @callback
@@ -90,7 +106,7 @@ async def async_list_contexts(
     # Restore saved traces if not done
     await async_restore_traces(hass)
 
-    values: Mapping[str, LimitedSizeDict[str, BaseTrace] | None]
+    values: Mapping[str, KeyTraces | None]
     if key is not None:
         values = {key: _get_data(hass).get(key)}
     else:
@@ -144,12 +160,50 @@ def async_store_trace(
 ) -> None:
     """Store a trace if its key is valid."""
     if key := trace.key:
-        traces = _get_data(hass)
-        if key not in traces:
-            traces[key] = LimitedSizeDict(size_limit=stored_traces)
-        else:
-            traces[key].size_limit = stored_traces
-        traces[key][trace.run_id] = trace
+        _get_key_traces(hass, key, stored_traces)[trace.run_id] = trace
+
+
+def _get_key_traces(hass: HomeAssistant, key: str, stored_traces: int) -> KeyTraces:
+    """Return the traces of a script or automation."""
+    traces = _get_data(hass)
+    if key not in traces:
+        traces[key] = KeyTraces(size_limit=stored_traces)
+    else:
+        traces[key].size_limit = stored_traces
+    return traces[key]
+
+
+@callback
+def async_start_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> bool:
+    """Store the trace of a starting run according to the trace mode.
+
+    Returns if the trace elements of the run should be recorded.
+    """
+    mode = trace_config.get(CONF_TRACE_MODE, TraceMode.FULL)
+    if mode == TraceMode.OFF:
+        return False
+    if mode == TraceMode.SAMPLED and (key := trace.key):
+        # The runs are counted with the traces, which are removed together
+        key_traces = _get_key_traces(hass, key, trace_config[CONF_STORED_TRACES])
+        run = key_traces.runs
+        key_traces.runs = run + 1
+        if run % trace_config.get(CONF_SAMPLE_RATE, DEFAULT_SAMPLE_RATE):
+            return False
+    # In errors mode the trace is only stored once the run failed
+    if mode != TraceMode.ERRORS:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    return True
+
+
+@callback
+def async_finish_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> None:
+    """Store the trace of a finished run which failed in errors mode."""
+    if trace_config.get(CONF_TRACE_MODE) == TraceMode.ERRORS and trace.has_error:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
 
 
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
@@ -157,7 +211,7 @@ def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> No
     key = trace.key
     traces = _get_data(hass)
     if key not in traces:
-        traces[key] = LimitedSizeDict()
+        traces[key] = KeyTraces()
     traces[key][trace.run_id] = trace
     traces[key].move_to_end(trace.run_id, last=False)
 
@@ -80,6 +80,17 @@ class ActionTrace(BaseTrace):
         """Set error."""
         self._error = ex
 
+    @property
+    def has_error(self) -> bool:
+        """Return if the run or one of its steps failed."""
+        if self._error is not None or self._script_execution == "error":
+            return True
+        return self._trace is not None and any(
+            element.error is not None
+            for elements in self._trace.values()
+            for element in elements
+        )
+
     def finished(self) -> None:
         """Set finish time."""
         self._timestamp_finish = dt_util.utcnow()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Mapping
+from collections.abc import AsyncGenerator, AsyncIterable, Mapping
 from datetime import datetime
 from functools import partial
 import hashlib
@@ -47,6 +47,7 @@ from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, ConfigType
 from homeassistant.util import dt as dt_util, language as language_util
 
@@ -57,10 +58,12 @@ from .const import (
     ATTR_OPTIONS,
     CONF_CACHE,
     CONF_CACHE_DIR,
+    CONF_CACHE_MAX_SIZE,
     CONF_TIME_MEMORY,
     DATA_TTS_MANAGER,
     DEFAULT_CACHE,
     DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_MAX_SIZE,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
     TtsAudioType,
@@ -113,6 +116,10 @@ KEY_PATTERN = "{0}_{1}_{2}_{3}"
 
 SCHEMA_SERVICE_CLEAR_CACHE = vol.Schema({})
 
+STORAGE_KEY = f"{DOMAIN}.cache"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
 
 class TTSCache(TypedDict):
     """Cached TTS file."""
@@ -122,6 +129,58 @@ class TTSCache(TypedDict):
     pending: asyncio.Task | None
 
 
+class TTSAudioStream:
+    """Audio of a message which is being generated.
+
+    Readers receive the chunks produced so far and then each new chunk
+    as the engine produces it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stream."""
+        self.chunks: list[bytes] = []
+        self.done = False
+        self.failed = False
+        self._event = asyncio.Event()
+
+    @callback
+    def async_add_chunk(self, chunk: bytes) -> None:
+        """Add a chunk of audio and wake up the readers."""
+        self.chunks.append(chunk)
+        self._event.set()
+        self._event = asyncio.Event()
+
+    @callback
+    def async_end(self, failed: bool = False) -> None:
+        """End the stream and wake up the readers."""
+        self.done = True
+        self.failed = failed
+        self._event.set()
+
+    async def async_iter_chunks(self) -> AsyncGenerator[bytes, None]:
+        """Yield all chunks of audio until the stream ends.
+
+        Raises HomeAssistantError if the audio could not be generated.
+        """
+        index = 0
+        while True:
+            while index < len(self.chunks):
+                yield self.chunks[index]
+                index += 1
+            if self.failed:
+                raise HomeAssistantError("TTS audio generation failed")
+            if self.done:
+                return
+            await self._event.wait()
+
+
+class TTSCacheFile(TypedDict):
+    """File in the TTS cache directory."""
+
+    filename: str
+    size: int
+
+
 @callback
 def async_default_engine(hass: HomeAssistant) -> str | None:
     """Return the domain or entity id of the default engine.
@@ -297,9 +356,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     conf = config[DOMAIN][0] if config.get(DOMAIN) else {}
     use_cache: bool = conf.get(CONF_CACHE, DEFAULT_CACHE)
     cache_dir: str = conf.get(CONF_CACHE_DIR, DEFAULT_CACHE_DIR)
+    cache_max_size: int = conf.get(CONF_CACHE_MAX_SIZE, DEFAULT_CACHE_MAX_SIZE)
     time_memory: int = conf.get(CONF_TIME_MEMORY, DEFAULT_TIME_MEMORY)
 
-    tts = SpeechManager(hass, use_cache, cache_dir, time_memory)
+    tts = SpeechManager(
+        hass, use_cache, cache_dir, time_memory, cache_max_size * 1024 * 1024
+    )
 
     try:
         await tts.async_init_cache()
@@ -453,12 +515,39 @@ class TextToSpeechEntity(RestoreEntity):
             message=message, language=language, options=options
         )
 
+    @final
+    async def internal_async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> tuple[str, AsyncIterable[bytes]] | None:
+        """Process an audio stream to TTS service.
+
+        Only streaming content is allowed!
+        """
+        if (
+            audio := await self.async_stream_tts_audio(
+                message=message, language=language, options=options
+            )
+        ) is not None:
+            self.__last_tts_loaded = dt_util.utcnow().isoformat()
+            self.async_write_ha_state()
+        return audio
+
     def get_tts_audio(
         self, message: str, language: str, options: dict[str, Any]
     ) -> TtsAudioType:
         """Load tts audio file from the engine."""
         raise NotImplementedError()
 
+    async def async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> tuple[str, AsyncIterable[bytes]] | None:
+        """Stream tts audio from the engine.
+
+        Return a tuple of file extension and chunks of audio data as they
+        are generated, or None if the engine does not stream audio.
+        """
+        return None
+
     async def async_get_tts_audio(
         self, message: str, language: str, options: dict[str, Any]
     ) -> TtsAudioType:
@@ -490,6 +579,7 @@ class SpeechManager:
         use_cache: bool,
         cache_dir: str,
         time_memory: int,
+        cache_max_size: int,
     ) -> None:
         """Initialize a speech store."""
         self.hass = hass
@@ -498,11 +588,22 @@ class SpeechManager:
         self.use_cache = use_cache
         self.cache_dir = cache_dir
         self.time_memory = time_memory
-        self.file_cache: dict[str, str] = {}
+        self.cache_max_size = cache_max_size
+        # Least recently used files first
+        self.file_cache: dict[str, TTSCacheFile] = {}
+        self.file_cache_size = 0
         self.mem_cache: dict[str, TTSCache] = {}
+        self.audio_streams: dict[str, TTSAudioStream] = {}
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
 
     async def async_init_cache(self) -> None:
-        """Init config folder and load file cache."""
+        """Init config folder and load file cache.
+
+        The files are listed from the index of the previous run, the cache
+        dir is only read when there is no index for it. Files are added to
+        the index before they are written, so the index never misses a file.
+        Entries whose file is gone are dropped when it fails to load.
+        """
         try:
             self.cache_dir = await self.hass.async_add_executor_job(
                 _init_tts_cache_dir, self.hass, self.cache_dir
@@ -510,30 +611,76 @@ class SpeechManager:
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
-        try:
-            cache_files = await self.hass.async_add_executor_job(
-                _get_cache_files, self.cache_dir
-            )
-        except OSError as err:
-            raise HomeAssistantError(f"Can't read cache dir {err}") from err
+        index = await self._store.async_load()
+        if index is not None and index["cache_dir"] == self.cache_dir:
+            cache_files = {
+                cache_key: TTSCacheFile(filename=filename, size=size)
+                for cache_key, filename, size in index["files"]
+            }
+        else:
+            try:
+                cache_files = await self.hass.async_add_executor_job(
+                    _get_cache_files, self.cache_dir
+                )
+            except OSError as err:
+                raise HomeAssistantError(f"Can't read cache dir {err}") from err
+            self._async_schedule_save_index()
 
         if cache_files:
             self.file_cache.update(cache_files)
+            self.file_cache_size = sum(
+                cache_file["size"] for cache_file in cache_files.values()
+            )
+            self._async_evict_files()
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
         self.mem_cache = {}
+        filenames = [cache_file["filename"] for cache_file in self.file_cache.values()]
+        self.file_cache = {}
+        self.file_cache_size = 0
+        self._async_schedule_save_index()
+        await self.hass.async_add_executor_job(
+            _remove_cache_files, self.cache_dir, filenames
+        )
+
+    @callback
+    def _async_schedule_save_index(self) -> None:
+        """Schedule saving the index of the file cache."""
+        self._store.async_delay_save(self._index_to_save, STORAGE_SAVE_DELAY)
 
-        def remove_files() -> None:
-            """Remove files from filesystem."""
-            for filename in self.file_cache.values():
-                try:
-                    os.remove(os.path.join(self.cache_dir, filename))
-                except OSError as err:
-                    _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+    @callback
+    def _index_to_save(self) -> dict[str, Any]:
+        """Return the index of the file cache to store."""
+        return {
+            "cache_dir": self.cache_dir,
+            "files": [
+                [cache_key, cache_file["filename"], cache_file["size"]]
+                for cache_key, cache_file in self.file_cache.items()
+            ],
+        }
 
-        await self.hass.async_add_executor_job(remove_files)
-        self.file_cache = {}
+    @callback
+    def _async_file_cache_used(self, cache_key: str) -> None:
+        """Mark a file of the file cache as the most recently used."""
+        if (cache_file := self.file_cache.pop(cache_key, None)) is not None:
+            self.file_cache[cache_key] = cache_file
+            self._async_schedule_save_index()
+
+    @callback
+    def _async_evict_files(self) -> None:
+        """Remove the least recently used files above the size of the cache."""
+        filenames: list[str] = []
+        while self.file_cache_size > self.cache_max_size and len(self.file_cache) > 1:
+            cache_key = next(iter(self.file_cache))
+            cache_file = self.file_cache.pop(cache_key)
+            self.file_cache_size -= cache_file["size"]
+            filenames.append(cache_file["filename"])
+        if not filenames:
+            return
+        _LOGGER.debug("Removing %s files from the TTS cache", len(filenames))
+        self._async_schedule_save_index()
+        self.hass.async_add_executor_job(_remove_cache_files, self.cache_dir, filenames)
 
     @callback
     def async_register_legacy_engine(
@@ -612,9 +759,10 @@ class SpeechManager:
         # Is speech already in memory
         if cache_key in self.mem_cache:
             filename = self.mem_cache[cache_key]["filename"]
+            self._async_file_cache_used(cache_key)
         # Is file store in file cache
         elif use_cache and cache_key in self.file_cache:
-            filename = self.file_cache[cache_key]
+            filename = self.file_cache[cache_key]["filename"]
             self.hass.async_create_task(self._async_file_to_mem(cache_key))
         # Load speech from engine into memory
         else:
@@ -648,6 +796,8 @@ class SpeechManager:
                 await self._async_get_tts_audio(
                     engine_instance, cache_key, message, use_cache, language, options
                 )
+        else:
+            self._async_file_cache_used(cache_key)
 
         extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
         cached = self.mem_cache[cache_key]
@@ -688,13 +838,53 @@ class SpeechManager:
 
         # Default to MP3 unless a different format is preferred
         final_extension = options.get(ATTR_PREFERRED_FORMAT, "mp3")
+        audio_stream = self.audio_streams[cache_key] = TTSAudioStream()
+
+        def needs_conversion(extension: str) -> bool:
+            """Return if audio from the TTS system must be converted."""
+            # Only convert if we have a preferred format different than the
+            # expected format from the TTS system, or if a specific sample
+            # rate/format/channel count is requested.
+            return (
+                (final_extension != extension)
+                or (ATTR_PREFERRED_SAMPLE_RATE in options)
+                or (ATTR_PREFERRED_SAMPLE_CHANNELS in options)
+            )
 
         async def get_tts_data() -> str:
             """Handle data available."""
+            failed = True
+            try:
+                filename = await get_streamed_tts_data()
+                failed = False
+                return filename
+            finally:
+                # Readers of a failed stream must not take it as complete
+                audio_stream.async_end(failed)
+                if self.audio_streams.get(cache_key) is audio_stream:
+                    del self.audio_streams[cache_key]
+
+        async def get_streamed_tts_data() -> str:
+            """Stream the audio to readers while it is generated, if possible."""
             if engine_instance.name is None or engine_instance.name is UNDEFINED:
                 raise HomeAssistantError("TTS engine name is not set.")
 
-            if isinstance(engine_instance, Provider):
+            extension: str | None = None
+            data: bytes | None = None
+            if isinstance(engine_instance, TextToSpeechEntity) and (
+                audio := await engine_instance.internal_async_stream_tts_audio(
+                    message, language, options
+                )
+            ):
+                extension, chunks = audio
+                # Audio which must be converted is only served once complete
+                if not needs_conversion(extension):
+                    async for chunk in chunks:
+                        audio_stream.async_add_chunk(chunk)
+                    data = b"".join(audio_stream.chunks)
+                else:
+                    data = b"".join([chunk async for chunk in chunks])
+            elif isinstance(engine_instance, Provider):
                 extension, data = await engine_instance.async_get_tts_audio(
                     message, language, options
                 )
@@ -708,16 +898,7 @@ class SpeechManager:
                     f"No TTS from {engine_instance.name} for '{message}'"
                 )
 
-            # Only convert if we have a preferred format different than the
-            # expected format from the TTS system, or if a specific sample
-            # rate/format/channel count is requested.
-            needs_conversion = (
-                (final_extension != extension)
-                or (ATTR_PREFERRED_SAMPLE_RATE in options)
-                or (ATTR_PREFERRED_SAMPLE_CHANNELS in options)
-            )
-
-            if needs_conversion:
+            if needs_conversion(extension):
                 data = await async_convert_audio(
                     self.hass,
                     extension,
@@ -745,6 +926,8 @@ class SpeechManager:
                 )
 
             self._async_store_to_memcache(cache_key, filename, data)
+            if not audio_stream.chunks:
+                audio_stream.async_add_chunk(data)
 
             if cache:
                 self.hass.async_create_task(
@@ -775,6 +958,10 @@ class SpeechManager:
     ) -> None:
         """Store voice data to file and file_cache.
 
+        The least recently used files are removed when the cache is full.
+        The index is saved before the file is written, so a file is never
+        missing from the index and always counts against the cache size.
+
         This method is a coroutine.
         """
         voice_file = os.path.join(self.cache_dir, filename)
@@ -784,20 +971,33 @@ class SpeechManager:
             with open(voice_file, "wb") as speech:
                 speech.write(data)
 
+        if (replaced := self.file_cache.pop(cache_key, None)) is not None:
+            self.file_cache_size -= replaced["size"]
+        cache_file = self.file_cache[cache_key] = TTSCacheFile(
+            filename=filename, size=len(data)
+        )
+        self.file_cache_size += len(data)
+        self._async_evict_files()
+        await self._store.async_save(self._index_to_save())
+
         try:
             await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[cache_key] = filename
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            if self.file_cache.get(cache_key) is cache_file:
+                del self.file_cache[cache_key]
+                self.file_cache_size -= cache_file["size"]
+                self._async_schedule_save_index()
 
     async def _async_file_to_mem(self, cache_key: str) -> None:
         """Load voice from file cache into memory.
 
         This method is a coroutine.
         """
-        if not (filename := self.file_cache.get(cache_key)):
+        if not (cache_file := self.file_cache.get(cache_key)):
             raise HomeAssistantError(f"Key {cache_key} not in file cache!")
 
+        filename = cache_file["filename"]
         voice_file = os.path.join(self.cache_dir, filename)
 
         def load_speech() -> bytes:
@@ -808,9 +1008,12 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[cache_key]
+            if self.file_cache.pop(cache_key, None) is not None:
+                self.file_cache_size -= cache_file["size"]
+                self._async_schedule_save_index()
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
+        self._async_file_cache_used(cache_key)
         self._async_store_to_memcache(cache_key, filename, data)
 
     @callback
@@ -844,19 +1047,14 @@ class SpeechManager:
 
         This method is a coroutine.
         """
-        if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
-            record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
-        ):
-            raise HomeAssistantError("Wrong tts file format!")
-
-        cache_key = KEY_PATTERN.format(
-            record.group(1), record.group(2), record.group(3), record.group(4)
-        )
+        cache_key = _cache_key_from_filename(filename)
 
         if cache_key not in self.mem_cache:
             if cache_key not in self.file_cache:
                 raise HomeAssistantError(f"{cache_key} not in cache!")
             await self._async_file_to_mem(cache_key)
+        else:
+            self._async_file_cache_used(cache_key)
 
         cached = self.mem_cache[cache_key]
         if pending := cached.get("pending"):
@@ -866,6 +1064,11 @@ class SpeechManager:
         content, _ = mimetypes.guess_type(filename)
         return content, cached["voice"]
 
+    @callback
+    def async_get_audio_stream(self, filename: str) -> TTSAudioStream | None:
+        """Return the audio stream of a voice file which is being generated."""
+        return self.audio_streams.get(_cache_key_from_filename(filename))
+
     @staticmethod
     def write_tags(
         filename: str,
@@ -919,6 +1122,18 @@ class SpeechManager:
         return data_bytes.getvalue()
 
 
+def _cache_key_from_filename(filename: str) -> str:
+    """Return the cache key of a voice file."""
+    if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
+        record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
+    ):
+        raise HomeAssistantError("Wrong tts file format!")
+
+    return KEY_PATTERN.format(
+        record.group(1), record.group(2), record.group(3), record.group(4)
+    )
+
+
 def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     """Init cache folder."""
     if not os.path.isabs(cache_dir):
@@ -929,20 +1144,36 @@ def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     return cache_dir
 
 
-def _get_cache_files(cache_dir: str) -> dict[str, str]:
-    """Return a dict of given engine files."""
-    cache = {}
+def _get_cache_files(cache_dir: str) -> dict[str, TTSCacheFile]:
+    """Return a dict of given engine files, least recently modified first."""
+    files = []
 
-    folder_data = os.listdir(cache_dir)
-    for file_data in folder_data:
-        if (record := _RE_VOICE_FILE.match(file_data)) or (
-            record := _RE_LEGACY_VOICE_FILE.match(file_data)
-        ):
-            key = KEY_PATTERN.format(
-                record.group(1), record.group(2), record.group(3), record.group(4)
-            )
-            cache[key.lower()] = file_data.lower()
-    return cache
+    with os.scandir(cache_dir) as folder_data:
+        for file_data in folder_data:
+            if (record := _RE_VOICE_FILE.match(file_data.name)) or (
+                record := _RE_LEGACY_VOICE_FILE.match(file_data.name)
+            ):
+                key = KEY_PATTERN.format(
+                    record.group(1), record.group(2), record.group(3), record.group(4)
+                )
+                stat = file_data.stat()
+                files.append(
+                    (stat.st_mtime, key.lower(), file_data.name.lower(), stat.st_size)
+                )
+
+    return {
+        key: TTSCacheFile(filename=filename, size=size)
+        for _, key, filename, size in sorted(files)
+    }
+
+
+def _remove_cache_files(cache_dir: str, filenames: list[str]) -> None:
+    """Remove files from the cache dir."""
+    for filename in filenames:
+        try:
+            os.remove(os.path.join(cache_dir, filename))
+        except OSError as err:
+            _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
 
 
 class TextToSpeechUrlView(HomeAssistantView):
@@ -1002,8 +1233,25 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
         """Start a get request."""
+        try:
+            audio_stream = self.tts.async_get_audio_stream(filename)
+        except HomeAssistantError as err:
+            _LOGGER.error("Error on load tts: %s", err)
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        if (
+            audio_stream is not None
+            and (
+                response := await self._async_stream_tts(
+                    request, filename, audio_stream
+                )
+            )
+            is not None
+        ):
+            return response
+
         try:
             content, data = await self.tts.async_read_tts(filename)
         except HomeAssistantError as err:
@@ -1012,6 +1260,37 @@ class TextToSpeechView(HomeAssistantView):
 
         return web.Response(body=data, content_type=content)
 
+    async def _async_stream_tts(
+        self, request: web.Request, filename: str, audio_stream: TTSAudioStream
+    ) -> web.StreamResponse | None:
+        """Send the audio while it is generated.
+
+        Returns None if the generation failed before the first chunk.
+        """
+        chunks = audio_stream.async_iter_chunks()
+        try:
+            first_chunk = await anext(chunks)
+        except (StopAsyncIteration, HomeAssistantError):
+            return None
+
+        content, _ = mimetypes.guess_type(filename)
+        response = web.StreamResponse()
+        response.content_type = content or "application/octet-stream"
+        await response.prepare(request)
+        await response.write(first_chunk)
+        try:
+            async for chunk in chunks:
+                await response.write(chunk)
+        except HomeAssistantError as err:
+            _LOGGER.error("Error on stream tts: %s", err)
+            # Close the connection so truncated audio is not taken for a
+            # complete file
+            if request.transport is not None:
+                request.transport.close()
+            return response
+        await response.write_eof()
+        return response
+
 
 @websocket_api.websocket_command(
     {
@@ -7,11 +7,13 @@ ATTR_OPTIONS = "options"
 
 CONF_CACHE = "cache"
 CONF_CACHE_DIR = "cache_dir"
+CONF_CACHE_MAX_SIZE = "cache_max_size"
 CONF_FIELDS = "fields"
 CONF_TIME_MEMORY = "time_memory"
 
 DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
+DEFAULT_CACHE_MAX_SIZE = 1024  # MiB
 DEFAULT_TIME_MEMORY = 300
 
 DOMAIN = "tts"
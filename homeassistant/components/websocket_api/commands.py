@@ -94,6 +94,7 @@ def async_register_commands(
     async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_supported_features)
     async_reg(hass, handle_integration_descriptions)
+    async_reg(hass, handle_connection_metrics)
 
 
 def pong_message(iden: int) -> dict[str, Any]:
@@ -887,6 +888,19 @@ def handle_supported_features(
     connection.send_result(msg["id"])
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "connection_metrics"})
+def handle_connection_metrics(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle getting the writer metrics of the connected clients."""
+    connection.send_result(
+        msg["id"],
+        [metrics.as_dict() for metrics in hass.data.get(const.DATA_WRITER_METRICS, ())],
+    )
+
+
 @decorators.require_admin
 @decorators.websocket_command({"type": "integration/descriptions"})
 @decorators.async_response
@@ -42,6 +42,7 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "flush_delay",
         "supported_features",
         "handlers",
         "binary_handlers",
@@ -64,6 +65,7 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.flush_delay = 0.0
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema]] = self.hass.data[
             const.DOMAIN
@@ -79,6 +81,11 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        if self.can_coalesce:
+            flush_delay = features.get(const.FEATURE_FLUSH_DELAY, 0)
+            self.flush_delay = max(0, min(flush_delay, const.MAX_FLUSH_DELAY_MS)) / 1000
+        else:
+            self.flush_delay = 0.0
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
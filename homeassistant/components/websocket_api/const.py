@@ -26,6 +26,11 @@ PENDING_MSG_PEAK_TIME: Final = 5
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
 MAX_PENDING_MSG: Final = 4096
+# Maximum number of bytes that can be pending at any given time,
+# a few large messages use more memory than many small ones
+MAX_PENDING_BYTES: Final = 64 * 2**20
+# Upper limit of the delay a client can ask for to coalesce messages
+MAX_FLUSH_DELAY_MS: Final = 250
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
@@ -49,5 +54,9 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
+# Data used to store the writer metrics of the current connections
+DATA_WRITER_METRICS: Final = f"{DOMAIN}.writer_metrics"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+# Milliseconds to wait for more messages to coalesce once one is queued
+FEATURE_FLUSH_DELAY = "flush_delay"
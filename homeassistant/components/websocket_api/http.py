@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections import deque
 from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
 import datetime as dt
 from functools import partial
 import logging
@@ -23,6 +24,8 @@ from homeassistant.util.json import json_loads
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
     DATA_CONNECTIONS,
+    DATA_WRITER_METRICS,
+    MAX_PENDING_BYTES,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -53,6 +56,57 @@ class WebsocketAPIView(HomeAssistantView):
         return await WebSocketHandler(request.app[KEY_HASS], request).async_handle()
 
 
+@dataclass(slots=True, eq=False)
+class WriterMetrics:
+    """Metrics of the messages written to a websocket connection."""
+
+    description: str = ""
+    compressed: bool = False
+    queued_messages: int = 0
+    queued_bytes: int = 0
+    max_queued_bytes: int = 0
+    messages: int = 0
+    frames: int = 0
+    bytes: int = 0
+    max_frame_messages: int = 0
+    max_frame_bytes: int = 0
+    blocked: float = 0.0
+    max_blocked: float = 0.0
+
+    def frame_sent(self, messages: int, size: int, blocked: float) -> None:
+        """Record a frame of messages written to the socket."""
+        self.messages += messages
+        self.frames += 1
+        self.bytes += size
+        self.blocked += blocked
+        if messages > self.max_frame_messages:
+            self.max_frame_messages = messages
+        if size > self.max_frame_bytes:
+            self.max_frame_bytes = size
+        if blocked > self.max_blocked:
+            self.max_blocked = blocked
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dict with times in milliseconds."""
+        frames = self.frames
+        return {
+            "description": self.description,
+            "compressed": self.compressed,
+            "queued_messages": self.queued_messages,
+            "queued_bytes": self.queued_bytes,
+            "max_queued_bytes": self.max_queued_bytes,
+            "messages": self.messages,
+            "frames": frames,
+            "bytes": self.bytes,
+            "mean_frame_messages": round(self.messages / frames, 2) if frames else None,
+            "mean_frame_bytes": round(self.bytes / frames) if frames else None,
+            "max_frame_messages": self.max_frame_messages,
+            "max_frame_bytes": self.max_frame_bytes,
+            "blocked": round(self.blocked * 1000, 3),
+            "max_blocked": round(self.max_blocked * 1000, 3),
+        }
+
+
 class WebSocketAdapter(logging.LoggerAdapter):
     """Add connection id to websocket messages."""
 
@@ -78,6 +132,7 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_metrics",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -99,6 +154,7 @@ class WebSocketHandler:
         # an asyncio.Queue.
         self._message_queue: deque[bytes | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        self._metrics = WriterMetrics()
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -130,6 +186,7 @@ class WebSocketHandler:
         debug = logger.debug
         is_enabled_for = logger.isEnabledFor
         logging_debug = logging.DEBUG
+        metrics = self._metrics
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
@@ -138,35 +195,54 @@ class WebSocketHandler:
                     await self._ready_future
                     messages_remaining = len(message_queue)
 
+                connection = self._connection
+                if (
+                    connection is not None
+                    and connection.flush_delay
+                    and message_queue[0] is not None
+                ):
+                    # Give the messages queued right after this one a
+                    # chance to be sent in the same frame
+                    await asyncio.sleep(connection.flush_delay)
+                    messages_remaining = len(message_queue)
+
                 # A None message is used to signal the end of the connection
                 if (message := message_queue.popleft()) is None:
                     return
 
                 debug_enabled = is_enabled_for(logging_debug)
                 messages_remaining -= 1
+                queued_bytes = len(message)
 
                 if (
                     not messages_remaining
-                    or not (connection := self._connection)
+                    or connection is None
                     or not connection.can_coalesce
                 ):
-                    if debug_enabled:
-                        debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
-                    continue
-
-                messages: list[bytes] = [message]
-                while messages_remaining:
-                    # A None message is used to signal the end of the connection
-                    if (message := message_queue.popleft()) is None:
-                        return
-                    messages.append(message)
-                    messages_remaining -= 1
-
-                coalesced_messages = b"".join((b"[", b",".join(messages), b"]"))
+                    frame = message
+                    frame_messages = 1
+                else:
+                    # Join the messages into a JSON array in one go
+                    parts: list[bytes] = [b"[", message]
+                    frame_messages = messages_remaining + 1
+                    while messages_remaining:
+                        # A None message is used to signal the end of the connection
+                        if (message := message_queue.popleft()) is None:
+                            return
+                        parts.append(b",")
+                        parts.append(message)
+                        queued_bytes += len(message)
+                        messages_remaining -= 1
+                    parts.append(b"]")
+                    frame = b"".join(parts)
+
+                metrics.queued_messages -= frame_messages
+                metrics.queued_bytes -= queued_bytes
                 if debug_enabled:
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                    debug("%s: Sending %s", self.description, frame)
+                sending = loop.time()
+                await send_bytes_text(frame)
+                metrics.frame_sent(frame_messages, len(frame), loop.time() - sending)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -203,6 +279,7 @@ class WebSocketHandler:
             message = message.encode("utf-8")
 
         message_queue = self._message_queue
+        metrics = self._metrics
         queue_size_before_add = len(message_queue)
         if queue_size_before_add >= MAX_PENDING_MSG:
             self._logger.error(
@@ -218,7 +295,24 @@ class WebSocketHandler:
             self._cancel()
             return
 
+        if metrics.queued_bytes >= MAX_PENDING_BYTES:
+            self._logger.error(
+                (
+                    "%s: Client unable to keep up with pending messages. Reached %s"
+                    " pending bytes. The system's load is too high or an integration"
+                    " is misbehaving"
+                ),
+                self.description,
+                MAX_PENDING_BYTES,
+            )
+            self._cancel()
+            return
+
         message_queue.append(message)
+        metrics.queued_messages += 1
+        metrics.queued_bytes += len(message)
+        if metrics.queued_bytes > metrics.max_queued_bytes:
+            metrics.max_queued_bytes = metrics.queued_bytes
         ready_future = self._ready_future
         if ready_future and not ready_future.done():
             ready_future.set_result(None)
@@ -340,6 +434,9 @@ class WebSocketHandler:
             self._connection = connection
             self._writer_task = create_eager_task(self._writer(send_bytes_text))
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
+            self._metrics.description = self.description
+            self._metrics.compressed = bool(wsock.compress)
+            hass.data.setdefault(DATA_WRITER_METRICS, set()).add(self._metrics)
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
 
             self._authenticated = True
@@ -465,6 +562,7 @@ class WebSocketHandler:
 
                     if connection is not None:
                         hass.data[DATA_CONNECTIONS] -= 1
+                        hass.data[DATA_WRITER_METRICS].discard(self._metrics)
                         self._connection = None
 
                     async_dispatcher_send(hass, SIGNAL_WEBSOCKET_DISCONNECTED)
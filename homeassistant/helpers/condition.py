@@ -91,6 +91,21 @@ _PLATFORM_ALIASES = {
     "zone": None,
 }
 
+# Relative cost of evaluating a condition. The conditions of an and, or
+# and not condition are evaluated from the cheapest to the most expensive,
+# their result does not depend on the order of evaluation.
+_CONDITION_COST = {
+    "trigger": 1,
+    "state": 2,
+    "numeric_state": 2,
+    "zone": 3,
+    "template": 4,
+    "time": 5,
+    "sun": 6,
+}
+# Conditions provided by integrations, for example device conditions
+_DEFAULT_CONDITION_COST = 4
+
 INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
@@ -184,6 +199,55 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     return wrapper
 
 
+def _condition_cost(config: ConfigType) -> int:
+    """Return the estimated cost of evaluating a condition."""
+    if not config.get(CONF_ENABLED, True):
+        return 0
+    condition = config[CONF_CONDITION]
+    if condition in ("and", "or", "not"):
+        return sum(_condition_cost(entry) for entry in config["conditions"])
+    if condition == "numeric_state" and CONF_VALUE_TEMPLATE in config:
+        return _CONDITION_COST["template"]
+    return _CONDITION_COST.get(condition, _DEFAULT_CONDITION_COST)
+
+
+def _evaluation_order(configs: list[ConfigType]) -> list[int]:
+    """Return the indexes of the conditions from the cheapest to evaluate."""
+    return sorted(
+        range(len(configs)), key=[_condition_cost(c) for c in configs].__getitem__
+    )
+
+
+class _SecondCache:
+    """Reuse the result of a time based condition within the same second.
+
+    The trace result of the evaluation is kept and replayed, traces of
+    cached evaluations still show the compared times.
+    """
+
+    __slots__ = ("_second", "_result", "_trace_result")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._second: datetime | None = None
+        self._result = False
+        self._trace_result: dict[str, Any] | None = None
+
+    def async_get(self, now: datetime, check: Callable[..., bool], *args: Any) -> bool:
+        """Return the cached result for the second of now or evaluate check."""
+        second = now.replace(microsecond=0)
+        node = trace_stack_top(trace_stack_cv)
+        if second == self._second and (node is None or self._trace_result is not None):
+            if node is not None and self._trace_result:
+                node.set_result(**self._trace_result)
+            return self._result
+        result = check(*args)
+        self._second = second
+        self._result = result
+        self._trace_result = None if node is None else dict(node.result or {})
+        return result
+
+
 async def _async_get_condition_platform(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionProtocol | None:
@@ -253,6 +317,7 @@ async def async_and_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'AND'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    order = _evaluation_order(config["conditions"])
 
     @trace_condition_function
     def if_and_condition(
@@ -260,10 +325,10 @@ async def async_and_from_config(
     ) -> bool:
         """Test and condition."""
         errors = []
-        for index, check in enumerate(checks):
+        for index in order:
             try:
                 with trace_path(["conditions", str(index)]):
-                    if check(hass, variables) is False:
+                    if checks[index](hass, variables) is False:
                         return False
             except ConditionError as ex:
                 errors.append(
@@ -272,6 +337,7 @@ async def async_and_from_config(
 
         # Raise the errors if no check was false
         if errors:
+            errors.sort(key=lambda error: error.index)
             raise ConditionErrorContainer("and", errors=errors)
 
         return True
@@ -284,6 +350,7 @@ async def async_or_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'OR'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    order = _evaluation_order(config["conditions"])
 
     @trace_condition_function
     def if_or_condition(
@@ -291,10 +358,10 @@ async def async_or_from_config(
     ) -> bool:
         """Test or condition."""
         errors = []
-        for index, check in enumerate(checks):
+        for index in order:
             try:
                 with trace_path(["conditions", str(index)]):
-                    if check(hass, variables) is True:
+                    if checks[index](hass, variables) is True:
                         return True
             except ConditionError as ex:
                 errors.append(
@@ -303,6 +370,7 @@ async def async_or_from_config(
 
         # Raise the errors if no check was true
         if errors:
+            errors.sort(key=lambda error: error.index)
             raise ConditionErrorContainer("or", errors=errors)
 
         return False
@@ -315,6 +383,7 @@ async def async_not_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'NOT'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    order = _evaluation_order(config["conditions"])
 
     @trace_condition_function
     def if_not_condition(
@@ -322,10 +391,10 @@ async def async_not_from_config(
     ) -> bool:
         """Test not condition."""
         errors = []
-        for index, check in enumerate(checks):
+        for index in order:
             try:
                 with trace_path(["conditions", str(index)]):
-                    if check(hass, variables):
+                    if checks[index](hass, variables):
                         return False
             except ConditionError as ex:
                 errors.append(
@@ -334,6 +403,7 @@ async def async_not_from_config(
 
         # Raise the errors if no check was true
         if errors:
+            errors.sort(key=lambda error: error.index)
             raise ConditionErrorContainer("not", errors=errors)
 
         return True
@@ -739,11 +809,14 @@ def sun_from_config(config: ConfigType) -> ConditionCheckerType:
     after = config.get("after")
     before_offset = config.get("before_offset")
     after_offset = config.get("after_offset")
+    cache = _SecondCache()
 
     @trace_condition_function
     def sun_if(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Validate time based if-condition."""
-        return sun(hass, before, after, before_offset, after_offset)
+        return cache.async_get(
+            dt_util.utcnow(), sun, hass, before, after, before_offset, after_offset
+        )
 
     return sun_if
 
@@ -882,11 +955,17 @@ def time_from_config(config: ConfigType) -> ConditionCheckerType:
     before = config.get(CONF_BEFORE)
     after = config.get(CONF_AFTER)
     weekday = config.get(CONF_WEEKDAY)
+    # Times read from entities may change within the second
+    cache = (
+        None if isinstance(before, str) or isinstance(after, str) else _SecondCache()
+    )
 
     @trace_condition_function
     def time_if(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Validate time based if-condition."""
-        return time(hass, before, after, weekday)
+        if cache is None:
+            return time(hass, before, after, weekday)
+        return cache.async_get(dt_util.now(), time, hass, before, after, weekday)
 
     return time_if
 
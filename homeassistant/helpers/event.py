@@ -8,7 +8,10 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+from heapq import heapify, heappop, heappush
+from itertools import count
 import logging
+import math
 from random import randint
 import time
 from typing import (
@@ -1363,7 +1366,7 @@ def async_track_same_state(
             async_remove_state_for_cancel = None
 
     @callback
-    def state_for_listener(now: Any) -> None:
+    def state_for_listener() -> None:
         """Fire on state changes after a delay and calls action."""
         nonlocal async_remove_state_for_listener
         async_remove_state_for_listener = None
@@ -1380,7 +1383,15 @@ def async_track_same_state(
         if not async_check_same_func(entity, from_state, to_state):
             clear_listener()
 
-    async_remove_state_for_listener = async_call_later(hass, period, state_for_listener)
+    # The period is tracked on the loop clock timer wheel since many for:
+    # triggers are waiting at the same time. The period is relative, so it
+    # is measured on the loop clock which is not affected by steps of the
+    # wall clock
+    async_remove_state_for_listener = (
+        _async_loop_timer_wheel(hass)
+        .async_schedule(hass.loop.time() + period.total_seconds(), state_for_listener)
+        .async_cancel
+    )
 
     if entity_ids == MATCH_ALL:
         async_remove_state_for_cancel = hass.bus.async_listen(
@@ -1730,6 +1741,213 @@ track_sunset = threaded_listener_factory(async_track_sunset)
 time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
+TIMER_WHEEL = "timer_wheel"
+LOOP_TIMER_WHEEL = "loop_timer_wheel"
+
+
+@dataclass(slots=True, eq=False)
+class _TimerWheelEntry:
+    """A callback scheduled on the timer wheel."""
+
+    wheel: _TimerWheel
+    when: float
+    action: Callable[[], None]
+    cancelled: bool = False
+    buckets: dict[int, dict[_TimerWheelEntry, None]] | None = None
+    key: int = 0
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the callback."""
+        if not self.cancelled:
+            self.cancelled = True
+            self.wheel.async_remove(self)
+
+
+class _TimerWheel:
+    """Multiplex second and minute resolution timers onto one loop timer.
+
+    Entries due in the current minute are kept in buckets by second and
+    later entries in buckets by minute which are cascaded into the second
+    buckets once their minute starts. Entries of the seconds which are
+    due are moved into a heap to run them in order. Scheduling and
+    cancelling an entry only touches its bucket, and the loop timer is
+    only moved when an entry is due before the current one fires.
+
+    Entries are scheduled at wall clock timestamps, or at loop clock times
+    if loop_clock is set.
+    """
+
+    def __init__(self, hass: HomeAssistant, loop_clock: bool = False) -> None:
+        """Initialize the timer wheel."""
+        self._hass = hass
+        self._loop_clock = loop_clock
+        self._heap: list[tuple[float, int, _TimerWheelEntry]] = []
+        self._heap_second = -1
+        self._seconds: dict[int, dict[_TimerWheelEntry, None]] = {}
+        self._minute_cursor = -1
+        self._minutes: dict[int, dict[_TimerWheelEntry, None]] = {}
+        self._minute_heap: list[int] = []
+        self._sequence = count()
+        self._size = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_when = math.inf
+
+    def __len__(self) -> int:
+        """Return the number of scheduled entries."""
+        return self._size
+
+    @callback
+    def async_schedule(
+        self, timestamp: float, action: Callable[[], None]
+    ) -> _TimerWheelEntry:
+        """Run action at or after the timestamp."""
+        entry = _TimerWheelEntry(self, timestamp, action)
+        self._size += 1
+        self._insert(entry)
+        if timestamp < self._timer_when:
+            self._arm(timestamp)
+        return entry
+
+    @callback
+    def async_remove(self, entry: _TimerWheelEntry) -> None:
+        """Remove a cancelled entry."""
+        self._size -= 1
+        if (buckets := entry.buckets) is not None:
+            bucket = buckets[entry.key]
+            del bucket[entry]
+            if not bucket:
+                del buckets[entry.key]
+            entry.buckets = None
+        # Entries in the heap are skipped once they are popped
+        if not self._size:
+            self._cancel_timer()
+
+    def _cancel_timer(self) -> None:
+        """Cancel the loop timer."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            self._timer_when = math.inf
+
+    def _insert(self, entry: _TimerWheelEntry) -> None:
+        """Insert an entry in its bucket or the heap."""
+        second = int(entry.when)
+        if second <= self._heap_second:
+            heappush(self._heap, (entry.when, next(self._sequence), entry))
+            entry.buckets = None
+            return
+        if (minute := second // 60) <= self._minute_cursor:
+            buckets, key = self._seconds, second
+        else:
+            buckets, key = self._minutes, minute
+            if minute not in buckets:
+                heappush(self._minute_heap, minute)
+        if (bucket := buckets.get(key)) is None:
+            bucket = buckets[key] = {}
+        bucket[entry] = None
+        entry.buckets = buckets
+        entry.key = key
+
+    def _advance(self, second: int) -> None:
+        """Move the entries due up to the end of second into the heap."""
+        if (minute := second // 60) > self._minute_cursor:
+            self._minute_cursor = minute
+            minute_heap = self._minute_heap
+            while minute_heap and minute_heap[0] <= minute:
+                if bucket := self._minutes.pop(heappop(minute_heap), None):
+                    for entry in bucket:
+                        self._insert(entry)
+        if second > self._heap_second:
+            self._heap_second = second
+            heap = self._heap
+            sequence = self._sequence
+            for key in [key for key in self._seconds if key <= second]:
+                for entry in self._seconds.pop(key):
+                    entry.buckets = None
+                    heap.append((entry.when, next(sequence), entry))
+            heapify(heap)
+
+    def _arm(self, timestamp: float) -> None:
+        """Arm the loop timer to fire at the timestamp."""
+        self._cancel_timer()
+        loop = self._hass.loop
+        self._timer_when = timestamp
+        if not self._loop_clock:
+            timestamp = loop.time() + timestamp - time.time()
+        self._timer = loop.call_at(timestamp, self._async_fire)
+
+    @callback
+    def _async_fire(self) -> None:
+        """Run the due entries and arm the timer for the next one."""
+        self._timer = None
+        if self._loop_clock:
+            # The loop runs the timer once it is due
+            now = max(self._hass.loop.time(), self._timer_when)
+        else:
+            # Like _TrackPointUTCTime the entries are never run early when
+            # the timer fires a little bit too early as measured by utcnow()
+            now = time_tracker_timestamp()
+        self._timer_when = math.inf
+        self._advance(int(now))
+        heap = self._heap
+        due: list[_TimerWheelEntry] = []
+        while heap and heap[0][0] <= now:
+            if not (entry := heappop(heap)[2]).cancelled:
+                due.append(entry)
+        if (timestamp := self._next_timestamp()) is not None:
+            self._arm(timestamp)
+        loop = self._hass.loop
+        for entry in due:
+            # An entry can be cancelled by one which ran before it
+            if entry.cancelled:
+                continue
+            entry.cancelled = True
+            self._size -= 1
+            try:
+                entry.action()
+            except Exception as err:  # pylint: disable=broad-except
+                loop.call_exception_handler(
+                    {
+                        "message": f"Exception in timer wheel callback {entry.action}",
+                        "exception": err,
+                    }
+                )
+        if not self._size:
+            self._cancel_timer()
+
+    def _next_timestamp(self) -> float | None:
+        """Return the timestamp of the next entry."""
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heappop(heap)
+        if heap:
+            return heap[0][0]
+        if self._seconds:
+            return min(entry.when for entry in self._seconds[min(self._seconds)])
+        minute_heap = self._minute_heap
+        while minute_heap and minute_heap[0] not in self._minutes:
+            heappop(minute_heap)
+        if minute_heap:
+            return min(entry.when for entry in self._minutes[minute_heap[0]])
+        return None
+
+
+@callback
+def _async_timer_wheel(hass: HomeAssistant) -> _TimerWheel:
+    """Return the timer wheel of hass."""
+    if (wheel := hass.data.get(TIMER_WHEEL)) is None:
+        wheel = hass.data[TIMER_WHEEL] = _TimerWheel(hass)
+    return wheel
+
+
+@callback
+def _async_loop_timer_wheel(hass: HomeAssistant) -> _TimerWheel:
+    """Return the loop clock timer wheel of hass."""
+    if (wheel := hass.data.get(LOOP_TIMER_WHEEL)) is None:
+        wheel = hass.data[LOOP_TIMER_WHEEL] = _TimerWheel(hass, loop_clock=True)
+    return wheel
+
 
 @dataclass(slots=True)
 class _TrackUTCTimeChange:
@@ -1738,21 +1956,15 @@ class _TrackUTCTimeChange:
     microsecond: int
     local: bool
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
-    listener_job_name: str
-    _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
-    _cancel_callback: CALLBACK_TYPE | None = None
+    _wheel: _TimerWheel | None = None
+    _entry: _TimerWheelEntry | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        self._pattern_time_change_listener_job = HassJob(
+        self._wheel = _async_timer_wheel(self.hass)
+        self._entry = self._wheel.async_schedule(
+            self._calculate_next(dt_util.utcnow()).timestamp(),
             self._pattern_time_change_listener,
-            self.listener_job_name,
-            job_type=HassJobType.Callback,
-        )
-        self._cancel_callback = async_track_point_in_utc_time(
-            self.hass,
-            self._pattern_time_change_listener_job,
-            self._calculate_next(dt_util.utcnow()),
         )
 
     def _calculate_next(self, utc_now: datetime) -> datetime:
@@ -1763,7 +1975,7 @@ class _TrackUTCTimeChange:
         ).replace(microsecond=self.microsecond)
 
     @callback
-    def _pattern_time_change_listener(self, _: datetime) -> None:
+    def _pattern_time_change_listener(self) -> None:
         """Listen for matching time_changed events."""
         hass = self.hass
         # Fetch time again because we want the actual time, not the
@@ -1774,19 +1986,18 @@ class _TrackUTCTimeChange:
             self.job, localized_now, eager_start=True, background=True
         )
         if TYPE_CHECKING:
-            assert self._pattern_time_change_listener_job is not None
-        self._cancel_callback = async_track_point_in_utc_time(
-            hass,
-            self._pattern_time_change_listener_job,
-            self._calculate_next(utc_now + timedelta(seconds=1)),
+            assert self._wheel is not None
+        self._entry = self._wheel.async_schedule(
+            self._calculate_next(utc_now + timedelta(seconds=1)).timestamp(),
+            self._pattern_time_change_listener,
         )
 
     @callback
     def async_cancel(self) -> None:
-        """Cancel the call_at."""
+        """Cancel the scheduled entry."""
         if TYPE_CHECKING:
-            assert self._cancel_callback is not None
-        self._cancel_callback()
+            assert self._entry is not None
+        self._entry.async_cancel()
 
 
 @callback
@@ -1821,14 +2032,12 @@ def async_track_utc_time_change(
     # since it can create a thundering herd problem
     # https://github.com/home-assistant/core/issues/82231
     microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-    listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
     track = _TrackUTCTimeChange(
         hass,
         (matching_seconds, matching_minutes, matching_hours),
         microsecond,
         local,
         job,
-        listener_job_name,
     )
     track.async_attach()
     return track.async_cancel
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+from collections.abc import AsyncGenerator, Callable, Coroutine, Mapping, Sequence
 from contextlib import asynccontextmanager, suppress
 from contextvars import ContextVar
 from copy import copy
@@ -63,6 +63,8 @@ from homeassistant.const import (
     CONF_WAIT_FOR_TRIGGER,
     CONF_WAIT_TEMPLATE,
     CONF_WHILE,
+    ENTITY_MATCH_ALL,
+    ENTITY_MATCH_NONE,
     EVENT_HOMEASSISTANT_STOP,
     SERVICE_TURN_ON,
 )
@@ -74,6 +76,7 @@ from homeassistant.core import (
     ServiceResponse,
     SupportsResponse,
     callback,
+    valid_entity_id,
 )
 from homeassistant.util import slugify
 from homeassistant.util.dt import utcnow
@@ -377,6 +380,7 @@ class _ScriptRun:
     """Manage Script sequence run."""
 
     _action: dict[str, Any]
+    _script_step: _ScriptStep
 
     def __init__(
         self,
@@ -429,10 +433,12 @@ class _ScriptRun:
 
         try:
             self._log("Running %s", self._script.running_description)
-            for self._step, self._action in enumerate(self._script.sequence):
+            # pylint: disable-next=protected-access
+            for self._step, self._script_step in enumerate(self._script._steps):
                 if self._stop.is_set():
                     script_execution_set("cancelled")
                     break
+                self._action = self._script_step.config
                 await self._async_step(log_exceptions=False)
             else:
                 script_execution_set("finished")
@@ -463,30 +469,30 @@ class _ScriptRun:
         return ScriptRunResult(self._conversation_response, response, self._variables)
 
     async def _async_step(self, log_exceptions: bool) -> None:
-        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+        step = self._script_step
 
-        with trace_path(str(self._step)):
+        with trace_path(step.trace_path):
             async with trace_action(
                 self._hass, self, self._stop, self._variables
             ) as trace_element:
                 if self._stop.is_set():
                     return
 
-                action = cv.determine_script_action(self._action)
-
-                if not self._action.get(CONF_ENABLED, True):
+                if not step.enabled:
                     self._log(
-                        "Skipped disabled step %s", self._action.get(CONF_ALIAS, action)
+                        "Skipped disabled step %s",
+                        self._action.get(CONF_ALIAS, step.action),
                     )
                     trace_set_result(enabled=False)
                     return
 
                 try:
-                    handler = f"_async_{action}_step"
-                    await getattr(self, handler)()
+                    await step.handler(self)
                 except Exception as ex:  # pylint: disable=broad-except
                     self._handle_exception(
-                        ex, continue_on_error, self._log_exceptions or log_exceptions
+                        ex,
+                        step.continue_on_error,
+                        self._log_exceptions or log_exceptions,
                     )
                 finally:
                     trace_element.update_variables(self._variables)
@@ -692,9 +698,22 @@ class _ScriptRun:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
-        )
+        step = self._script_step
+        if not step.static_service_call:
+            params = service.async_prepare_call_from_config(
+                self._hass, self._action, self._variables
+            )
+        else:
+            if (static_params := step.service_params) is None:
+                static_params = (
+                    step.service_params
+                ) = service.async_prepare_call_from_config(self._hass, self._action)
+            # The service data is updated with the target by the service call
+            params = {
+                **static_params,
+                "service_data": static_params["service_data"].copy(),
+                "target": static_params["target"].copy(),
+            }
 
         # Validate response data parameters. This check ignores services that do
         # not exist which will raise an appropriate error in the service call below.
@@ -780,7 +799,9 @@ class _ScriptRun:
         self._script.last_action = self._action.get(
             CONF_ALIAS, self._action[CONF_CONDITION]
         )
-        cond = await self._async_get_condition(self._action)
+        step = self._script_step
+        if (cond := step.condition) is None:
+            cond = step.condition = await self._async_get_condition(self._action)
         try:
             trace_element = trace_stack_top(trace_stack_cv)
             if trace_element:
@@ -1212,6 +1233,63 @@ def _referenced_extract_ids(data: Any, key: str, found: set[str]) -> None:
             found.add(item_id)
 
 
+@dataclass(slots=True)
+class _ScriptStep:
+    """A step of a script sequence prepared once for all runs of the script."""
+
+    config: dict[str, Any]
+    action: str
+    trace_path: str
+    handler: Callable[[_ScriptRun], Coroutine[Any, Any, None]]
+    enabled: bool
+    continue_on_error: bool
+    # Service calls without templates are only prepared on their first run
+    static_service_call: bool = False
+    service_params: service.ServiceParams | None = None
+    condition: ConditionCheckerType | None = None
+
+
+def _is_static_service_call(config: dict[str, Any]) -> bool:
+    """Return if a service call renders the same parameters on every run."""
+    if CONF_SERVICE not in config or any(
+        template.is_complex(config.get(key))
+        for key in (
+            CONF_SERVICE,
+            CONF_TARGET,
+            CONF_SERVICE_DATA,
+            CONF_SERVICE_DATA_TEMPLATE,
+        )
+    ):
+        return False
+    # Entity registry ids are resolved to entity ids on every run
+    if not isinstance(target := config.get(CONF_TARGET), dict) or (
+        entity_ids := target.get(ATTR_ENTITY_ID)
+    ) in (None, ENTITY_MATCH_ALL, ENTITY_MATCH_NONE):
+        return True
+    if isinstance(entity_ids, str):
+        try:
+            entity_ids = cv.comp_entity_ids_or_uuids(entity_ids)
+        except vol.Invalid:
+            return False
+    return all(valid_entity_id(entity_id) for entity_id in entity_ids)
+
+
+def _prepare_step(index: int, config: dict[str, Any]) -> _ScriptStep:
+    """Prepare a step of a script sequence."""
+    action = cv.determine_script_action(config)
+    return _ScriptStep(
+        config,
+        action,
+        str(index),
+        getattr(_ScriptRun, f"_async_{action}_step"),
+        config.get(CONF_ENABLED, True),
+        config.get(CONF_CONTINUE_ON_ERROR, False),
+        static_service_call=(
+            action == cv.SCRIPT_ACTION_CALL_SERVICE and _is_static_service_call(config)
+        ),
+    )
+
+
 class _ChooseData(TypedDict):
     choices: list[tuple[list[ConditionCheckerType], Script]]
     default: Script | None
@@ -1271,6 +1349,9 @@ class Script:
         self._hass = hass
         self.sequence = sequence
         template.attach(hass, self.sequence)
+        self._steps = [
+            _prepare_step(index, config) for index, config in enumerate(sequence)
+        ]
         self.name = name
         self.domain = domain
         self.running_description = running_description or f"{domain} script"
@@ -7,6 +7,7 @@ from collections.abc import Callable, Coroutine, Generator
 from contextlib import contextmanager
 from contextvars import ContextVar
 from functools import wraps
+import time
 from typing import Any, TypeVar, TypeVarTuple
 
 from homeassistant.core import ServiceResponse
@@ -19,7 +20,13 @@ _Ts = TypeVarTuple("_Ts")
 
 
 class TraceElement:
-    """Container for trace data."""
+    """Container for trace data.
+
+    To keep tracing cheap for automations which run often, the element
+    only keeps the time and a snapshot of the variables. The changed
+    variables are determined when the element is expanded with as_dict.
+    Nothing is recorded when recording is turned off for the current run.
+    """
 
     __slots__ = (
         "_child_key",
@@ -41,15 +48,26 @@ class TraceElement:
         self.path: str = path
         self._result: dict[str, Any] | None = None
         self.reuse_by_child = False
-        self._timestamp = dt_util.utcnow()
+        self._timestamp = time.time()
+        self._variables: dict[str, Any] | None = None
 
-        self._last_variables = variables_cv.get() or {}
+        self._last_variables: dict[str, Any] = variables_cv.get() or {}
         self.update_variables(variables)
 
     def __repr__(self) -> str:
         """Container for trace data."""
         return str(self.as_dict())
 
+    @property
+    def error(self) -> Exception | None:
+        """Return the error."""
+        return self._error
+
+    @property
+    def result(self) -> dict[str, Any] | None:
+        """Return the result."""
+        return self._result
+
     def set_child_id(self, child_key: str, child_run_id: str) -> None:
         """Set trace id of a nested script run."""
         self._child_key = child_key
@@ -70,20 +88,30 @@ class TraceElement:
 
     def update_variables(self, variables: TemplateVarsType) -> None:
         """Update variables."""
-        if variables is None:
-            variables = {}
+        if not trace_recording_cv.get():
+            return
+        # The snapshot is shared with the next element, which compares
+        # its variables with it
+        self._variables = {} if variables is None else dict(variables)
+        variables_cv.set(self._variables)
+
+    def _changed_variables(self) -> dict[str, Any]:
+        """Return the variables which changed since the previous element."""
+        if not (variables := self._variables):
+            return {}
         last_variables = self._last_variables
-        variables_cv.set(dict(variables))
-        changed_variables = {
+        return {
             key: value
             for key, value in variables.items()
             if key not in last_variables or last_variables[key] != value
         }
-        self._variables = changed_variables
 
     def as_dict(self) -> dict[str, Any]:
         """Return dictionary version of this TraceElement."""
-        result: dict[str, Any] = {"path": self.path, "timestamp": self._timestamp}
+        result: dict[str, Any] = {
+            "path": self.path,
+            "timestamp": dt_util.utc_from_timestamp(self._timestamp),
+        }
         if self._child_key is not None:
             domain, _, item_id = self._child_key.partition(".")
             result["child_id"] = {
@@ -91,8 +119,8 @@ class TraceElement:
                 "item_id": item_id,
                 "run_id": str(self._child_run_id),
             }
-        if self._variables:
-            result["changed_variables"] = self._variables
+        if changed_variables := self._changed_variables():
+            result["changed_variables"] = changed_variables
         if self._error is not None:
             result["error"] = str(self._error) or self._error.__class__.__name__
         if self._result is not None:
@@ -119,6 +147,8 @@ variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
 trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "trace_id_cv", default=None
 )
+# If the current run is recorded
+trace_recording_cv: ContextVar[bool] = ContextVar("trace_recording_cv", default=True)
 # Reason for stopped script execution
 script_execution_cv: ContextVar[StopReason | None] = ContextVar(
     "script_execution_cv", default=None
@@ -184,6 +214,8 @@ def trace_append_element(
     maxlen: int | None = None,
 ) -> None:
     """Append a TraceElement to trace[path]."""
+    if not trace_recording_cv.get():
+        return
     if (trace := trace_cv.get()) is None:
         trace = {}
         trace_cv.set(trace)
@@ -192,6 +224,16 @@ def trace_append_element(
     trace[path].append(trace_element)
 
 
+@contextmanager
+def trace_recording(recording: bool) -> Generator[None, None, None]:
+    """Turn recording of trace elements on or off for a run."""
+    token = trace_recording_cv.set(recording)
+    try:
+        yield
+    finally:
+        trace_recording_cv.reset(token)
+
+
 def trace_get(clear: bool = True) -> dict[str, deque[TraceElement]] | None:
     """Return the current trace."""
     if clear:
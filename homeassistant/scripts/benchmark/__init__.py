@@ -7,6 +7,7 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import UTC, datetime, timedelta
 import json
 import logging
 from timeit import default_timer as timer
@@ -228,6 +229,530 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def numeric_state_triggers(hass):
+    """Run 10k state changes through numeric state triggers of one entity.
+
+    Prints the cost per state change for an increasing number of triggers.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.homeassistant.triggers import numeric_state
+
+    entity_id = "sensor.power"
+    state_changes = 10**4
+    total = 0.0
+    count = 0
+
+    @core.callback
+    def action(*args):
+        """Handle trigger."""
+        nonlocal count
+        count += 1
+
+    hass.states.async_set(entity_id, "0")
+    for triggers in (1, 10, 100, 1000, 1500):
+        unsubs = [
+            await numeric_state.async_attach_trigger(
+                hass,
+                {"entity_id": [entity_id], "above": idx % 3000},
+                action,
+                {"trigger_data": {}, "variables": None, "name": f"trigger {idx}"},
+            )
+            for idx in range(triggers)
+        ]
+        start = timer()
+        for idx in range(state_changes):
+            hass.states.async_set(entity_id, str(idx * 7 % 3000))
+        await hass.async_block_till_done()
+        runtime = timer() - start
+        total += runtime
+        print(
+            f"{triggers} triggers: {runtime / state_changes * 10**6:.1f}us"
+            " per state change"
+        )
+        for unsub in unsubs:
+            unsub()
+
+    assert count
+
+    return total
+
+
+@benchmark
+async def automation_trace_modes(hass):
+    """Run an automation action 2k times in each trace mode.
+
+    Prints the cost per run for each mode.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import trace as trace_component
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.automation.trace import trace_automation
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv, script, trace
+
+    await trace_component.async_setup(hass, {})
+    runs = 2000
+    total = 0.0
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"variables": {f"step_{idx}": "{{ trigger.value + %s }}" % idx}}
+            for idx in range(10)
+        ]
+    )
+    action_script = script.Script(
+        hass, sequence, "Benchmark", "automation", script_mode="parallel"
+    )
+    trace_configs = {
+        "full": {"stored_traces": 5, "mode": "full"},
+        "sampled": {"stored_traces": 5, "mode": "sampled", "sample_rate": 10},
+        "errors": {"stored_traces": 5, "mode": "errors"},
+        "off": {"stored_traces": 5, "mode": "off"},
+    }
+    for mode, trace_config in trace_configs.items():
+        start = timer()
+        for idx in range(runs):
+            context = core.Context()
+            with trace_automation(
+                hass, f"benchmark_{mode}", None, None, context, trace_config
+            ) as automation_trace:
+                variables = {"trigger": {"value": idx}}
+                automation_trace.set_trace(trace.trace_get())
+                trace.trace_append_element(trace.TraceElement(variables, "trigger/0"))
+                with trace.trace_path("action"):
+                    await action_script.async_run(variables, context)
+        runtime = timer() - start
+        total += runtime
+        print(f"{mode}: {runtime / runs * 10**6:.1f}us per run")
+
+    return total
+
+
+@benchmark
+async def script_runs(hass):
+    """Run a short motion to light script 10k times.
+
+    Prints the number of runs per second.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        config_validation as cv,
+        entity_registry as er,
+        script,
+    )
+
+    await er.async_load(hass)
+    runs = 10**4
+    calls = 0
+
+    @core.callback
+    def turn_on(call):
+        """Handle light.turn_on."""
+        nonlocal calls
+        calls += 1
+
+    hass.services.async_register("light", "turn_on", turn_on)
+    hass.states.async_set("binary_sensor.motion", "on")
+    hass.states.async_set("sun.sun", "below_horizon")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "condition": "state",
+                "entity_id": "sun.sun",
+                "state": "below_horizon",
+            },
+            {
+                "service": "light.turn_on",
+                "target": {"entity_id": ["light.hallway", "light.stairs"]},
+                "data": {"brightness_pct": 80, "transition": 1},
+            },
+        ]
+    )
+    motion_script = script.Script(
+        hass, sequence, "Benchmark", "automation", script_mode="parallel"
+    )
+    context = core.Context()
+    start = timer()
+    for _ in range(runs):
+        await motion_script.async_run({"trigger": {"platform": "state"}}, context)
+    runtime = timer() - start
+    assert calls == runs
+    print(f"{runs / runtime:.0f} runs/s")
+
+    return runtime
+
+
+@benchmark
+async def condition_choose_options(hass):
+    """Evaluate the conditions of 20 choose options 5k times.
+
+    Each option checks the sun, a template and the state of a motion
+    sensor which only matches for the last option.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import condition, config_validation as cv
+
+    runs = 5 * 10**3
+    hass.config.latitude = 52.37
+    hass.config.longitude = 4.89
+    hass.states.async_set("sensor.lux", "40")
+    for index in range(20):
+        hass.states.async_set(f"binary_sensor.motion_{index}", "off")
+    hass.states.async_set("binary_sensor.motion_19", "on")
+    checks = []
+    for index in range(20):
+        config = cv.CONDITIONS_SCHEMA(
+            {
+                "and": [
+                    {"condition": "sun", "after": "sunset", "before": "sunrise"},
+                    "{{ states('sensor.lux') | int < 50 }}",
+                    {
+                        "condition": "state",
+                        "entity_id": f"binary_sensor.motion_{index}",
+                        "state": "on",
+                    },
+                ]
+            }
+        )[0]
+        checks.append(await condition.async_from_config(hass, config))
+    start = timer()
+    for _ in range(runs):
+        for check in checks:
+            check(hass, None)
+    runtime = timer() - start
+    print(f"{runs / runtime:.0f} evaluations of all options/s")
+
+    return runtime
+
+
+@benchmark
+async def group_member_changes(hass):
+    """Change the members of a binary sensor and a sensor group 10k times.
+
+    Each group has 500 members. Prints the number of changes per second.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.group.binary_sensor import BinarySensorGroup
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.group.sensor import SensorGroup
+
+    changes = 10**4
+    members = 500
+    hass.set_state(core.CoreState.running)
+    windows = [f"binary_sensor.window_{index}" for index in range(members)]
+    power = [f"sensor.power_{index}" for index in range(members)]
+    for index in range(members):
+        hass.states.async_set(windows[index], "off")
+        hass.states.async_set(power[index], str(index))
+    windows_group = BinarySensorGroup(None, "Windows", None, windows, False)
+    power_group = SensorGroup(
+        hass, None, "Power", power, False, "sum", None, None, None
+    )
+    for entity_id, group in (
+        ("binary_sensor.windows", windows_group),
+        ("sensor.power", power_group),
+    ):
+        group.hass = hass
+        group.entity_id = entity_id
+        await group.async_added_to_hass()
+    await hass.async_block_till_done()
+
+    start = timer()
+    for change in range(changes):
+        index = change % members
+        hass.states.async_set(windows[index], "on" if change % 2 else "off")
+        hass.states.async_set(power[index], str(change))
+        if not index:
+            await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    runtime = timer() - start
+    print(f"{changes / runtime:.0f} changes/s")
+
+    return runtime
+
+
+@benchmark
+async def filter_time_windows(hass):
+    """Run 20k states through a time SMA and an outlier filter.
+
+    The time window holds an hour of states, one per second. Prints the
+    number of filtered states per second.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.filter.sensor import (
+        OutlierFilter,
+        TimeSMAFilter,
+        _State,
+    )
+
+    count = 2 * 10**4
+    time_sma = TimeSMAFilter(
+        window_size=timedelta(hours=1), entity="sensor.test", type="last"
+    )
+    outlier = OutlierFilter(window_size=10, entity="sensor.test", radius=5.0)
+    base = datetime.now(UTC)
+
+    start = timer()
+    for index in range(count):
+        state = _State(base + timedelta(seconds=index), index % 100)
+        time_sma.filter_state(outlier.filter_state(state))
+    runtime = timer() - start
+    print(f"{count / runtime:.0f} states/s")
+
+    return runtime
+
+
+@benchmark
+async def history_sensors_warmup(hass):
+    """Set up 500 statistics and 500 history_stats sensors.
+
+    Each source entity has 20 recorded states. The runtime is the time
+    until all sensors loaded their history from the database. Prints the
+    number of history requests and the queries which answered them.
+    """
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+
+    from homeassistant import bootstrap, config_entries, loader
+    from homeassistant.components import recorder
+    from homeassistant.components.recorder.history.batch import (
+        DATA_STATE_CHANGES_BATCHER,
+    )
+    from homeassistant.helpers import recorder as recorder_helper
+    from homeassistant.setup import async_setup_component
+
+    # pylint: enable=import-outside-toplevel
+
+    sources = 500
+    samples = 20
+    with tempfile.TemporaryDirectory() as db_dir:
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await bootstrap.async_load_base_functionality(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        hass.set_state(core.CoreState.running)
+        assert await async_setup_component(
+            hass,
+            "recorder",
+            {
+                "recorder": {
+                    "db_url": f"sqlite:///{db_dir}/home-assistant_v2.db",
+                    "commit_interval": 0,
+                }
+            },
+        )
+        for sample in range(samples):
+            for index in range(sources):
+                hass.states.async_set(f"sensor.source_{index}", str(sample * index % 7))
+            await hass.async_block_till_done()
+        await recorder.get_instance(hass).async_block_till_done()
+
+        start = timer()
+        assert await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    *(
+                        {
+                            "platform": "statistics",
+                            "name": f"statistics {index}",
+                            "entity_id": f"sensor.source_{index}",
+                            "state_characteristic": "mean",
+                            "sampling_size": 50,
+                            "max_age": {"hours": 1},
+                        }
+                        for index in range(sources)
+                    ),
+                    *(
+                        {
+                            "platform": "history_stats",
+                            "name": f"history stats {index}",
+                            "entity_id": f"sensor.source_{index}",
+                            "state": "1",
+                            "type": "time",
+                            "start": "{{ today_at() }}",
+                            "end": "{{ now() }}",
+                        }
+                        for index in range(sources)
+                    ),
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+        runtime = timer() - start
+
+        batcher = hass.data[DATA_STATE_CHANGES_BATCHER]
+        print(f"{batcher.requests} history requests in {batcher.queries} queries")
+        # The database is removed with the temporary directory
+        await hass.async_stop()
+
+    return runtime
+
+
+async def _async_setup_default_agent(hass):
+    """Set up the default conversation agent without its integration."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.conversation.default_agent import DefaultAgent
+    from homeassistant.components.homeassistant.const import DATA_EXPOSED_ENTITIES
+    from homeassistant.components.homeassistant.exposed_entities import ExposedEntities
+    from homeassistant.helpers import area_registry as ar, entity_registry as er
+
+    # pylint: enable=import-outside-toplevel
+
+    await ar.async_load(hass)
+    await er.async_load(hass)
+    exposed_entities = ExposedEntities(hass)
+    await exposed_entities.async_initialize()
+    hass.data[DATA_EXPOSED_ENTITIES] = exposed_entities
+    hass.config.components.add("intent")
+    agent = DefaultAgent(hass)
+    await agent.async_initialize(None)
+    return agent
+
+
+@benchmark
+async def conversation_exposed_entities(hass):
+    """Recognize a sentence with 5k exposed entities.
+
+    Prints the latency of the first utterance, which loads the intents and
+    gathers the entity names, and the time to update the entity names
+    after an entity was added and another one renamed.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.conversation import ConversationInput
+
+    agent = await _async_setup_default_agent(hass)
+
+    count = 5000
+    for index in range(count):
+        hass.states.async_set(
+            f"light.light_{index}", "off", {"friendly_name": f"Light {index}"}
+        )
+    user_input = ConversationInput(
+        "turn on light 1", core.Context(), None, None, hass.config.language
+    )
+
+    start = timer()
+    await agent.async_recognize(user_input)
+    first = timer() - start
+
+    updates = 1000
+    start = timer()
+    for index in range(updates):
+        hass.states.async_set(f"light.new_{index}", "off")
+        hass.states.async_set(
+            f"light.light_{count - index - 1}",
+            "off",
+            {"friendly_name": f"Lamp {index}"},
+        )
+        # pylint: disable-next=protected-access
+        agent._make_slot_lists()
+    runtime = timer() - start
+    print(f"first utterance {first * 1000:.0f} ms")
+    print(f"{updates / runtime:.0f} name updates/s")
+
+    return first + runtime
+
+
+@benchmark
+async def conversation_recognize(hass):
+    """Recognize 200 sentences with 100 exposed lights in 10 areas.
+
+    Prints the number of recognized sentences per second.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.conversation import ConversationInput
+    from homeassistant.helpers import area_registry as ar
+
+    # pylint: enable=import-outside-toplevel
+
+    agent = await _async_setup_default_agent(hass)
+    area_registry = ar.async_get(hass)
+    for index in range(10):
+        area_registry.async_get_or_create(f"Room {index}")
+    for index in range(100):
+        hass.states.async_set(
+            f"light.light_{index}", "off", {"friendly_name": f"Light {index}"}
+        )
+    sentences = [
+        "turn on light 1",
+        "turn off the lights in room 2",
+        "set light 3 brightness to 50%",
+        "what is the temperature",
+        "is light 4 on?",
+        "add milk to my shopping list",
+        "nevermind",
+        "open the garage door",
+        "how many lights are on in room 5",
+        "this is not a command",
+    ]
+    context = core.Context()
+    await agent.async_prepare(hass.config.language)
+
+    count = 200
+    start = timer()
+    for index in range(count):
+        await agent.async_recognize(
+            ConversationInput(
+                sentences[index % len(sentences)],
+                context,
+                None,
+                None,
+                hass.config.language,
+            )
+        )
+    runtime = timer() - start
+    print(f"{count / runtime:.0f} sentences/s")
+
+    return runtime
+
+
+@benchmark
+async def assist_pipeline_vad(hass):
+    """Run an hour of 16 kHz audio of 3 satellites through voice detection.
+
+    Prints how many times faster than real time the audio is processed.
+    """
+    # pylint: disable=import-outside-toplevel
+    import random
+
+    from homeassistant.components.assist_pipeline.vad import (
+        AudioBuffer,
+        VoiceCommandSegmenter,
+        WebRtcVad,
+    )
+
+    # pylint: enable=import-outside-toplevel
+
+    satellites = 3
+    seconds = 3600
+    # Satellites send 512 samples of 16 bit audio at a time
+    chunk_size = 1024
+    noise = random.Random(0).randbytes(16000 * 2)
+    chunks = [
+        noise[index : index + chunk_size] for index in range(0, len(noise), chunk_size)
+    ]
+    vads = [WebRtcVad() for _ in range(satellites)]
+    buffers = [AudioBuffer(vad.samples_per_chunk * 2) for vad in vads]
+    segmenters = [
+        VoiceCommandSegmenter(timeout_seconds=seconds + 1) for _ in range(satellites)
+    ]
+
+    start = timer()
+    for _ in range(seconds):
+        for chunk in chunks:
+            for vad, buffer, segmenter in zip(vads, buffers, segmenters):
+                segmenter.process_with_vad(chunk, vad, buffer)
+    runtime = timer() - start
+    print(f"{satellites * seconds / runtime:.0f} times real time")
+
+    return runtime
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -0,0 +1,146 @@
+"""Ring buffer of timestamped numeric values."""
+
+from __future__ import annotations
+
+from array import array
+import statistics
+
+_INITIAL_CAPACITY = 8
+
+
+def _zeros(size: int) -> array[float]:
+    """Return a float64 array of size zeros."""
+    return array("d", bytes(8 * size))
+
+
+class NumericRingBuffer:
+    """Timestamped float values kept in two preallocated float64 arrays.
+
+    Storing the timestamps and values as columns takes 16 bytes per entry
+    instead of a tuple or an object with a datetime and a number.
+
+    With a maxlen, appending to a full buffer drops the oldest entry.
+    Without a maxlen the buffer grows as needed and is trimmed by
+    remove_before.
+    """
+
+    __slots__ = ("_capacity", "_maxlen", "_size", "_start", "_timestamps", "_values")
+
+    def __init__(self, maxlen: int | None = None) -> None:
+        """Initialize the buffer."""
+        self._maxlen = maxlen
+        self._capacity = _INITIAL_CAPACITY if maxlen is None else maxlen
+        self._timestamps = _zeros(self._capacity)
+        self._values = _zeros(self._capacity)
+        self._start = 0
+        self._size = 0
+
+    @property
+    def maxlen(self) -> int | None:
+        """Return the maximum number of entries."""
+        return self._maxlen
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return self._size
+
+    def __getitem__(self, index: int) -> tuple[float, float]:
+        """Return the timestamp and value of an entry, oldest first."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ring buffer index out of range")
+        index = (self._start + index) % self._capacity
+        return self._timestamps[index], self._values[index]
+
+    def __repr__(self) -> str:
+        """Return the representation of the buffer."""
+        entries = zip(self.timestamps(), self.values(), strict=True)
+        return f"<NumericRingBuffer maxlen={self._maxlen} {list(entries)}>"
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Append a value."""
+        if self._size == self._capacity:
+            if self._maxlen is not None:
+                if not self._maxlen:
+                    return
+                index = self._start
+                self._start = (index + 1) % self._capacity
+                self._timestamps[index] = timestamp
+                self._values[index] = value
+                return
+            self._grow()
+        index = (self._start + self._size) % self._capacity
+        self._timestamps[index] = timestamp
+        self._values[index] = value
+        self._size += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._start = 0
+        self._size = 0
+
+    def remove_before(self, timestamp: float) -> None:
+        """Remove the entries which no longer apply at timestamp.
+
+        An entry applies until the timestamp of the next one, so the
+        last entry at or before timestamp is kept.
+        """
+        timestamps = self._timestamps
+        capacity = self._capacity
+        while self._size > 1 and timestamps[(self._start + 1) % capacity] <= timestamp:
+            self._start = (self._start + 1) % capacity
+            self._size -= 1
+
+    def timestamps(self) -> array[float]:
+        """Return the timestamps, oldest first."""
+        return self._ordered(self._timestamps)
+
+    def values(self) -> array[float]:
+        """Return the values, oldest first."""
+        return self._ordered(self._values)
+
+    def median(self) -> float:
+        """Return the median of the values."""
+        return statistics.median(self._ordered(self._values))
+
+    def time_weighted_mean(
+        self, start: float, end: float, initial: float | None = None
+    ) -> float:
+        """Return the mean of the values between start and end weighted by time.
+
+        Each value applies from its timestamp until the timestamp of the
+        next one and the last value until end. Before the first timestamp
+        initial applies, or the first value if initial is None.
+        """
+        values = self._ordered(self._values)
+        previous_time = start
+        previous_value = values[0] if initial is None else initial
+        total = 0.0
+        for timestamp, value in zip(
+            self._ordered(self._timestamps), values, strict=True
+        ):
+            if timestamp >= end:
+                break
+            if timestamp > previous_time:
+                total += (timestamp - previous_time) * previous_value
+                previous_time = timestamp
+            previous_value = value
+        if end > previous_time:
+            total += (end - previous_time) * previous_value
+        return total / (end - start)
+
+    def _ordered(self, column: array[float]) -> array[float]:
+        """Return a copy of a column, oldest first."""
+        end = self._start + self._size
+        if end <= self._capacity:
+            return column[self._start : end]
+        return column[self._start :] + column[: end - self._capacity]
+
+    def _grow(self) -> None:
+        """Double the capacity of an unbounded buffer."""
+        extra = self._capacity
+        self._timestamps = self._ordered(self._timestamps) + _zeros(extra)
+        self._values = self._ordered(self._values) + _zeros(extra)
+        self._start = 0
+        self._capacity += extra
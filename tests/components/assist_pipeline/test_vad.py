@@ -165,3 +165,47 @@ def test_vad_no_chunking() -> None:
     # end
     assert segmenter.process_with_vad(silence, vad, None)
     assert not segmenter.process_with_vad(silence, vad, None)
+
+
+def test_chunk_samples_many_chunks() -> None:
+    """Test chunk_samples splits samples into all full chunks."""
+    bytes_per_chunk = 4
+    samples = bytes(range(15))
+    leftover_chunk_buffer = AudioBuffer(bytes_per_chunk)
+    leftover_chunk_buffer.append(bytes([100, 101]))
+    chunks = chunk_samples(samples, bytes_per_chunk, leftover_chunk_buffer)
+
+    assert chunks == [
+        bytes([100, 101, 0, 1]),
+        bytes([2, 3, 4, 5]),
+        bytes([6, 7, 8, 9]),
+        bytes([10, 11, 12, 13]),
+    ]
+    assert leftover_chunk_buffer.bytes() == bytes([14])
+
+
+def test_vad_batch_stops_when_command_finished() -> None:
+    """Test the speech of a batch of chunks is processed until the command ends."""
+
+    class SumVad(VoiceActivityDetector):
+        def is_speech(self, chunk: bytes) -> bool:
+            return sum(chunk) > 0
+
+        @property
+        def samples_per_chunk(self) -> int | None:
+            return 160  # 10 ms
+
+    vad = SumVad()
+    vad_buffer = AudioBuffer(vad.samples_per_chunk * 2)
+    segmenter = VoiceCommandSegmenter(
+        speech_seconds=0.02, silence_seconds=0.02, reset_seconds=0.5
+    )
+    speech = bytes([255] * 320 * 3)
+    silence = bytes(320 * 3)
+
+    assert vad.is_speech_batch([speech[:320], silence[:320]]) == [True, False]
+    assert segmenter.process_with_vad(speech, vad, vad_buffer)
+    assert segmenter.in_command
+    with patch.object(segmenter, "process", wraps=segmenter.process) as mock_process:
+        assert not segmenter.process_with_vad(silence, vad, vad_buffer)
+    assert mock_process.call_count == 2
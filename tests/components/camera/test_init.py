@@ -1,5 +1,6 @@
 """The tests for the camera component."""
 
+import asyncio
 from http import HTTPStatus
 import io
 from types import ModuleType
@@ -9,6 +10,7 @@ import pytest
 
 from homeassistant.components import camera
 from homeassistant.components.camera.const import (
+    DATA_STILL_STREAMS,
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
@@ -564,6 +566,53 @@ async def test_camera_proxy_stream(
             assert response.status == HTTPStatus.BAD_GATEWAY
 
 
+async def test_camera_proxy_stream_shared(
+    hass: HomeAssistant, mock_camera, hass_client: ClientSessionGenerator
+) -> None:
+    """Test many viewers of a camera share the fetched frames."""
+    fetches = 0
+
+    async def camera_image(*args, **kwargs) -> bytes:
+        nonlocal fetches
+        fetches += 1
+        return f"image {fetches}".encode()
+
+    demo_camera = hass.data[DOMAIN].get_entity("camera.demo_camera")
+    demo_camera._attr_frame_interval = 0.01
+    client = await hass_client()
+
+    async def view() -> bytes:
+        async with client.get(
+            "/api/camera_proxy_stream/camera.demo_camera"
+        ) as response:
+            assert response.status == HTTPStatus.OK
+            body = b""
+            while body.count(b"--frameboundary") < 5:
+                body += await response.content.readany()
+            return body
+
+    viewers = 50
+    with patch.object(demo_camera, "async_camera_image", camera_image):
+        bodies = await asyncio.gather(*(view() for _ in range(viewers)))
+
+    # Each viewer received at least 4 frames, without sharing these
+    # would have taken at least 4 fetches per viewer
+    assert fetches < viewers
+    for body in bodies:
+        frames = body.split(b"--frameboundary")[1:5]
+        # The first frame is sent twice
+        assert frames[0] == frames[1]
+        assert frames[0].startswith(b"\r\nContent-Type: image/jpg\r\nContent-Length: ")
+        assert len(set(frames)) == 3
+
+    # The broadcaster stops once the viewers left
+    for _ in range(100):
+        if not hass.data[DATA_STILL_STREAMS]:
+            break
+        await asyncio.sleep(0.01)
+    assert not hass.data[DATA_STILL_STREAMS]
+
+
 async def test_websocket_web_rtc_offer(
     hass: HomeAssistant,
     hass_ws_client: WebSocketGenerator,
@@ -0,0 +1,148 @@
+"""Test the snapshot cache of cameras."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.camera import Image
+from homeassistant.components.camera.snapshot_cache import SnapshotCache
+from homeassistant.core import HomeAssistant
+
+from .common import EMPTY_8_6_JPEG, mock_turbo_jpeg
+
+
+async def test_concurrent_requests_coalesced(hass: HomeAssistant) -> None:
+    """Test concurrent requests of the same size share one fetch."""
+    cache = SnapshotCache()
+    fetched = asyncio.Event()
+    image = Image("image/jpeg", b"image")
+
+    async def fetch() -> Image:
+        await fetched.wait()
+        return image
+
+    fetch_mock = AsyncMock(side_effect=fetch)
+    tasks = [
+        asyncio.create_task(cache.async_get_image(hass, None, None, 0, fetch_mock))
+        for _ in range(5)
+    ]
+    other_size = asyncio.create_task(cache.async_get_image(hass, 4, 3, 0, fetch_mock))
+    await asyncio.sleep(0)
+    # A waiting request being cancelled does not cancel the fetch
+    tasks.pop().cancel()
+    fetched.set()
+
+    assert await asyncio.gather(*tasks) == [image] * 4
+    assert await other_size is image
+    assert fetch_mock.call_count == 2
+    assert cache.as_dict() == {
+        "hits": 0,
+        "resized": 0,
+        "coalesced": 4,
+        "misses": 2,
+        "hit_rate": 0.667,
+    }
+
+    # Without a TTL the next request fetches again
+    await cache.async_get_image(hass, None, None, 0, fetch_mock)
+    assert fetch_mock.call_count == 3
+
+
+async def test_fetch_error(hass: HomeAssistant) -> None:
+    """Test an error fetching is raised to all requests and not cached."""
+    cache = SnapshotCache()
+    fetch_mock = AsyncMock(side_effect=TimeoutError)
+    results = await asyncio.gather(
+        cache.async_get_image(hass, None, None, 10, fetch_mock),
+        cache.async_get_image(hass, None, None, 10, fetch_mock),
+        return_exceptions=True,
+    )
+    assert [type(result) for result in results] == [TimeoutError, TimeoutError]
+    assert fetch_mock.call_count == 1
+
+    fetch_mock.side_effect = None
+    fetch_mock.return_value = Image("image/jpeg", b"image")
+    assert (await cache.async_get_image(hass, None, None, 10, fetch_mock)).content == (
+        b"image"
+    )
+    assert fetch_mock.call_count == 2
+
+
+async def test_ttl(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Test images are reused until the TTL expired."""
+    cache = SnapshotCache()
+    fetch_mock = AsyncMock(return_value=Image("image/png", b"image"))
+    for _ in range(3):
+        await cache.async_get_image(hass, None, None, 10, fetch_mock)
+    assert fetch_mock.call_count == 1
+
+    # Images which are not jpeg cannot be scaled, the size is fetched
+    await cache.async_get_image(hass, 4, 3, 10, fetch_mock)
+    assert fetch_mock.call_count == 2
+
+    freezer.tick(10)
+    await cache.async_get_image(hass, None, None, 10, fetch_mock)
+    assert fetch_mock.call_count == 3
+    assert cache.as_dict() == {
+        "hits": 2,
+        "resized": 0,
+        "coalesced": 0,
+        "misses": 3,
+        "hit_rate": 0.4,
+    }
+
+
+@pytest.mark.parametrize("content_type", ["image/jpeg", "image/jpg"])
+async def test_resized_from_full_size(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, content_type: str
+) -> None:
+    """Test resized images are computed once from the full size image."""
+    cache = SnapshotCache()
+    fetch_mock = AsyncMock(return_value=Image(content_type, b"Valid jpeg"))
+    await cache.async_get_image(hass, None, None, 10, fetch_mock)
+
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=300, second_height=200
+    )
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+        return_value=turbo_jpeg,
+    ):
+        for _ in range(3):
+            image = await cache.async_get_image(hass, 4, 3, 10, fetch_mock)
+    assert image.content_type == content_type
+    assert image.content == EMPTY_8_6_JPEG
+    assert fetch_mock.call_count == 1
+    assert turbo_jpeg.scale_with_quality.call_count == 1
+    assert cache.as_dict()["resized"] == 1
+    assert cache.as_dict()["hits"] == 2
+
+    # The resized image expires with the full size image
+    freezer.tick(5)
+    await cache.async_get_image(hass, None, None, 10, fetch_mock)
+    freezer.tick(5)
+    fetch_mock.return_value = Image("image/png", b"image")
+    assert (await cache.async_get_image(hass, 4, 3, 10, fetch_mock)).content == b"image"
+    assert fetch_mock.call_count == 2
+
+
+async def test_fetch_error_all_requests_cancelled(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the error of a fetch whose requests were all cancelled is retrieved."""
+    cache = SnapshotCache()
+    fetched = asyncio.Event()
+
+    async def fetch() -> Image:
+        await fetched.wait()
+        raise TimeoutError("timed out")
+
+    task = asyncio.create_task(cache.async_get_image(hass, None, None, 0, fetch))
+    await asyncio.sleep(0)
+    task.cancel()
+    fetched.set()
+    await hass.async_block_till_done()
+    assert "Error fetching camera snapshot: timed out" in caplog.text
+    assert "exception was never retrieved" not in caplog.text
@@ -0,0 +1,163 @@
+"""Test the still stream broadcaster of cameras."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from homeassistant.components.camera import async_get_still_stream
+from homeassistant.components.camera.const import DATA_STILL_STREAMS
+from homeassistant.components.camera.still_stream import (
+    async_get_still_stream_broadcaster,
+)
+from homeassistant.components.http import KEY_HASS
+from homeassistant.core import HomeAssistant
+
+
+def _image_cb(images: list[bytes | None]) -> AsyncMock:
+    """Return an image callback returning images, then waiting forever."""
+    pending = iter(images)
+
+    async def image_cb() -> bytes | None:
+        await asyncio.sleep(0)
+        if (image := next(pending, False)) is not False:
+            return image
+        await asyncio.Event().wait()
+
+    return AsyncMock(side_effect=image_cb)
+
+
+async def _wait_for_fetches(image_cb: AsyncMock, count: int) -> None:
+    """Wait until the viewers handled the frames of count fetches."""
+    while image_cb.call_count < count:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+async def test_slow_viewer_drops_frames(hass: HomeAssistant) -> None:
+    """Test a slow viewer skips frames without delaying the others."""
+    image_cb = _image_cb([b"1", b"2", b"3", b"4"])
+    broadcaster = async_get_still_stream_broadcaster(hass, image_cb, "image/jpeg", 0)
+    assert (
+        async_get_still_stream_broadcaster(hass, image_cb, "image/jpeg", 0)
+        is broadcaster
+    )
+
+    release_slow = asyncio.Event()
+    slow_frames: list[bytes] = []
+
+    async def slow_write(frame: bytes) -> None:
+        slow_frames.append(frame)
+        await release_slow.wait()
+
+    fast = Mock(write=AsyncMock())
+    slow = Mock(write=AsyncMock(side_effect=slow_write))
+    fast_task = hass.async_create_task(broadcaster.async_write_frames(fast))
+    slow_task = hass.async_create_task(broadcaster.async_write_frames(slow))
+    await _wait_for_fetches(image_cb, 5)
+    assert broadcaster.viewers == 2
+
+    # The first frame is written twice
+    fast_frames = [call.args[0] for call in fast.write.call_args_list]
+    assert [frame[-3:] for frame in fast_frames] == [
+        b"1\r\n",
+        b"1\r\n",
+        b"2\r\n",
+        b"3\r\n",
+        b"4\r\n",
+    ]
+    assert fast_frames[0] == (
+        b"--frameboundary\r\nContent-Type: image/jpeg\r\nContent-Length: 1\r\n\r\n1\r\n"
+    )
+    # The slow viewer is still writing the first frame, the next ones replace
+    # each other
+    assert slow_frames == [fast_frames[0]]
+    assert broadcaster.frames_dropped == 2
+
+    release_slow.set()
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert [frame[-3:] for frame in slow_frames] == [b"1\r\n", b"1\r\n", b"4\r\n"]
+    assert image_cb.call_count == 5
+
+    fast_task.cancel()
+    slow_task.cancel()
+    await asyncio.sleep(0)
+    assert broadcaster.done
+    assert not hass.data[DATA_STILL_STREAMS]
+
+
+async def test_stream_ends(hass: HomeAssistant) -> None:
+    """Test all viewers stop when there is no image."""
+    image_cb = _image_cb([b"1", None])
+    broadcaster = async_get_still_stream_broadcaster(hass, image_cb, "image/jpeg", 0)
+    responses = [Mock(write=AsyncMock()) for _ in range(3)]
+    await asyncio.gather(
+        *(broadcaster.async_write_frames(response) for response in responses)
+    )
+    for response in responses:
+        assert response.write.call_count == 2
+    assert broadcaster.done
+    assert not hass.data[DATA_STILL_STREAMS]
+
+    # A new viewer starts a new stream
+    assert (
+        async_get_still_stream_broadcaster(hass, image_cb, "image/jpeg", 0)
+        is not broadcaster
+    )
+
+
+async def test_image_error(hass: HomeAssistant) -> None:
+    """Test an error fetching an image ends the stream of all viewers."""
+    image_cb = AsyncMock(side_effect=ValueError("boom"))
+    broadcaster = async_get_still_stream_broadcaster(hass, image_cb, "image/jpeg", 0)
+    results = await asyncio.gather(
+        broadcaster.async_write_frames(Mock(write=AsyncMock())),
+        broadcaster.async_write_frames(Mock(write=AsyncMock())),
+        return_exceptions=True,
+    )
+    assert [str(result) for result in results] == ["boom", "boom"]
+    assert image_cb.call_count == 1
+
+
+@pytest.mark.parametrize("interval", [0.5, 1])
+async def test_interval_keys_stream(hass: HomeAssistant, interval: float) -> None:
+    """Test viewers of other intervals do not share the stream."""
+    image_cb = AsyncMock()
+    assert async_get_still_stream_broadcaster(
+        hass, image_cb, "image/jpeg", interval
+    ) is not async_get_still_stream_broadcaster(hass, image_cb, "image/jpeg", 0.1)
+
+
+async def test_viewer_joins_while_last_leaves(hass: HomeAssistant) -> None:
+    """Test a viewer joining while the last viewer leaves gets a new stream."""
+    image_cb = _image_cb([b"1", b"2", b"3"])
+    broadcaster = async_get_still_stream_broadcaster(hass, image_cb, "image/jpeg", 0)
+    last_viewer = hass.async_create_task(
+        broadcaster.async_write_frames(Mock(write=AsyncMock()))
+    )
+    await _wait_for_fetches(image_cb, 1)
+
+    async def prepare(request: Mock) -> None:
+        """Leave with the last viewer while the response is prepared."""
+        last_viewer.cancel()
+        await asyncio.sleep(0)
+        assert broadcaster.done
+
+    response = Mock(prepare=AsyncMock(side_effect=prepare), write=AsyncMock())
+    with patch(
+        "homeassistant.components.camera.web.StreamResponse", return_value=response
+    ):
+        new_viewer = hass.async_create_task(
+            async_get_still_stream(
+                Mock(app={KEY_HASS: hass}), image_cb, "image/jpeg", 0
+            )
+        )
+        while response.write.call_count < 2:
+            await asyncio.sleep(0)
+    # The new stream fetches its own first frame
+    assert response.write.call_args.args[0].endswith(b"3\r\n")
+
+    new_viewer.cancel()
+    await asyncio.sleep(0)
+    assert not hass.data[DATA_STILL_STREAMS]
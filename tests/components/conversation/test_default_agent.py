@@ -1012,3 +1012,54 @@ async def test_same_aliased_entities_in_different_areas(
         hass, "how many lights are on?", None, Context(), None
     )
     assert result.response.response_type == intent.IntentResponseType.QUERY_ANSWER
+
+
+async def test_entity_names_updated_incrementally(
+    hass: HomeAssistant, init_components, entity_registry: er.EntityRegistry
+) -> None:
+    """Test only the names of changed entities are gathered again."""
+    hass.states.async_set("light.kitchen", "off", {ATTR_FRIENDLY_NAME: "kitchen"})
+    hass.states.async_set("light.bedroom", "off", {ATTR_FRIENDLY_NAME: "bedroom"})
+    calls = async_mock_service(hass, "light", "turn_on")
+
+    result = await conversation.async_converse(
+        hass, "turn on kitchen", None, Context(), None
+    )
+    assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
+    assert len(calls) == 1
+
+    # Renamed through its state, the other entities are not gathered again
+    hass.states.async_set("light.kitchen", "off", {ATTR_FRIENDLY_NAME: "stove"})
+    with patch(
+        "homeassistant.components.conversation.default_agent.async_should_expose",
+        wraps=conversation.default_agent.async_should_expose,
+    ) as mock_should_expose:
+        result = await conversation.async_converse(
+            hass, "turn on stove", None, Context(), None
+        )
+    assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
+    assert len(calls) == 2
+    assert [call.args[2] for call in mock_should_expose.call_args_list] == [
+        "light.kitchen"
+    ]
+
+    # Aliases added in the registry
+    entity_registry.async_get_or_create(
+        "light", "demo", "1234", suggested_object_id="hallway"
+    )
+    hass.states.async_set("light.hallway", "off", {ATTR_FRIENDLY_NAME: "hallway"})
+    entity_registry.async_update_entity("light.hallway", aliases={"corridor"})
+    await hass.async_block_till_done()
+    result = await conversation.async_converse(
+        hass, "turn on corridor", None, Context(), None
+    )
+    assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
+    assert len(calls) == 3
+
+    # Removed entities are no longer matched
+    hass.states.async_remove("light.bedroom")
+    result = await conversation.async_converse(
+        hass, "turn on bedroom", None, Context(), None
+    )
+    assert result.response.response_type == intent.IntentResponseType.ERROR
+    assert len(calls) == 3
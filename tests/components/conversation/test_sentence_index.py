@@ -0,0 +1,109 @@
+"""Test the sentence index of the conversation agent."""
+
+from hassil.intents import Intents, TextSlotList
+from hassil.recognize import recognize_all
+import pytest
+
+from homeassistant.components.conversation.sentence_index import SentenceIndex
+
+INTENTS = Intents.from_dict(
+    {
+        "language": "en",
+        "intents": {
+            "TurnOn": {
+                "data": [
+                    {"sentences": ["<turn> on [the] {name}", "{name} on"]},
+                    {"sentences": ["activate {name}"]},
+                ]
+            },
+            "Weather": {"data": [{"sentences": ["(what's | what is) the weather"]}]},
+            "Any": {"data": [{"sentences": ["[please] {name}"]}]},
+        },
+        "expansion_rules": {"turn": "(turn | switch)"},
+        "lists": {"name": {"values": ["kitchen-light", "stove"]}},
+        "skip_words": ["please"],
+    }
+)
+
+
+def _intent_data(intents: Intents) -> dict[str, int]:
+    """Return the number of intent data per intent."""
+    return {name: len(intent.data) for name, intent in intents.intents.items()}
+
+
+@pytest.mark.parametrize(
+    ("text", "intent_data"),
+    [
+        ("turn on the stove", {"TurnOn": 1, "Any": 1}),
+        ("Switch on stove!", {"TurnOn": 1, "Any": 1}),
+        ("stove on", {"TurnOn": 1, "Any": 1}),
+        ("activate the stove", {"TurnOn": 1, "Any": 1}),
+        ("what's the weather?", {"Weather": 1, "Any": 1}),
+        ("what is the weather", {"Weather": 1, "Any": 1}),
+        ("please", {"Any": 1}),
+    ],
+)
+def test_intents_for_text(text: str, intent_data: dict[str, int]) -> None:
+    """Test only the intent data which may match are kept."""
+    index = SentenceIndex(INTENTS)
+    intents = index.intents_for_text(text)
+    assert _intent_data(intents) == intent_data
+    assert intents.expansion_rules is INTENTS.expansion_rules
+
+    for allow_unmatched_entities in (False, True):
+        assert [
+            (result.intent.name, result.entities_list)
+            for result in recognize_all(
+                text, intents, allow_unmatched_entities=allow_unmatched_entities
+            )
+        ] == [
+            (result.intent.name, result.entities_list)
+            for result in recognize_all(
+                text, INTENTS, allow_unmatched_entities=allow_unmatched_entities
+            )
+        ]
+
+
+def test_broken_words() -> None:
+    """Test words broken apart by hassil are found."""
+    index = SentenceIndex(
+        Intents.from_dict(
+            {
+                "language": "en",
+                "intents": {"Open": {"data": [{"sentences": ["open garage door"]}]}},
+            }
+        )
+    )
+    intents = index.intents_for_text("open garage-door")
+    assert _intent_data(intents) == {"Open": 1}
+    assert len(list(recognize_all("open garage-door", intents))) == 1
+    assert _intent_data(index.intents_for_text("open the window")) == {}
+
+
+def test_ignore_whitespace() -> None:
+    """Test all intents are kept when whitespace is ignored."""
+    intents = Intents.from_dict(
+        {
+            "language": "zh",
+            "settings": {"ignore_whitespace": True},
+            "intents": {"TurnOn": {"data": [{"sentences": ["打开{name}"]}]}},
+            "lists": {"name": {"values": ["灯"]}},
+        }
+    )
+    index = SentenceIndex(intents)
+    assert index.intents_for_text("关闭灯") is intents
+
+
+def test_slot_lists_kept() -> None:
+    """Test the slot lists of the intents are kept."""
+    slot_lists = {"name": TextSlotList.from_strings(["oven"])}
+    intents = Intents.from_dict(
+        {
+            "language": "en",
+            "intents": {"TurnOn": {"data": [{"sentences": ["turn on {name}"]}]}},
+        }
+    )
+    intents.slot_lists.update(slot_lists)
+    filtered = SentenceIndex(intents).intents_for_text("turn on oven")
+    assert filtered.slot_lists == slot_lists
+    assert len(list(recognize_all("turn on oven", filtered))) == 1
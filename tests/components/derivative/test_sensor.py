@@ -275,6 +275,35 @@ async def test_double_signal_after_delay(hass: HomeAssistant) -> None:
             previous = derivative
 
 
+async def test_gap_in_time_window(hass: HomeAssistant) -> None:
+    """Test a gap between derivatives counts as zero in the time window."""
+    config, entity_id = await _setup_sensor(
+        hass,
+        {
+            "time_window": {"seconds": 60},
+            "unit_time": UnitOfTime.SECONDS,
+            "round": 3,
+        },
+    )
+
+    base = dt_util.utcnow()
+    with freeze_time(base) as freezer:
+        for time, value in (
+            (0, 0),
+            (10, 10),
+            (20, "unavailable"),
+            (30, 100),
+            (40, 110),
+        ):
+            freezer.move_to(base + timedelta(seconds=time))
+            hass.states.async_set(entity_id, value, {}, force_update=True)
+            await hass.async_block_till_done()
+
+    # 1 per second from 0 to 10 and from 30 to 40 in a window of 60 seconds
+    state = hass.states.get("sensor.power")
+    assert round(float(state.state), config["sensor"]["round"]) == 0.333
+
+
 async def test_prefix(hass: HomeAssistant) -> None:
     """Test derivative sensor state using a power source."""
     config = {
@@ -1,11 +1,13 @@
 """Test the Energy websocket API."""
 
+from datetime import timedelta
 from typing import Any
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from homeassistant.components.energy import data, is_configured
+from homeassistant.components.energy import aggregates, data, is_configured
+from homeassistant.components.energy.aggregates import async_get_statistics_cache
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.statistics import async_add_external_statistics
 from homeassistant.core import HomeAssistant
@@ -1159,3 +1161,174 @@ async def test_fossil_energy_consumption_check_missing_hour(
         hour3.isoformat(),
         hour4.isoformat(),
     ]
+
+
+@pytest.mark.freeze_time("2021-10-01 06:00:00+00:00")
+async def test_statistics_during_period(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the statistics of the energy dashboard are served from the cache."""
+    await async_recorder_block_till_done(hass)
+    start = dt_util.parse_datetime("2021-09-30 22:00:00+00:00")
+    hours = [start + timedelta(hours=hour) for hour in range(5)]
+    metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        metadata,
+        [
+            {"start": hour, "last_reset": None, "state": total, "sum": total}
+            for hour, total in zip(hours, (1, 3, 6, 10), strict=False)
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "energy/save_prefs",
+            "energy_sources": [
+                {
+                    "type": "grid",
+                    "flow_from": [
+                        {
+                            "stat_energy_from": "test:total_energy_import",
+                            "stat_cost": None,
+                            "entity_energy_price": None,
+                            "number_energy_price": None,
+                        }
+                    ],
+                    "flow_to": [],
+                    "cost_adjustment_day": 0,
+                }
+            ],
+        }
+    )
+    assert (await client.receive_json())["success"]
+
+    request = {
+        "type": "energy/statistics_during_period",
+        "start_time": "2021-09-30T00:00:00+00:00",
+        "end_time": "2021-10-01T06:00:00+00:00",
+        "period": "hour",
+    }
+    expected = [
+        {
+            "start": hour.timestamp() * 1000,
+            "end": (hour + timedelta(hours=1)).timestamp() * 1000,
+            "change": change,
+        }
+        for hour, change in zip(hours, (1, 2, 3, 4), strict=False)
+    ]
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"test:total_energy_import": expected}
+
+    cache = async_get_statistics_cache(hass)
+    queries = cache.queries
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["result"] == {"test:total_energy_import": expected}
+    assert cache.queries == queries
+
+    # The whole period falls on the same local day
+    await client.send_json_auto_id({**request, "period": "day"})
+    response = await client.receive_json()
+    assert response["result"] == {
+        "test:total_energy_import": [
+            {
+                "start": dt_util.parse_datetime("2021-09-30 07:00:00+00:00").timestamp()
+                * 1000,
+                "end": dt_util.parse_datetime("2021-10-01 07:00:00+00:00").timestamp()
+                * 1000,
+                "change": 10,
+            }
+        ]
+    }
+    assert cache.queries == queries
+
+    # Imported statistics replace the cached ones
+    async_add_external_statistics(
+        hass,
+        metadata,
+        [{"start": hours[4], "last_reset": None, "state": 15, "sum": 15}],
+    )
+    await async_wait_recording_done(hass)
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["result"] == {
+        "test:total_energy_import": [
+            *expected,
+            {
+                "start": hours[4].timestamp() * 1000,
+                "end": (hours[4] + timedelta(hours=1)).timestamp() * 1000,
+                "change": 5,
+            },
+        ]
+    }
+    assert cache.queries == queries + 1
+
+
+@pytest.mark.freeze_time("2021-10-01 06:00:00+00:00")
+async def test_statistics_cache_edges_and_eviction(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test only the uncached hours are fetched and unused statistics dropped."""
+    await async_recorder_block_till_done(hass)
+    start = dt_util.parse_datetime("2021-09-30 22:00:00+00:00")
+    hours = [start + timedelta(hours=hour) for hour in range(6)]
+    for statistic_id in ("test:energy_1", "test:energy_2"):
+        async_add_external_statistics(
+            hass,
+            {
+                "has_mean": False,
+                "has_sum": True,
+                "name": None,
+                "source": "test",
+                "statistic_id": statistic_id,
+                "unit_of_measurement": "kWh",
+            },
+            [
+                {"start": hour, "last_reset": None, "state": total, "sum": total}
+                for hour, total in zip(hours, (1, 3, 6, 10, 15, 21), strict=True)
+            ],
+        )
+    await async_wait_recording_done(hass)
+
+    cache = async_get_statistics_cache(hass)
+    await cache.async_hourly_statistics(
+        hours[2], hours[4], {"test:energy_1"}, {"change"}
+    )
+    with patch(
+        "homeassistant.components.energy.aggregates.statistics_during_period",
+        wraps=aggregates.statistics_during_period,
+    ) as statistics_mock:
+        result = await cache.async_hourly_statistics(
+            hours[0], hours[5], {"test:energy_1"}, {"change"}
+        )
+    assert [
+        (call.args[1], call.args[2]) for call in statistics_mock.call_args_list
+    ] == [(hours[0], hours[2]), (hours[4], hours[5])]
+    assert [row["change"] for row in result["test:energy_1"]] == [1, 2, 3, 4, 5]
+
+    # The statistics used least recently are dropped
+    queries = cache.queries
+    with patch.object(aggregates, "MAX_CACHED_HOURS", 8):
+        await cache.async_hourly_statistics(
+            hours[0], hours[4], {"test:energy_2"}, {"change"}
+        )
+        await cache.async_hourly_statistics(
+            hours[0], hours[4], {"test:energy_2"}, {"change"}
+        )
+        assert cache.queries == queries + 1
+        await cache.async_hourly_statistics(
+            hours[0], hours[5], {"test:energy_1"}, {"change"}
+        )
+        assert cache.queries == queries + 2
@@ -248,3 +248,68 @@ async def test_state_reporting_any(
     assert (
         hass.states.get("binary_sensor.binary_sensor_group").state == STATE_UNAVAILABLE
     )
+
+
+async def test_nested_groups(hass: HomeAssistant) -> None:
+    """Test the member counts of nested binary sensor groups."""
+    await async_setup_component(
+        hass,
+        BINARY_SENSOR_DOMAIN,
+        {
+            BINARY_SENSOR_DOMAIN: [
+                {
+                    "platform": DOMAIN,
+                    "entities": [
+                        f"binary_sensor.window_{index}" for index in range(50)
+                    ],
+                    "name": "Windows",
+                },
+                {
+                    "platform": DOMAIN,
+                    "entities": ["binary_sensor.windows", "binary_sensor.door"],
+                    "name": "Openings",
+                    "all": "true",
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    # The outer group is updated once the state of the inner group was
+    # written, which needs a second pass of the event loop
+    hass.states.async_set("binary_sensor.door", STATE_ON)
+    for index in range(50):
+        hass.states.async_set(f"binary_sensor.window_{index}", STATE_OFF)
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.windows").state == STATE_OFF
+    assert hass.states.get("binary_sensor.openings").state == STATE_OFF
+
+    hass.states.async_set("binary_sensor.window_7", STATE_ON)
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.windows").state == STATE_ON
+    assert hass.states.get("binary_sensor.openings").state == STATE_ON
+
+    # Changing a member to the same state again does not count it twice
+    hass.states.async_set("binary_sensor.window_7", STATE_ON, {"changed": True})
+    hass.states.async_set("binary_sensor.window_7", STATE_OFF)
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.windows").state == STATE_OFF
+    assert hass.states.get("binary_sensor.openings").state == STATE_OFF
+
+    hass.states.async_set("binary_sensor.window_3", STATE_ON)
+    hass.states.async_remove("binary_sensor.window_3")
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.windows").state == STATE_OFF
+
+    for index in range(50):
+        hass.states.async_set(f"binary_sensor.window_{index}", STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.windows").state == STATE_UNAVAILABLE
+    assert hass.states.get("binary_sensor.openings").state == STATE_UNKNOWN
@@ -552,6 +552,8 @@ async def test_config_flow_preview(
     hass.states.async_set(input_entities[0], input_states[0])
     hass.states.async_set(input_entities[1], input_states[1])
 
+    # The preview is updated with the state of each member
+    await client.receive_json()
     msg = await client.receive_json()
     assert msg["event"] == {
         "attributes": {
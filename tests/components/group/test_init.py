@@ -1095,6 +1095,61 @@ async def test_group_climate_mixed(hass: HomeAssistant) -> None:
     assert hass.states.get("group.group_zero").state == STATE_ON
 
 
+async def test_nested_group_counts(hass: HomeAssistant) -> None:
+    """Test the on and assumed members of nested groups are counted."""
+    lights = [f"light.light_{index}" for index in range(50)]
+    for entity_id in lights:
+        hass.states.async_set(entity_id, STATE_OFF)
+    hass.states.async_set("switch.fan", STATE_OFF)
+
+    assert await async_setup_component(hass, "light", {})
+    assert await async_setup_component(hass, "switch", {})
+    assert await async_setup_component(
+        hass,
+        "group",
+        {
+            "group": {
+                "lights": {"entities": lights},
+                "all_lights": {"entities": lights, "all": True},
+                "everything": {"entities": ["group.lights", "switch.fan"]},
+            }
+        },
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("group.lights").state == STATE_OFF
+    assert hass.states.get("group.everything").state == STATE_OFF
+
+    hass.states.async_set("light.light_3", STATE_ON, {ATTR_ASSUMED_STATE: True})
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert hass.states.get("group.lights").state == STATE_ON
+    assert hass.states.get("group.lights").attributes[ATTR_ASSUMED_STATE]
+    assert hass.states.get("group.all_lights").state == STATE_OFF
+    assert hass.states.get("group.everything").state == STATE_ON
+
+    # The same state again is not counted twice
+    hass.states.async_set("light.light_3", STATE_ON, {"brightness": 10})
+    hass.states.async_set("light.light_3", STATE_OFF)
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert hass.states.get("group.lights").state == STATE_OFF
+    assert ATTR_ASSUMED_STATE not in hass.states.get("group.lights").attributes
+    assert hass.states.get("group.everything").state == STATE_OFF
+
+    for entity_id in lights:
+        hass.states.async_set(entity_id, STATE_ON)
+    await hass.async_block_till_done()
+    assert hass.states.get("group.all_lights").state == STATE_ON
+
+    hass.states.async_remove("light.light_0")
+    hass.states.async_set("light.light_1", STATE_OFF)
+    await hass.async_block_till_done()
+    assert hass.states.get("group.all_lights").state == STATE_OFF
+    hass.states.async_set("light.light_1", STATE_ON)
+    await hass.async_block_till_done()
+    assert hass.states.get("group.all_lights").state == STATE_ON
+
+
 async def test_group_climate_all_cool(hass: HomeAssistant) -> None:
     """Test group of climate all set to cool."""
     hass.states.async_set("climate.one", "cool")
@@ -761,3 +761,36 @@ async def test_last_sensor(hass: HomeAssistant) -> None:
         state = hass.states.get("sensor.test_last")
         assert str(float(value)) == state.state
         assert entity_id == state.attributes.get("last_entity_id")
+
+
+async def test_sum_after_many_changes(hass: HomeAssistant) -> None:
+    """Test the sum of a sensor group does not drift when members change."""
+    entity_ids = [f"sensor.power_{index}" for index in range(20)]
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": {
+                "platform": GROUP_DOMAIN,
+                "name": "Total power",
+                "type": "sum",
+                "entities": entity_ids,
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    for value in (1e16, 0.1, 0.2, 0.3, 1.7, 0.1):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, str(value))
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.total_power").state == "2.0"
+
+    hass.states.async_set("sensor.power_0", "nan")
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.total_power").state == "nan"
+
+    hass.states.async_set("sensor.power_0", "0.1")
+    hass.states.async_remove("sensor.power_1")
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.total_power").state == "1.9"
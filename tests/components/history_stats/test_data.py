@@ -0,0 +1,81 @@
+"""Test the history_stats data."""
+
+import random
+
+import pytest
+
+from homeassistant.components.history_stats.data import HistoryIndex, HistoryState
+
+
+def _compute(
+    states: list[HistoryState],
+    entity_states: set[str],
+    now_timestamp: float,
+    start_timestamp: float,
+    end_timestamp: float,
+) -> tuple[float, int]:
+    """Compute the stats by walking the states of the period."""
+    previous_state_matches = bool(states) and states[0].state in entity_states
+    last_state_change_timestamp = start_timestamp
+    elapsed = 0.0
+    match_count = 1 if previous_state_matches else 0
+    for history_state in states:
+        current_state_matches = history_state.state in entity_states
+        if previous_state_matches:
+            elapsed += history_state.last_changed - last_state_change_timestamp
+        elif current_state_matches:
+            match_count += 1
+        previous_state_matches = current_state_matches
+        last_state_change_timestamp = history_state.last_changed
+    if previous_state_matches:
+        elapsed += min(end_timestamp, now_timestamp) - last_state_change_timestamp
+    return elapsed, match_count
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_history_index_rolling_period(seed: int) -> None:
+    """Test the index matches walking the states of a rolling period."""
+    rng = random.Random(seed)
+    entity_states = {"on", "heat"}
+    index = HistoryIndex(entity_states)
+    timestamp = 1000.0
+    states = [HistoryState("off", timestamp)]
+    index.reset(states)
+    period = 300.0
+
+    for _ in range(500):
+        timestamp += rng.choice((0.5, 1, 7, 30))
+        state = HistoryState(rng.choice(("on", "off", "heat", "idle")), timestamp)
+        if index.append(state.state, state.last_changed):
+            states.append(state)
+        start_timestamp = max(1000.0, timestamp - period)
+        index.evict(start_timestamp)
+
+        # The states of the period starting with the state at its start
+        in_period = [s for s in states if s.last_changed > start_timestamp]
+        before = [s for s in states if s.last_changed <= start_timestamp]
+        if before:
+            in_period.insert(0, HistoryState(before[-1].state, start_timestamp))
+        elapsed, match_count = index.compute(timestamp + 1, start_timestamp, timestamp)
+        expected_elapsed, expected_match_count = _compute(
+            in_period, entity_states, timestamp + 1, start_timestamp, timestamp
+        )
+        assert elapsed == pytest.approx(expected_elapsed)
+        assert match_count == expected_match_count
+
+    assert len(index) <= 2 * len(in_period)
+
+
+def test_history_index_ignores_attribute_changes() -> None:
+    """Test states which did not change are not added."""
+    index = HistoryIndex({"on"})
+    assert index.compute(10, 0, 10) == (0.0, 0)
+    assert index.last_changed is None
+    assert index.append("on", 1)
+    assert not index.append("on", 1)
+    assert not index.append("off", 0.5)
+    assert index.append("off", 1)
+    assert index.append("on", 4)
+    assert len(index) == 3
+    assert index.last_changed == 4
+    assert index.compute(10, 0, 10) == (7.0, 2)
@@ -12,7 +12,7 @@ from homeassistant.components.history_stats import DOMAIN
 from homeassistant.components.history_stats.sensor import (
     PLATFORM_SCHEMA as SENSOR_SCHEMA,
 )
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import Recorder, history
 from homeassistant.const import ATTR_DEVICE_CLASS, SERVICE_RELOAD, STATE_UNKNOWN
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
@@ -282,9 +282,16 @@ async def test_measure_multiple(recorder_mock: Recorder, hass: HomeAssistant) ->
             ]
         }
 
-    with patch(
-        "homeassistant.components.recorder.history.state_changes_during_period",
-        _fake_states,
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            _fake_states,
+        ),
+        patch(
+            # The sensors of different entities are queried together
+            "homeassistant.components.recorder.history.batch.state_changes_during_period_for_entities",
+            _fake_states,
+        ),
     ):
         await async_setup_component(
             hass,
@@ -1689,3 +1696,54 @@ async def test_unique_id(
         entity_registry.async_get("sensor.test").unique_id
         == "some_history_stats_unique_id"
     )
+
+
+async def test_rolling_period_does_not_query_database(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test a rolling period only fetches the history once."""
+    with freeze_time(dt_util.utcnow().replace(microsecond=0)) as freezer:
+        hass.states.async_set("binary_sensor.test_id", "off")
+        freezer.tick(timedelta(hours=2))
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await async_wait_recording_done(hass)
+
+        with patch(
+            "homeassistant.components.recorder.history.async_state_changes_during_period",
+            wraps=history.async_state_changes_during_period,
+        ) as state_changes_mock:
+            await async_setup_component(
+                hass,
+                "sensor",
+                {
+                    "sensor": {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "test",
+                        "state": "on",
+                        "duration": {"hours": 1},
+                        "end": "{{ utcnow() }}",
+                        "type": "time",
+                    }
+                },
+            )
+            await hass.async_block_till_done()
+            assert hass.states.get("sensor.test").state == "0.0"
+
+            freezer.tick(timedelta(minutes=10))
+            await async_update_entity(hass, "sensor.test")
+            assert hass.states.get("sensor.test").state == "0.17"
+
+            hass.states.async_set("binary_sensor.test_id", "off")
+            await hass.async_block_till_done()
+            freezer.tick(timedelta(minutes=60))
+            await async_update_entity(hass, "sensor.test")
+            assert hass.states.get("sensor.test").state == "0.0"
+
+            hass.states.async_set("binary_sensor.test_id", "on")
+            await hass.async_block_till_done()
+            freezer.tick(timedelta(minutes=15))
+            await async_update_entity(hass, "sensor.test")
+            assert hass.states.get("sensor.test").state == "0.25"
+
+        assert state_changes_mock.call_count == 1
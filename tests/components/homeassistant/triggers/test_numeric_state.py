@@ -1934,3 +1934,111 @@ async def test_template_variable(hass: HomeAssistant, calls, multiplier) -> None
         assert len(calls) == 1
     else:
         assert len(calls) == 0
+
+
+async def test_indexed_triggers_match_template_triggers(
+    hass: HomeAssistant, calls
+) -> None:
+    """Test triggers with constant thresholds fire like the other triggers.
+
+    The triggers with constant thresholds share a listener and are
+    evaluated in one pass, the value_template triggers are not.
+    """
+    hass.states.async_set("test.entity", 0)
+    await hass.async_block_till_done()
+    ranges = [
+        {"above": 5},
+        {"above": 5.5},
+        {"below": 5},
+        {"below": 10},
+        {"above": 2, "below": 8},
+        {"above": 5, "below": 6},
+        {"above": 0},
+        {"above": -1, "below": 100},
+    ]
+    triggers = []
+    for idx, thresholds in enumerate(ranges):
+        triggers.append(
+            {
+                "platform": "numeric_state",
+                "entity_id": "test.entity",
+                "id": f"indexed_{idx}",
+                **thresholds,
+            }
+        )
+        triggers.append(
+            {
+                "platform": "numeric_state",
+                "entity_id": "test.entity",
+                "id": f"template_{idx}",
+                "value_template": "{{ state.state }}",
+                **thresholds,
+            }
+        )
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": trigger,
+                    "action": {
+                        "service": "test.automation",
+                        "data_template": {"id": "{{ trigger.id }}"},
+                    },
+                }
+                for trigger in triggers
+            ]
+        },
+    )
+    index = hass.data[numeric_state_trigger.DATA_NUMERIC_STATE_TRIGGERS]
+    assert list(index.entities) == ["test.entity"]
+    fire_count = 0
+
+    for value in (
+        3, 6, 5, 5.7, 9, "unknown", 9, 1, "nan", 4, "abc", 7, 7.5, 200, -5, 5.2,
+    ):  # fmt: skip
+        calls.clear()
+        hass.states.async_set("test.entity", value)
+        await hass.async_block_till_done()
+        fired = {call.data["id"] for call in calls}
+        fire_count += len(fired)
+        assert {
+            trigger_id.removeprefix("indexed_")
+            for trigger_id in fired
+            if trigger_id.startswith("indexed_")
+        } == {
+            trigger_id.removeprefix("template_")
+            for trigger_id in fired
+            if trigger_id.startswith("template_")
+        }, value
+    assert fire_count > 20
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert not index.entities
+
+
+@pytest.mark.parametrize("below", [10, "input_number.value_10"])
+async def test_attach_trigger_entity_id_string(
+    hass: HomeAssistant, below: int | str
+) -> None:
+    """Test a trigger attached with an entity id string is run."""
+    hass.states.async_set("test.entity", 11)
+    await hass.async_block_till_done()
+    runs = []
+    remove = await numeric_state_trigger.async_attach_trigger(
+        hass,
+        {"platform": "numeric_state", "entity_id": "Test.Entity", "below": below},
+        lambda run_variables, context=None: runs.append(run_variables),
+        {"trigger_data": {}, "variables": None, "name": "test"},
+    )
+    hass.states.async_set("test.entity", 9)
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+    assert runs[0]["trigger"]["entity_id"] == "test.entity"
+    remove()
@@ -1745,3 +1745,86 @@ async def test_variables_priority(
     await hass.async_block_till_done()
     assert len(calls) == 2
     assert calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_triggers_share_entity_listener(
+    hass: HomeAssistant, calls: list[ServiceCall]
+) -> None:
+    """Test the triggers of an entity are run in order by the state they match."""
+    hass.states.async_set("test.entity", "hello")
+    await hass.async_block_till_done()
+    triggers = [
+        {"to": "world"},
+        {"to": ["world", "planet"]},
+        {"to": "*"},
+        {"not_to": "world"},
+        {"to": "planet"},
+        {},
+        {"to": None},
+    ]
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "id": str(idx),
+                        **trigger,
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data_template": {"id": "{{ trigger.id }}"},
+                    },
+                }
+                for idx, trigger in enumerate(triggers)
+            ]
+        },
+    )
+    index = hass.data[state_trigger.DATA_STATE_TRIGGERS]
+    assert list(index.entities) == ["test.entity"]
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert [call.data["id"] for call in calls] == [0, 1, 2, 5, 6]
+
+    calls.clear()
+    hass.states.async_set("test.entity", "planet")
+    await hass.async_block_till_done()
+    assert [call.data["id"] for call in calls] == [1, 2, 3, 4, 5, 6]
+
+    calls.clear()
+    hass.states.async_set("test.entity", "planet", {"attribute": 1})
+    await hass.async_block_till_done()
+    assert [call.data["id"] for call in calls] == [5]
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert not index.entities
+
+
+async def test_attach_trigger_entity_id_string(hass: HomeAssistant) -> None:
+    """Test a trigger attached with an entity id string is run."""
+    runs = []
+    remove = await state_trigger.async_attach_trigger(
+        hass,
+        {"platform": "state", "entity_id": "Test.Entity", "to": "world"},
+        lambda run_variables, context=None: runs.append(run_variables),
+        {"trigger_data": {}, "variables": None, "name": "test"},
+    )
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+    assert runs[0]["trigger"]["entity_id"] == "test.entity"
+
+    remove()
+    hass.states.async_set("test.entity", "hello")
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert len(runs) == 1
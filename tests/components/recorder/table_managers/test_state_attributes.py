@@ -0,0 +1,45 @@
+"""The tests for the state attributes and event data managers."""
+
+from __future__ import annotations
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+async def test_load_newest(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the caches are warmed from the newest rows."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    hass.states.async_set("sensor.one", "1", {"unit": "W"})
+    hass.states.async_set("sensor.two", "2", {"unit": "kW"})
+    hass.bus.async_fire("test_event", {"answer": 42})
+    await async_wait_recording_done(hass)
+
+    state_attributes_manager = instance.state_attributes_manager
+    event_data_manager = instance.event_data_manager
+    state_attributes_manager.reset()
+    event_data_manager.reset()
+    assert state_attributes_manager.get_from_cache('{"unit":"W"}') is None
+
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        state_attributes_manager.load_newest(session)
+        event_data_manager.load_newest(session)
+
+    assert state_attributes_manager.get_from_cache('{"unit":"W"}') is not None
+    assert state_attributes_manager.get_from_cache('{"unit":"kW"}') is not None
+    assert event_data_manager.get_from_cache('{"answer":42}') is not None
+
+    stats = state_attributes_manager.cache_stats()
+    assert stats["size"] >= 2
+    assert stats["max_size"] >= stats["size"]
+    assert stats["hits"] >= 2
+    assert stats["misses"] >= 1
+    assert 0 < stats["hit_rate"] < 1
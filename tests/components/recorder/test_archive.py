@@ -0,0 +1,231 @@
+"""Test the archive of purged states."""
+
+from datetime import timedelta
+import os
+from pathlib import Path
+
+from freezegun import freeze_time
+
+from homeassistant.components.recorder.archive import (
+    StatesArchive,
+    decode_states,
+    encode_states,
+)
+from homeassistant.components.recorder.history import (
+    get_significant_states,
+    state_changes_during_period,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+def test_encode_decode_roundtrip() -> None:
+    """Test states survive encoding and decoding."""
+    states = [
+        (1700000000.123, 1700000000.123, "on"),
+        (1700000060.5, 1700000000.123, "on"),
+        (1700000030.0, 1700000030.0, "off"),
+        (1700086400.0, 1700086400.0, "unavailable"),
+    ]
+    assert decode_states(encode_states(states)) == states
+    assert decode_states(encode_states([])) == []
+
+
+def test_archive_flush_compact(tmp_path: Path) -> None:
+    """Test flushing writes segments which are compacted without duplicates."""
+    archive = StatesArchive(str(tmp_path))
+    day_start = dt_util.parse_datetime("2024-03-09T00:00:00+00:00").timestamp()
+    archive.add(
+        [
+            ("sensor.test", "1", day_start + 10.0001, day_start + 10.0001),
+            ("sensor.test", None, day_start + 15, day_start + 15),
+            ("sensor.test", "2", day_start + 86400 + 20, day_start + 86400 + 20),
+        ]
+    )
+    archive.flush()
+    archive.add(
+        [
+            ("sensor.test", "1", day_start + 10.0001, day_start + 10.0001),
+            ("sensor.test", "3", day_start + 5, day_start + 5),
+        ]
+    )
+    archive.flush()
+
+    assert sorted(os.listdir(tmp_path / "sensor.test")) == [
+        "20240309.0.hsa",
+        "20240309.1.hsa",
+        "20240310.0.hsa",
+    ]
+    expected = [
+        (day_start + 5, day_start + 5, "3"),
+        (day_start + 10, day_start + 10, "1"),
+        (day_start + 86400 + 20, day_start + 86400 + 20, "2"),
+    ]
+    assert archive.states_during_period("sensor.test", day_start, None) == expected
+
+    # Only days which end before the purge are compacted
+    archive.compact(day_start + 86400 + 30)
+    assert sorted(os.listdir(tmp_path / "sensor.test")) == [
+        "20240309.hsa",
+        "20240310.0.hsa",
+    ]
+    archive.add([("sensor.test", "4", day_start + 20, day_start + 20)])
+    archive.flush()
+    archive.compact(day_start + 2 * 86400)
+    assert sorted(os.listdir(tmp_path / "sensor.test")) == [
+        "20240309.hsa",
+        "20240310.hsa",
+    ]
+    expected.insert(2, (day_start + 20, day_start + 20, "4"))
+    assert archive.states_during_period("sensor.test", day_start, None) == expected
+    assert archive.states_during_period(
+        "sensor.test", day_start + 6, day_start + 86400
+    ) == [
+        (day_start + 10, day_start + 10, "1"),
+        (day_start + 20, day_start + 20, "4"),
+    ]
+    assert archive.state_before("sensor.test", day_start + 86400 + 5) == (
+        day_start + 20,
+        day_start + 20,
+        "4",
+    )
+    assert archive.state_before("sensor.test", day_start) is None
+    assert archive.state_before("sensor.other", day_start) is None
+
+
+async def test_purge_archives_states(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test purged states are archived and still returned by history."""
+    instance = await async_setup_recorder_instance(hass, {"archive_states": True})
+    instance.states_archive = StatesArchive(str(tmp_path))
+    now = dt_util.utcnow()
+    ten_days_ago = now - timedelta(days=10)
+    nine_days_ago = now - timedelta(days=9)
+    with freeze_time(ten_days_ago):
+        hass.states.async_set("sensor.test", "old")
+    await async_wait_recording_done(hass)
+    with freeze_time(nine_days_ago):
+        hass.states.async_set("sensor.test", "older_than_purge")
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.test", "new")
+    await async_wait_recording_done(hass)
+
+    assert await instance.async_add_executor_job(
+        purge_old_data, instance, now - timedelta(days=4), False
+    )
+    # The finished purge compacted the segments of the purged days
+    assert os.listdir(tmp_path / "sensor.test")
+    assert all(name.count(".") == 1 for name in os.listdir(tmp_path / "sensor.test"))
+
+    states = await instance.async_add_executor_job(
+        get_significant_states, hass, now - timedelta(days=11), None, ["sensor.test"]
+    )
+    assert [state.state for state in states["sensor.test"]] == [
+        "old",
+        "older_than_purge",
+        "new",
+    ]
+    assert states["sensor.test"][0].attributes == {}
+
+    # The state at the start time comes from the archive
+    states = await instance.async_add_executor_job(
+        get_significant_states,
+        hass,
+        nine_days_ago - timedelta(hours=1),
+        None,
+        ["sensor.test"],
+        None,
+        True,
+        True,
+        True,
+        False,
+        True,
+    )
+    assert states["sensor.test"][2]["s"] == "new"
+    assert states["sensor.test"][:2] == [
+        {
+            "s": "old",
+            "a": {},
+            "lu": (nine_days_ago - timedelta(hours=1)).timestamp(),
+        },
+        {"s": "older_than_purge", "lu": round(nine_days_ago.timestamp(), 3)},
+    ]
+
+    states = await instance.async_add_executor_job(
+        state_changes_during_period,
+        hass,
+        now - timedelta(days=11),
+        None,
+        "sensor.test",
+        False,
+        True,
+        2,
+    )
+    # Like the database, a limit keeps the oldest states
+    assert [state.state for state in states["sensor.test"]] == [
+        "older_than_purge",
+        "old",
+    ]
+
+
+async def test_purge_archives_attribute_changes(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test archived attribute changes are filtered like in the database."""
+    instance = await async_setup_recorder_instance(hass, {"archive_states": True})
+    instance.states_archive = StatesArchive(str(tmp_path))
+    now = dt_util.utcnow()
+    start = now - timedelta(days=11)
+    for days, state, attributes in (
+        (10, "on", {"brightness": 1}),
+        (9.5, "on", {"brightness": 2}),
+        (9, "off", {}),
+    ):
+        with freeze_time(now - timedelta(days=days)):
+            hass.states.async_set("climate.test", state, attributes)
+            hass.states.async_set("sensor.test", state, attributes)
+        await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.test", "new")
+    hass.states.async_set("climate.test", "new")
+    await async_wait_recording_done(hass)
+
+    def _history() -> list[list[tuple[str, float]]]:
+        return [
+            # The archive keeps millisecond precision
+            [(state.state, round(state.last_updated_timestamp, 3)) for state in states]
+            for states in (
+                get_significant_states(hass, start, None, ["sensor.test"])[
+                    "sensor.test"
+                ],
+                get_significant_states(
+                    hass, start, None, ["sensor.test"], None, True, False
+                )["sensor.test"],
+                get_significant_states(hass, start, None, ["climate.test"])[
+                    "climate.test"
+                ],
+                state_changes_during_period(hass, start, None, "climate.test")[
+                    "climate.test"
+                ],
+                state_changes_during_period(
+                    hass, start, None, "sensor.test", False, True, 2
+                )["sensor.test"],
+            )
+        ]
+
+    history = await instance.async_add_executor_job(_history)
+    assert [len(states) for states in history] == [3, 4, 4, 3, 2]
+
+    assert await instance.async_add_executor_job(
+        purge_old_data, instance, now - timedelta(days=4), False
+    )
+    assert await instance.async_add_executor_job(_history) == history
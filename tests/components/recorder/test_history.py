@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from copy import copy
 from datetime import datetime, timedelta
+from functools import partial
 import json
 from unittest.mock import patch, sentinel
 
@@ -1199,3 +1201,69 @@ def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty(
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     hass = hass_recorder()
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+@pytest.mark.parametrize(
+    ("include_start_time_state", "limit", "descending"),
+    [(True, None, False), (False, 2, True), (False, None, False)],
+)
+async def test_async_state_changes_during_period_batched(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    include_start_time_state: bool,
+    limit: int | None,
+    descending: bool,
+) -> None:
+    """Test concurrent requests are batched and match the per entity results."""
+    instance = await async_setup_recorder_instance(hass, {})
+    entity_ids = [f"sensor.test_{index}" for index in range(5)]
+    start = dt_util.utcnow()
+    with freeze_time(start) as freezer:
+        for value in range(4):
+            for entity_id in entity_ids:
+                hass.states.async_set(entity_id, str(value), {"value": value})
+            freezer.tick(timedelta(seconds=1))
+            await async_wait_recording_done(hass)
+
+    start_times = {
+        entity_id: start
+        + timedelta(seconds=0.5 if include_start_time_state else index % 3 + 0.5)
+        for index, entity_id in enumerate(entity_ids)
+    }
+    start_times["sensor.unknown"] = start_times["sensor.test_0"]
+    requests = [*entity_ids, "sensor.test_0", "sensor.unknown"]
+    results = await asyncio.gather(
+        *(
+            history.async_state_changes_during_period(
+                hass,
+                start_times[entity_id],
+                entity_id=entity_id,
+                descending=descending,
+                limit=limit,
+                include_start_time_state=include_start_time_state,
+            )
+            for entity_id in requests
+        )
+    )
+
+    batcher = hass.data[history.batch.DATA_STATE_CHANGES_BATCHER]
+    assert batcher.requests == len(requests)
+    # sensor.test_0 is requested twice and needs a second query
+    assert batcher.queries == 2
+    for entity_id, states in zip(requests, results, strict=True):
+        expected = await instance.async_add_executor_job(
+            partial(
+                history.state_changes_during_period,
+                hass,
+                start_times[entity_id],
+                entity_id=entity_id,
+                descending=descending,
+                limit=limit,
+                include_start_time_state=include_start_time_state,
+            )
+        )
+        assert_multiple_states_equal_without_context(
+            states, expected.get(entity_id, [])
+        )
+    assert len(results[0]) == (limit or (4 if include_start_time_state else 3))
+    assert results[-1] == []
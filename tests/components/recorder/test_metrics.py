@@ -0,0 +1,92 @@
+"""Test the recorder write path metrics."""
+
+from unittest.mock import Mock
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.metrics import WriteMetrics
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.setup import async_setup_component
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator, WebSocketGenerator
+
+
+def test_write_metrics() -> None:
+    """Test rows, durations and latencies are recorded per commit."""
+    metrics = WriteMetrics()
+    assert metrics.latency_percentile(0.95) is None
+
+    metrics.event_processed(0)
+    metrics.event_processed(1e12)
+    metrics.committed(
+        [Mock(__tablename__="states"), Mock(__tablename__="states")], 0.002, 0.001
+    )
+    metrics.committed([Mock(__tablename__="events")], 0.001, 0.003)
+    metrics.task_finished("PurgeTask", 0.5)
+    metrics.task_finished("PurgeTask", 1.5)
+
+    info = metrics.as_dict()
+    assert info["commits"] == 2
+    assert info["rows_written"] == {"states": 2, "events": 1}
+    assert info["last_commit_rows"] == {"events": 1}
+    assert info["last_flush_duration"] == 1.0
+    assert info["last_commit_duration"] == 3.0
+    assert info["mean_commit_duration"] == 2.0
+    assert info["max_commit_duration"] == 4.0
+    # One event fired in the future and one very long ago
+    assert info["event_to_commit_latency"]["counts"] == [1, *[0] * 9, 1]
+    assert info["event_to_commit_latency"]["p50"] == 10
+    assert info["event_to_commit_latency"]["p95"] is None
+    assert info["tasks"] == {"PurgeTask": {"count": 2, "mean": 1000.0, "max": 1500.0}}
+
+
+async def test_write_metrics_info(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test the metrics are available via recorder/info."""
+    await async_setup_recorder_instance(hass, {recorder.CONF_COMMIT_INTERVAL: 0})
+    hass.states.async_set("sensor.test", "1", {"unit": "W"})
+    hass.states.async_set("sensor.test", "2", {"unit": "W"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id({"type": "recorder/info"})
+    response = await client.receive_json()
+    assert response["success"]
+    write_metrics = response["result"]["write_metrics"]
+    assert write_metrics["commits"] >= 2
+    assert write_metrics["rows_written"]["states"] >= 2
+    assert write_metrics["rows_written"]["state_attributes"] >= 1
+    assert sum(write_metrics["event_to_commit_latency"]["counts"]) >= 2
+    assert write_metrics["tasks"]["WaitTask"]["count"] >= 1
+    assert write_metrics["caches"]["state_attributes"]["hits"] >= 1
+    assert set(write_metrics["caches"]) == {
+        "event_data",
+        "event_types",
+        "state_attributes",
+        "states_meta",
+    }
+
+
+async def test_metrics_sensors(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the metrics sensors."""
+    await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0, recorder.CONF_METRICS_SENSORS: True}
+    )
+    assert await async_setup_component(hass, "sensor", {})
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+
+    await async_update_entity(hass, "sensor.recorder_rows_written")
+    assert int(hass.states.get("sensor.recorder_rows_written").state) >= 1
+    await async_update_entity(hass, "sensor.recorder_commit_duration")
+    commit_duration = hass.states.get("sensor.recorder_commit_duration")
+    assert float(commit_duration.state) >= 0
+    assert commit_duration.attributes["unit_of_measurement"] == "ms"
@@ -0,0 +1,178 @@
+"""Test partitioning of the short term statistics table."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from homeassistant.components.recorder import migration
+from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.partition import (
+    convert_to_partitioned,
+    drop_partitions_before,
+    partition_name,
+    partition_range,
+    partition_starts,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+def _executed(session: MagicMock) -> list[str]:
+    """Return the SQL statements executed in a mocked session."""
+    return [str(call.args[0]) for call in session.execute.mock_calls if call.args]
+
+
+def test_partition_naming() -> None:
+    """Test partitions are named after the day they start."""
+    start = datetime(2024, 3, 9, tzinfo=dt_util.UTC)
+    assert partition_name(start) == "statistics_short_term_p20240309"
+    assert partition_range("statistics_short_term_p20240309") == (
+        start,
+        start + timedelta(days=1),
+    )
+    assert partition_range("statistics_short_term_default") is None
+    assert partition_range("statistics_short_term_pnotadate") is None
+
+
+def test_partition_starts() -> None:
+    """Test the partitions needed to cover a time range."""
+    assert partition_starts(
+        datetime(2024, 3, 9, 23, 55, tzinfo=dt_util.UTC),
+        datetime(2024, 3, 11, 0, 5, tzinfo=dt_util.UTC),
+    ) == [
+        datetime(2024, 3, 9, tzinfo=dt_util.UTC),
+        datetime(2024, 3, 10, tzinfo=dt_util.UTC),
+        datetime(2024, 3, 11, tzinfo=dt_util.UTC),
+    ]
+
+
+def test_drop_partitions_before() -> None:
+    """Test only partitions entirely before purge_before are dropped."""
+    session = MagicMock()
+    session.execute.return_value.all.return_value = [
+        ("statistics_short_term_p20240309",),
+        ("statistics_short_term_default",),
+        ("statistics_short_term_p20240308",),
+        ("statistics_short_term_p20240310",),
+    ]
+    assert (
+        drop_partitions_before(session, datetime(2024, 3, 10, 12, tzinfo=dt_util.UTC))
+        == 2
+    )
+    drops = [sql for sql in _executed(session) if sql.startswith("DROP")]
+    assert drops == [
+        "DROP TABLE statistics_short_term_p20240308",
+        "DROP TABLE statistics_short_term_p20240309",
+    ]
+
+
+def test_convert_to_partitioned() -> None:
+    """Test converting the table copies the rows into a partitioned table."""
+    session = MagicMock()
+    oldest = datetime(2024, 3, 1, 10, tzinfo=dt_util.UTC)
+    session.execute.return_value.one.return_value = (
+        oldest.timestamp(),
+        oldest.timestamp() + 3600,
+    )
+    session.execute.return_value.all.return_value = []
+    with patch(
+        "homeassistant.components.recorder.partition.dt_util.utcnow",
+        return_value=datetime(2024, 3, 2, 10, tzinfo=dt_util.UTC),
+    ):
+        convert_to_partitioned(session)
+
+    executed = _executed(session)
+    assert executed[1] == (
+        "ALTER TABLE statistics_short_term RENAME TO "
+        "statistics_short_term_unpartitioned"
+    )
+    assert (
+        "CREATE TABLE statistics_short_term (LIKE statistics_short_term_unpartitioned)"
+        " PARTITION BY RANGE (start_ts)"
+    ) in executed
+    assert "ALTER TABLE statistics_short_term ADD PRIMARY KEY (id, start_ts)" in (
+        executed
+    )
+    created = [sql.split()[5] for sql in executed if "FOR VALUES FROM" in sql]
+    assert created == [
+        "statistics_short_term_p20240301",
+        "statistics_short_term_p20240302",
+        "statistics_short_term_p20240303",
+        "statistics_short_term_p20240304",
+        "statistics_short_term_p20240305",
+    ]
+    # Rows are only copied once all partitions exist
+    assert executed[-3].startswith("INSERT INTO statistics_short_term SELECT")
+    assert executed[-1] == "DROP TABLE statistics_short_term_unpartitioned"
+
+
+async def test_partitioning_ignored_without_postgresql(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the option is ignored when not using PostgreSQL."""
+    with patch.object(migration, "partition_short_term_statistics") as partition:
+        instance = await async_setup_recorder_instance(
+            hass, {"partitioned_short_term_statistics": True}
+        )
+        await async_wait_recording_done(hass)
+
+    assert "only supported with PostgreSQL" in caplog.text
+    assert instance.partitioned_short_term_statistics is False
+    partition.assert_not_called()
+
+
+async def test_purge_drops_partitions(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+) -> None:
+    """Test purge drops partitions on PostgreSQL."""
+    instance = await async_setup_recorder_instance(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with patch(
+        "homeassistant.components.recorder.purge.drop_partitions_before",
+        return_value=0,
+    ) as drop_partitions:
+        purge_old_data(instance, purge_before, repack=False)
+        drop_partitions.assert_not_called()
+
+        with patch.object(instance, "partitioned_short_term_statistics", True), patch(
+            "homeassistant.components.recorder.core.Recorder.dialect_name",
+            SupportedDialect.POSTGRESQL,
+        ):
+            purge_old_data(instance, purge_before, repack=False)
+        assert drop_partitions.call_args[0][1] == purge_before
+
+
+async def test_partition_short_term_statistics(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+) -> None:
+    """Test the table is converted once and partitions are created ahead."""
+    instance = await async_setup_recorder_instance(hass)
+
+    with patch(
+        "homeassistant.components.recorder.core.Recorder.dialect_name",
+        SupportedDialect.POSTGRESQL,
+    ), patch.object(
+        migration, "is_partitioned", side_effect=[False, True]
+    ), patch.object(migration, "convert_to_partitioned") as convert, patch.object(
+        migration, "create_partitions"
+    ) as create_partitions:
+        assert migration.partition_short_term_statistics(instance)
+        assert convert.call_count == 1
+        assert create_partitions.call_count == 0
+
+        assert migration.partition_short_term_statistics(instance)
+        assert convert.call_count == 1
+        assert create_partitions.call_count == 1
+        _, first, last = create_partitions.call_args[0]
+        assert last - first == timedelta(days=3)
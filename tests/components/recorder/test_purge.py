@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta
 import json
 import sqlite3
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -23,7 +24,12 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    DEFAULT_EVENTS_BATCHES_PER_PURGE,
+    DEFAULT_STATES_BATCHES_PER_PURGE,
+    PurgeProgress,
+    purge_old_data,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -44,7 +50,7 @@ from .common import (
     convert_pending_states_to_meta,
 )
 
-from tests.typing import RecorderInstanceGenerator
+from tests.typing import RecorderInstanceGenerator, WebSocketGenerator
 
 TEST_EVENT_TYPES = (
     "EVENT_TEST_AUTOPURGE",
@@ -1986,3 +1992,156 @@ async def test_purge_entities_keep_days(
     )
     assert len(states["sensor.keep"]) == 2
     assert "sensor.purge" not in states
+
+
+async def test_adaptive_purge(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test adaptive purge reports its progress and clears its cursor."""
+    instance = await async_setup_recorder_instance(hass, {"adaptive_purge": True})
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+
+    await hass.services.async_call(recorder.DOMAIN, SERVICE_PURGE, {"keep_days": 4})
+    await hass.async_block_till_done()
+    await async_recorder_block_till_done(hass)
+    await async_wait_purge_done(hass)
+    await hass.async_block_till_done()
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+        events = session.query(Events).filter(
+            Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+        )
+        assert events.count() == 2
+
+    progress = instance.purge_progress
+    assert progress is not None
+    assert progress.running is False
+    assert progress.rows_purged == 8
+    assert progress.cycles >= 1
+    assert hass_storage["recorder.purge_cursor"]["data"] == {}
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id({"type": "recorder/info"})
+    response = await client.receive_json()
+    assert response["success"]
+    purge_progress = response["result"]["purge_progress"]
+    assert purge_progress["running"] is False
+    assert purge_progress["rows_purged"] == 8
+    assert purge_progress["estimated_rows_remaining"] == 0
+
+
+async def test_adaptive_purge_yields_to_backlog(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+) -> None:
+    """Test adaptive purge stops a cycle early when writes are pending."""
+    instance = await async_setup_recorder_instance(hass, {"adaptive_purge": True})
+    for _ in range(3):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    progress = PurgeProgress()
+    with patch.object(instance, "max_bind_vars", 2), patch.object(
+        instance.database_engine, "max_bind_vars", 2
+    ), patch(
+        "homeassistant.components.recorder.purge.ADAPTIVE_PURGE_YIELD_BACKLOG", 0
+    ), session_scope(hass=hass) as session:
+        states = session.query(States)
+        assert states.count() == 18
+
+        finished = purge_old_data(
+            instance,
+            dt_util.utcnow() - timedelta(days=4),
+            repack=False,
+            progress=progress,
+        )
+        assert not finished
+        # Only one batch of states and one batch of
+        # events ran before yielding to the queue
+        assert states.count() == 16
+        assert progress.rows_purged == 2
+
+
+async def test_adaptive_purge_resumes_after_restart(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test an interrupted adaptive purge is resumed at startup."""
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    hass_storage["recorder.purge_cursor"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "recorder.purge_cursor",
+        "data": {
+            "purge_before": purge_before.isoformat(),
+            "repack": False,
+            "apply_filter": False,
+        },
+    }
+    with patch(
+        "homeassistant.components.recorder.core.Recorder._async_resume_purge"
+    ) as resume_purge:
+        instance = await async_setup_recorder_instance(hass, {"adaptive_purge": True})
+    await _add_test_states(hass)
+    resume_purge.assert_called_once()
+
+    await instance._async_resume_purge()
+    await async_recorder_block_till_done(hass)
+    await async_wait_purge_done(hass)
+    await hass.async_block_till_done()
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+    assert instance.purge_progress.purge_before == purge_before
+    assert instance.purge_progress.running is False
+    assert hass_storage["recorder.purge_cursor"]["data"] == {}
+
+
+def test_purge_progress_batch_sizing() -> None:
+    """Test adaptive purge batches follow the measured delete latency."""
+    progress = PurgeProgress()
+    progress.start(datetime(2024, 1, 2, tzinfo=dt_util.UTC), None)
+
+    # Fast deletes grow the batches, at most doubling per cycle
+    progress.add_batch(100)
+    progress.finish_cycle(0.01, None, False)
+    assert progress.states_batch_size == DEFAULT_STATES_BATCHES_PER_PURGE * 2
+    assert progress.events_batch_size == DEFAULT_EVENTS_BATCHES_PER_PURGE * 2
+
+    # Slow deletes shrink them, at most halving per cycle
+    progress.add_batch(100)
+    progress.finish_cycle(100, None, False)
+    assert progress.states_batch_size == DEFAULT_STATES_BATCHES_PER_PURGE
+    assert progress.events_batch_size == DEFAULT_EVENTS_BATCHES_PER_PURGE
+
+    assert progress.rows_purged == 200
+    assert progress.rows_per_second == pytest.approx(200 / 100.01)
+
+
+def test_purge_progress_estimates_remaining() -> None:
+    """Test the remaining work is estimated from the oldest state."""
+    purge_before = datetime(2024, 1, 11, tzinfo=dt_util.UTC)
+    start_ts = datetime(2024, 1, 1, tzinfo=dt_util.UTC).timestamp()
+    progress = PurgeProgress()
+    progress.start(purge_before, start_ts)
+    assert progress.as_dict()["estimated_rows_remaining"] is None
+
+    progress.add_batch(1000)
+    progress.finish_cycle(2.0, start_ts + 2 * 86400, False)
+    info = progress.as_dict()
+    assert info["running"] is True
+    assert progress.fraction_done == pytest.approx(0.2)
+    assert info["estimated_rows_remaining"] == 4000
+    assert info["estimated_seconds_remaining"] == pytest.approx(8.0)
+    assert info["rows_per_second"] == pytest.approx(500)
+
+    progress.finish_cycle(2.0, None, True)
+    info = progress.as_dict()
+    assert info["running"] is False
+    assert info["estimated_rows_remaining"] == 0
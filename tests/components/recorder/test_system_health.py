@@ -33,6 +33,9 @@ async def test_recorder_system_health(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "mean_commit_duration": ANY,
+        "mean_flush_duration": ANY,
+        "event_to_commit_latency_p95": ANY,
     }
 
 
@@ -59,6 +62,9 @@ async def test_recorder_system_health_alternate_dbms(
         "estimated_db_size": "1.00 MiB",
         "database_engine": dialect_name.value,
         "database_version": ANY,
+        "mean_commit_duration": ANY,
+        "mean_flush_duration": ANY,
+        "event_to_commit_latency_p95": ANY,
     }
 
 
@@ -90,6 +96,9 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": dialect_name.value,
         "database_version": ANY,
+        "mean_commit_duration": ANY,
+        "mean_flush_duration": ANY,
+        "event_to_commit_latency_p95": ANY,
     }
 
 
@@ -116,4 +125,7 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "mean_commit_duration": ANY,
+        "mean_flush_duration": ANY,
+        "event_to_commit_latency_p95": ANY,
     }
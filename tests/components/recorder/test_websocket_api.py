@@ -2090,8 +2090,10 @@ async def test_recorder_info(
         "max_backlog": 65000,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "purge_progress": None,
         "recording": True,
         "thread_running": True,
+        "write_metrics": ANY,
     }
 
 
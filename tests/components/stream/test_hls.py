@@ -192,6 +192,13 @@ async def test_hls_stream(
         "start_worker": 1,
         "video_codec": "h264",
         "worker_error": 1,
+        "keyframe_decode_pool": {
+            "max_jobs": 2,
+            "jobs": 0,
+            "queued": 0,
+            "max_queued": 0,
+            "max_wait": 0,
+        },
     }
 
 
@@ -578,3 +585,29 @@ async def test_hls_stream_rotate(
 
     # Stop stream, if it hasn't quit already
     await stream.stop()
+
+
+async def test_segment_data_assembled_once(hass: HomeAssistant) -> None:
+    """Test the data of a complete segment is assembled once."""
+    segment = Segment(sequence=0)
+    payloads = [b"part-0", b"part-one", b"part-2"]
+    for payload in payloads[:-1]:
+        segment.async_add_part(
+            Part(duration=1, has_keyframe=False, data=payload), duration=0
+        )
+    assert segment.data_size == 14
+    assert segment.get_data() == b"part-0part-one"
+    assert segment.parts[0].data is payloads[0]
+
+    segment.async_add_part(
+        Part(duration=1, has_keyframe=False, data=payloads[-1]), duration=3
+    )
+    assert segment.data_size == 20
+    data = segment.get_data()
+    assert data == b"".join(payloads)
+    assert segment.get_data() is data
+    # The parts are views of the segment data
+    for part, payload in zip(segment.parts, payloads, strict=True):
+        assert isinstance(part.data, memoryview)
+        assert part.data.obj is data
+        assert part.data == payload
@@ -963,6 +963,13 @@ async def test_h265_video_is_hvc1(hass: HomeAssistant, worker_finished_stream) -
         "start_worker": 1,
         "video_codec": "hevc",
         "worker_error": 1,
+        "keyframe_decode_pool": {
+            "max_jobs": 2,
+            "jobs": 0,
+            "queued": 0,
+            "max_queued": 0,
+            "max_wait": 0,
+        },
     }
 
 
@@ -1058,3 +1065,62 @@ async def test_get_image_rotated(hass: HomeAssistant, h264_video, filename) -> N
                 0
             ][0]
         ).all()
+
+
+async def test_get_image_sizes(hass: HomeAssistant, h264_video) -> None:
+    """Test a keyframe is decoded once and encoded once per size."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    # Since libjpeg-turbo is not installed on the CI runner, we use a mock
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        settings = dynamic_stream_settings()
+        keyframe_converter = KeyFrameConverter(
+            hass, hass.data[DOMAIN][ATTR_SETTINGS], settings
+        )
+    stream = create_stream(hass, h264_video, {}, settings)
+    stream.add_provider(HLS_PROVIDER)
+    with pytest.raises(StreamEndedError):
+        await hass.async_add_executor_job(
+            stream_worker,
+            h264_video,
+            {},
+            hass.data[DOMAIN][ATTR_SETTINGS],
+            StreamState(hass, stream.outputs, stream._diagnostics),
+            keyframe_converter,
+            threading.Event(),
+        )
+
+    encode = mock_turbo_jpeg_singleton.instance.return_value.encode
+    requests = [(None, None), (32, 24), (None, None), (32, 24), (16, 12)]
+    images = await asyncio.gather(
+        *(
+            keyframe_converter.async_get_image(width, height)
+            for width, height in requests
+        )
+    )
+    assert images == [EMPTY_8_6_JPEG] * len(requests)
+    assert [call.args[0].shape[:2] for call in encode.call_args_list] == [
+        (320, 480),
+        (24, 32),
+        (12, 16),
+    ]
+    # Only the encoded images are kept once all requests are done
+    assert keyframe_converter._frame is None
+
+    # The keyframe is decoded again for a size requested later
+    assert await keyframe_converter.async_get_image(8, 6) == EMPTY_8_6_JPEG
+    assert encode.call_args_list[-1].args[0].shape[:2] == (6, 8)
+    assert keyframe_converter._frame is None
+
+    # Images are encoded again when the orientation changes
+    settings.orientation = Orientation.ROTATE_RIGHT
+    await keyframe_converter.async_get_image(32, 24)
+    assert encode.call_count == 5
+
+    diagnostics = stream.get_diagnostics()["keyframe_decode_pool"]
+    assert diagnostics["jobs"] == 5
+    assert diagnostics["queued"] == 0
+    assert diagnostics["max_queued"] == 1
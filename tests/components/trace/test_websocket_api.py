@@ -588,6 +588,82 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize(
+    ("trace_config", "traced_runs"),
+    [
+        ({}, [0, 1, 2, 3]),
+        ({"mode": "full"}, [0, 1, 2, 3]),
+        ({"mode": "sampled", "sample_rate": 2}, [0, 2]),
+        ({"mode": "errors"}, [2]),
+        ({"mode": "off"}, []),
+    ],
+)
+async def test_trace_modes(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    trace_config: dict[str, Any],
+    traced_runs: list[int],
+) -> None:
+    """Test which runs are traced in each trace mode."""
+    trace_uuids = []
+
+    def mock_random_uuid_hex():
+        trace_uuids.append(random_uuid_hex())
+        return trace_uuids[-1]
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [
+            {
+                "if": {
+                    "condition": "template",
+                    "value_template": "{{ trigger.event.data.fail }}",
+                },
+                "then": {"stop": "Failed", "error": True},
+            },
+            {"event": "some_event"},
+        ],
+        "trace": trace_config,
+    }
+    await _setup_automation_or_script(hass, "automation", [sun_config])
+
+    with patch(
+        "homeassistant.components.trace.models.uuid_util.random_uuid_hex",
+        wraps=mock_random_uuid_hex,
+    ):
+        for fail in (False, False, True, False):
+            hass.bus.async_fire("test_event", {"fail": fail})
+            await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {"type": "trace/list", "domain": "automation", "item_id": "sun"}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    traces = response["result"]
+    assert [trace["run_id"] for trace in traces] == [
+        trace_uuids[run] for run in traced_runs
+    ]
+    assert [trace["script_execution"] for trace in traces] == [
+        "aborted" if run == 2 else "finished" for run in traced_runs
+    ]
+
+    for trace in traces:
+        await client.send_json_auto_id(
+            {
+                "type": "trace/get",
+                "domain": "automation",
+                "item_id": "sun",
+                "run_id": trace["run_id"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert set(response["result"]["trace"]) >= {"trigger/0", "action/0"}
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
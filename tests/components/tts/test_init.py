@@ -1,10 +1,12 @@
 """The tests for the TTS component."""
 
 import asyncio
+from collections.abc import AsyncGenerator, AsyncIterable
 from http import HTTPStatus
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+from aiohttp import ClientPayloadError
 from freezegun.api import FrozenDateTimeFactory
 import pytest
 
@@ -37,7 +39,7 @@ from .common import (
     retrieve_media,
 )
 
-from tests.common import async_mock_service, mock_restore_cache
+from tests.common import async_fire_time_changed, async_mock_service, mock_restore_cache
 from tests.typing import ClientSessionGenerator, WebSocketGenerator
 
 ORIG_WRITE_TAGS = tts.SpeechManager.write_tags
@@ -1240,6 +1242,226 @@ async def test_load_cache_retrieve_without_mem_cache(
     assert await req.read() == tts_data
 
 
+class MockProviderMessage(MockProvider):
+    """Mock provider returning the message as audio."""
+
+    def get_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> tts.TtsAudioType:
+        """Load TTS dat."""
+        return ("mp3", message.encode())
+
+
+@pytest.mark.parametrize("mock_provider", [MockProviderMessage(DEFAULT_LANG)])
+async def test_cache_removes_least_recently_used(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    mock_provider: MockProvider,
+    mock_tts_cache_dir,
+    tts_mutagen_mock,
+) -> None:
+    """Test the least recently used files are removed when the cache is full."""
+    await mock_setup(hass, mock_provider)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    manager.cache_max_size = 20
+
+    for message in ("message 1", "message 2", "message 1", "message 3"):
+        assert await manager.async_get_tts_audio(TEST_DOMAIN, message) == (
+            "mp3",
+            message.encode(),
+        )
+        await hass.async_block_till_done()
+
+    cache_files = sorted(
+        path.read_bytes() for path in mock_tts_cache_dir.iterdir() if path.is_file()
+    )
+    assert cache_files == [b"message 1", b"message 3"]
+    assert manager.file_cache_size == 18
+
+    freezer.tick(tts.STORAGE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    index = hass_storage[tts.STORAGE_KEY]["data"]
+    assert index["cache_dir"] == str(mock_tts_cache_dir)
+    assert [
+        (mock_tts_cache_dir / filename).read_bytes()
+        for _, filename, _ in index["files"]
+    ] == [b"message 1", b"message 3"]
+
+
+@pytest.mark.parametrize("mock_provider", [MockProviderBoom(DEFAULT_LANG)])
+async def test_cache_index_loaded(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_provider: MockProvider,
+    mock_tts_cache_dir,
+    mock_tts_get_cache_files: MagicMock,
+) -> None:
+    """Test the files of the cache are read from the index on startup."""
+    cache_key = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_test"
+    gone_key = "8a6ea7a0e0f7c2dcbe1f4e1f0d6d95ab0df8d3f4_en-us_-_test"
+    (mock_tts_cache_dir / f"{cache_key}.mp3").write_bytes(b"door")
+    hass_storage[tts.STORAGE_KEY] = {
+        "version": tts.STORAGE_VERSION,
+        "minor_version": 1,
+        "key": tts.STORAGE_KEY,
+        "data": {
+            "cache_dir": str(mock_tts_cache_dir),
+            "files": [
+                [gone_key, f"{gone_key}.mp3", 100],
+                [cache_key, f"{cache_key}.mp3", 4],
+            ],
+        },
+    }
+
+    await mock_setup(hass, mock_provider)
+    mock_tts_get_cache_files.assert_not_called()
+
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    assert manager.file_cache_size == 104
+    assert await manager.async_get_tts_audio(
+        TEST_DOMAIN, "There is someone at the door."
+    ) == ("mp3", b"door")
+
+    # Entries whose file is gone are dropped once they fail to load
+    with pytest.raises(HomeAssistantError):
+        await manager._async_file_to_mem(gone_key)
+    assert list(manager.file_cache) == [cache_key]
+    assert manager.file_cache_size == 4
+
+
+@pytest.mark.parametrize("mock_provider", [MockProviderMessage(DEFAULT_LANG)])
+async def test_cache_index_saved_with_file(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_provider: MockProvider,
+    mock_tts_cache_dir,
+    tts_mutagen_mock,
+) -> None:
+    """Test a file is added to the saved index without the save delay."""
+    await mock_setup(hass, mock_provider)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+
+    assert await manager.async_get_tts_audio(TEST_DOMAIN, "message") == (
+        "mp3",
+        b"message",
+    )
+    await hass.async_block_till_done()
+    index = hass_storage[tts.STORAGE_KEY]["data"]
+    assert [
+        (mock_tts_cache_dir / filename).read_bytes()
+        for _, filename, _ in index["files"]
+    ] == [b"message"]
+
+
+class MockStreamingEntity(MockTTSEntity):
+    """Mock entity streaming its audio."""
+
+    def __init__(self, lang: str, error_after: int | None = None) -> None:
+        """Initialize the entity."""
+        super().__init__(lang)
+        self.release = asyncio.Event()
+        self.error_after = error_after
+
+    async def async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> tuple[str, AsyncIterable[bytes]] | None:
+        """Stream the message as audio."""
+
+        async def chunks() -> AsyncGenerator[bytes, None]:
+            if self.error_after == 0:
+                raise HomeAssistantError("Boom")
+            yield b"first "
+            await self.release.wait()
+            if self.error_after == 1:
+                raise HomeAssistantError("Boom")
+            yield message.encode()
+
+        return ("mp3", chunks())
+
+
+@pytest.mark.parametrize("mock_tts_entity", [MockStreamingEntity(DEFAULT_LANG)])
+async def test_web_stream_audio(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    mock_tts_entity: MockStreamingEntity,
+    mock_tts_cache_dir,
+    tts_mutagen_mock,
+) -> None:
+    """Test the audio is sent while it is generated and cached after."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    client = await hass_client()
+
+    path = await manager.async_get_url_path("tts.test", "message")
+    req = await client.get(path)
+    assert req.status == HTTPStatus.OK
+    assert req.content_type == "audio/mpeg"
+    assert await req.content.readany() == b"first "
+
+    mock_tts_entity.release.set()
+    assert await req.read() == b"message"
+    await hass.async_block_till_done()
+
+    assert not manager.audio_streams
+    filename = path.rsplit("/", 1)[1]
+    assert (mock_tts_cache_dir / filename).read_bytes() == b"first message"
+
+    # Audio which was generated is read from the memory cache
+    req = await client.get(path)
+    assert await req.read() == b"first message"
+
+
+@pytest.mark.parametrize(
+    "mock_tts_entity", [MockStreamingEntity(DEFAULT_LANG, error_after=1)]
+)
+async def test_web_stream_audio_error(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    mock_tts_entity: MockStreamingEntity,
+    mock_tts_cache_dir,
+    tts_mutagen_mock,
+) -> None:
+    """Test the connection is closed when the audio fails after the first chunk."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    client = await hass_client()
+
+    path = await manager.async_get_url_path("tts.test", "message")
+    req = await client.get(path)
+    assert req.status == HTTPStatus.OK
+    assert await req.content.readany() == b"first "
+
+    mock_tts_entity.release.set()
+    with pytest.raises(ClientPayloadError):
+        await req.read()
+    await hass.async_block_till_done()
+
+    # Truncated audio is not cached
+    assert not manager.mem_cache
+    assert not manager.file_cache
+    assert not any(mock_tts_cache_dir.iterdir())
+
+
+@pytest.mark.parametrize(
+    "mock_tts_entity", [MockStreamingEntity(DEFAULT_LANG, error_after=0)]
+)
+async def test_web_stream_audio_error_first_chunk(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    mock_tts_entity: MockStreamingEntity,
+) -> None:
+    """Test the audio is not found when it fails before the first chunk."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    client = await hass_client()
+
+    path = await manager.async_get_url_path("tts.test", "message")
+    req = await client.get(path)
+    assert req.status == HTTPStatus.NOT_FOUND
+
+
 @pytest.mark.parametrize(
     ("setup", "data", "expected_url_suffix"),
     [
@@ -46,6 +46,20 @@ async def test_pending_msg_overflow(
     assert msg.type == WSMsgType.CLOSED
 
 
+async def test_pending_bytes_overflow(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test pending bytes overflows."""
+    with patch("homeassistant.components.websocket_api.http.MAX_PENDING_BYTES", 1):
+        for idx in range(10):
+            await websocket_client.send_json({"id": idx + 1, "type": "ping"})
+        msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.CLOSED
+    assert "Reached 1 pending bytes" in caplog.text
+
+
 async def test_cleanup_on_cancellation(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -432,6 +446,44 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_flush_delay_and_metrics(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test messages are coalesced during the flush delay and measured."""
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_COALESCE_MESSAGES: 1,
+                const.FEATURE_FLUSH_DELAY: 50,
+            },
+        }
+    )
+    assert (await websocket_client.receive_json())["success"]
+
+    for id_ in range(2, 7):
+        await websocket_client.send_json({"id": id_, "type": "ping"})
+    frame = await websocket_client.receive()
+    assert frame.type == WSMsgType.TEXT
+    assert [msg["id"] for msg in frame.json()] == [2, 3, 4, 5, 6]
+
+    await websocket_client.send_json({"id": 7, "type": "connection_metrics"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    (metrics,) = msg["result"]
+    assert metrics["messages"] == 6
+    assert metrics["frames"] == 2
+    assert metrics["max_frame_messages"] == 5
+    assert metrics["bytes"] > 0
+    assert metrics["queued_messages"] == 0
+    assert metrics["queued_bytes"] == 0
+    assert metrics["max_queued_bytes"] > 0
+    assert metrics["blocked"] >= 0
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1,6 +1,6 @@
 """Test the condition helper."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, time as dt_time, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
@@ -267,11 +267,19 @@ async def test_and_condition_with_template(hass: HomeAssistant) -> None:
 
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
+    # The numeric state condition is cheaper and evaluated first
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -309,11 +317,19 @@ async def test_and_condition_shorthand(hass: HomeAssistant) -> None:
 
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
+    # The numeric state condition is cheaper and evaluated first
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -351,11 +367,19 @@ async def test_and_condition_list_shorthand(hass: HomeAssistant) -> None:
 
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
+    # The numeric state condition is cheaper and evaluated first
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -367,6 +391,62 @@ async def test_and_condition_list_shorthand(hass: HomeAssistant) -> None:
     assert test(hass)
 
 
+async def test_condition_evaluation_order(hass: HomeAssistant) -> None:
+    """Test cheap conditions are evaluated first keeping their trace paths."""
+    config = {
+        "condition": "or",
+        "conditions": [
+            {"condition": "time", "after": "00:00:00"},
+            {
+                "condition": "template",
+                "value_template": "{{ is_state('sensor.temperature', '100') }}",
+            },
+            {"condition": "state", "entity_id": "sensor.temperature", "state": "100"},
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 100)
+    assert test(hass)
+    assert_condition_trace(
+        {
+            "": [{"result": {"result": True}}],
+            "conditions/2": [{"result": {"result": True}}],
+            "conditions/2/entity_id/0": [
+                {"result": {"result": True, "state": "100", "wanted_state": "100"}}
+            ],
+        }
+    )
+
+    hass.states.async_set("sensor.temperature", 120)
+    assert test(hass)
+    assert list(trace.trace_get(clear=False)) == [
+        "",
+        "conditions/2",
+        "conditions/2/entity_id/0",
+        "conditions/1",
+        "conditions/0",
+    ]
+
+    config = {
+        "condition": "and",
+        "conditions": [
+            {"condition": "state", "entity_id": "sensor.missing", "state": "100"},
+            {"condition": "trigger", "id": "event"},
+            {"condition": "state", "entity_id": "sensor.missing_2", "state": "100"},
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    with pytest.raises(ConditionError) as err:
+        test(hass, {"trigger": {"id": "event"}})
+    assert [error.index for error in err.value.errors] == [0, 2]
+
+
 async def test_malformed_and_condition_list_shorthand(hass: HomeAssistant) -> None:
     """Test the 'and' condition list shorthand syntax check."""
     config = {
@@ -879,6 +959,47 @@ async def test_time_window(hass: HomeAssistant) -> None:
         assert test2(hass)
 
 
+async def test_time_cached_within_second(hass: HomeAssistant) -> None:
+    """Test the result of a time condition is reused within the same second."""
+    config = {"condition": "time", "after": "06:00:00", "before": "18:00:00"}
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    now = dt_util.now().replace(hour=9, minute=0, second=0, microsecond=0)
+    with patch(
+        "homeassistant.helpers.condition.time", wraps=condition.time
+    ) as time_mock:
+        for microsecond in (0, 500000, 999999):
+            with patch(
+                "homeassistant.helpers.condition.dt_util.now",
+                return_value=now.replace(microsecond=microsecond),
+            ):
+                assert test(hass)
+            assert_condition_trace(
+                {
+                    "": [
+                        {
+                            "result": {
+                                "after": dt_time(6),
+                                "before": dt_time(18),
+                                "now_time": dt_time(9),
+                                "result": True,
+                            }
+                        }
+                    ]
+                }
+            )
+        assert time_mock.call_count == 1
+
+        with patch(
+            "homeassistant.helpers.condition.dt_util.now",
+            return_value=now.replace(hour=18),
+        ):
+            assert not test(hass)
+        assert time_mock.call_count == 2
+
+
 async def test_time_using_input_datetime(hass: HomeAssistant) -> None:
     """Test time conditions using input_datetime entities."""
     await async_setup_component(
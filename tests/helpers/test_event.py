@@ -4,6 +4,8 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+from functools import partial
+import time
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -24,6 +26,8 @@ from homeassistant.helpers.event import (
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
+    _async_loop_timer_wheel,
+    _async_timer_wheel,
     async_call_later,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
@@ -4805,3 +4809,91 @@ async def test_async_track_device_registry_updated_event_with_a_callback_that_th
     unsub2()
 
     assert event_data[0] == {"action": "create", "device_id": device_id}
+
+
+async def test_timer_wheel(hass: HomeAssistant) -> None:
+    """Test the timer wheel runs the entries in order on one loop timer."""
+    wheel = _async_timer_wheel(hass)
+    # Whole seconds since the fired times have a microsecond resolution
+    start = float(int(time.time()) + 1)
+    runs: list[float] = []
+    offsets = [0.5, 1.25, 30, 59.9, 61, 125.5, 3600, 7200.25]
+    entries = {
+        offset: wheel.async_schedule(start + offset, partial(runs.append, offset))
+        for offset in reversed(offsets)
+    }
+
+    def wheel_timers() -> int:
+        return sum(
+            1
+            for handle in hass.loop._scheduled
+            if not handle.cancelled() and handle._callback == wheel._async_fire
+        )
+
+    assert len(wheel) == 8
+    assert wheel_timers() == 1
+
+    entries[30].async_cancel()
+    entries[3600].async_cancel()
+    entries[3600].async_cancel()
+    assert len(wheel) == 6
+
+    async_fire_time_changed_exact(hass, dt_util.utc_from_timestamp(start + 1.25))
+    assert runs == [0.5, 1.25]
+
+    # An entry scheduled before the armed one moves the loop timer
+    wheel.async_schedule(start + 10, partial(runs.append, 10))
+    assert wheel_timers() == 1
+    async_fire_time_changed_exact(hass, dt_util.utc_from_timestamp(start + 61))
+    assert runs == [0.5, 1.25, 10, 59.9, 61]
+
+    async_fire_time_changed_exact(hass, dt_util.utc_from_timestamp(start + 7200.25))
+    assert runs == [0.5, 1.25, 10, 59.9, 61, 125.5, 7200.25]
+    assert len(wheel) == 0
+    assert wheel_timers() == 0
+
+
+async def test_time_trackers_share_timer(hass: HomeAssistant) -> None:
+    """Test time change trackers and same state trackers share a loop timer each.
+
+    Same state trackers wait for a relative period, they are scheduled on
+    the loop clock.
+    """
+    unsubs = [
+        async_track_utc_time_change(
+            hass, callback(lambda x: None), minute=minute, second=second
+        )
+        for minute in range(60)
+        for second in range(0, 60, 10)
+    ]
+    start = hass.loop.time()
+    unsubs.extend(
+        async_track_same_state(
+            hass,
+            timedelta(seconds=seconds),
+            callback(lambda: None),
+            callback(lambda _, _from, _to: True),
+        )
+        for seconds in range(1, 300)
+    )
+    wheel = _async_timer_wheel(hass)
+    loop_wheel = _async_loop_timer_wheel(hass)
+    assert len(wheel) == 360
+    assert len(loop_wheel) == 299
+    timers = [
+        handle
+        for handle in hass.loop._scheduled
+        if not handle.cancelled() and handle._callback.__name__ == "_async_fire"
+    ]
+    assert len(timers) == 2
+    loop_timer = next(
+        handle for handle in timers if handle._callback.__self__ is loop_wheel
+    )
+    assert start + 1 <= loop_timer.when() < hass.loop.time() + 1
+
+    for unsub in unsubs:
+        unsub()
+    assert len(wheel) == 0
+    assert len(loop_wheel) == 0
+    assert all(handle.cancelled() for handle in timers)
+
@@ -7,6 +7,7 @@ from functools import reduce
 import logging
 import operator
 from types import MappingProxyType
+from typing import Any
 from unittest import mock
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
@@ -280,6 +281,73 @@ async def test_calling_service_basic(
     )
 
 
+@pytest.mark.parametrize(
+    ("step", "prepared_runs"),
+    [
+        (
+            {
+                "service": "test.script",
+                "target": {"entity_id": "light.hallway, light.stairs"},
+                "data": {"brightness": 255},
+            },
+            1,
+        ),
+        (
+            {
+                "service": "test.script",
+                "target": {"entity_id": "light.hallway"},
+                "data": {"brightness": "{{ 255 }}"},
+            },
+            3,
+        ),
+        (
+            {
+                "service": "test.script",
+                "target": {"entity_id": "0123456789abcdef0123456789abcdef"},
+            },
+            3,
+        ),
+    ],
+)
+async def test_calling_service_prepared_once(
+    hass: HomeAssistant, step: dict[str, Any], prepared_runs: int
+) -> None:
+    """Test service calls without templates are only prepared once."""
+    calls = async_mock_service(hass, "test", "script")
+    script_obj = script.Script(
+        hass, cv.SCRIPT_SCHEMA([step]), "Test Name", "test_domain"
+    )
+
+    prepared_params = []
+
+    def mock_prepare_call(*args: Any) -> dict[str, Any]:
+        prepared_params.append(
+            {
+                "domain": "test",
+                "service": "script",
+                "service_data": {"brightness": 255},
+                "target": {"entity_id": ["light.hallway"]},
+            }
+        )
+        return prepared_params[-1]
+
+    with patch(
+        "homeassistant.helpers.script.service.async_prepare_call_from_config",
+        side_effect=mock_prepare_call,
+    ):
+        for _ in range(3):
+            await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    assert len(prepared_params) == prepared_runs
+    assert len(calls) == 3
+    if prepared_runs == 1:
+        # The prepared parameters are not changed by the calls
+        assert prepared_params[0]["service_data"] == {"brightness": 255}
+    for call in calls:
+        assert call.data == {"brightness": 255, "entity_id": ["light.hallway"]}
+
+
 async def test_calling_service_template(hass: HomeAssistant) -> None:
     """Test the calling of a service."""
     context = Context()
@@ -0,0 +1,64 @@
+"""Test the numeric ring buffer."""
+
+import pytest
+
+from homeassistant.util.ring_buffer import NumericRingBuffer
+
+
+def test_bounded() -> None:
+    """Test a full buffer drops the oldest entries."""
+    buffer = NumericRingBuffer(maxlen=3)
+    assert not buffer
+    for value in range(5):
+        buffer.append(value, value * 10)
+
+    assert len(buffer) == 3
+    assert list(buffer.timestamps()) == [2, 3, 4]
+    assert list(buffer.values()) == [20, 30, 40]
+    assert buffer[0] == (2, 20)
+    assert buffer[-1] == (4, 40)
+    with pytest.raises(IndexError):
+        buffer[3]
+    assert buffer.median() == 30
+
+    buffer.clear()
+    assert not buffer
+    buffer.append(5, 50)
+    assert buffer[-1] == (5, 50)
+
+
+def test_zero_length() -> None:
+    """Test a buffer without room ignores appended values."""
+    buffer = NumericRingBuffer(maxlen=0)
+    buffer.append(1, 1)
+    assert not buffer
+
+
+def test_unbounded_remove_before() -> None:
+    """Test an unbounded buffer grows and keeps the entry applying at a time."""
+    buffer = NumericRingBuffer()
+    for value in range(20):
+        buffer.append(value, value)
+    assert len(buffer) == 20
+
+    buffer.remove_before(10.5)
+    assert list(buffer.timestamps()) == list(range(10, 20))
+
+    buffer.remove_before(100)
+    assert list(buffer.values()) == [19]
+
+
+def test_time_weighted_mean() -> None:
+    """Test the time weighted mean of the values in a window."""
+    buffer = NumericRingBuffer()
+    buffer.append(0, 10)
+    buffer.append(10, 20)
+    buffer.append(15, 40)
+
+    # 10 applies from 5 to 10, 20 from 10 to 15 and 40 from 15 to 20
+    assert buffer.time_weighted_mean(5, 20) == pytest.approx(
+        (5 * 10 + 5 * 20 + 5 * 40) / 15
+    )
+    # Before the first value the first value or initial applies
+    assert buffer.time_weighted_mean(-10, 10) == pytest.approx(10)
+    assert buffer.time_weighted_mean(-10, 10, initial=0) == pytest.approx(5)